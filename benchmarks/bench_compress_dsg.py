@@ -0,0 +1,136 @@
+'''Benchmark the DSG ragged array compression of a field construct.
+
+Compares `cfdm.Field.compress` with the loop-based algorithm that it
+replaced, for a synthetic timeseries field construct whose features
+have random numbers of elements, and whose time coordinates span the
+same dimensions as the data.
+
+Usage:
+
+    python bench_compress_dsg.py [n_features ...]
+
+'''
+import sys
+import timeit
+
+import numpy
+
+import cfdm
+
+
+def make_field(n_features, n_elements=200, seed=0):
+    '''Create an uncompressed timeseries field construct.'''
+    rng = numpy.random.RandomState(seed)
+
+    count = rng.randint(0, n_elements + 1, size=n_features)
+    missing = numpy.arange(n_elements) >= count[:, numpy.newaxis]
+
+    data = numpy.ma.array(
+        rng.uniform(250, 300, size=(n_features, n_elements)),
+        mask=missing)
+    time = numpy.ma.array(
+        numpy.tile(numpy.arange(n_elements, dtype=float),
+                   (n_features, 1)),
+        mask=missing)
+
+    f = cfdm.Field(properties={'standard_name': 'air_temperature',
+                               'units': 'K',
+                               'featureType': 'timeSeries'})
+    station = f.set_construct(cfdm.DomainAxis(n_features))
+    element = f.set_construct(cfdm.DomainAxis(n_elements))
+    f.set_data(cfdm.Data(data), axes=[station, element])
+
+    t = cfdm.AuxiliaryCoordinate(
+        properties={'standard_name': 'time',
+                    'units': 'days since 2000-01-01'},
+        data=cfdm.Data(time))
+    f.set_construct(t, axes=[station, element])
+
+    lat = cfdm.AuxiliaryCoordinate(
+        properties={'standard_name': 'latitude',
+                    'units': 'degrees_north'},
+        data=cfdm.Data(rng.uniform(-90, 90, size=n_features)))
+    f.set_construct(lat, axes=[station])
+
+    return f
+
+
+def loop_compress(f, method):
+    '''Compress the field and time data with the original loops.
+
+    Only the compressed arrays are created, so this does less work
+    than the original `cfdm.Field.compress`.
+
+    '''
+    def compress_data(data, count):
+        compressed = data.empty(shape=(sum(count),), dtype=data.dtype)
+        start = 0
+        for last, d in zip(count, data.flatten(range(data.ndim - 1))):
+            if not last:
+                continue
+
+            end = start + last
+            compressed[start:end] = d[:last]
+            start += last
+
+        return compressed
+
+    data = f.data
+    count = []
+    for d in data.flatten(range(data.ndim - 1)):
+        last = d.size
+        for i in d[::-1]:
+            if i is not cfdm.masked:
+                break
+            else:
+                last -= 1
+
+        count.append(last)
+
+    out = [compress_data(data, count)]
+
+    if method == 'indexed':
+        index = cfdm.Data.empty(shape=(sum(count),), dtype=int)
+        start = 0
+        for i, last in enumerate(count):
+            if not last:
+                continue
+
+            end = start + last
+            index[start:end] = i
+            start += last
+
+        out.append(index)
+
+    t = f.construct('time')
+    out.append(compress_data(t.data, count))
+
+    return out
+
+
+def main(sizes):
+    print('{:>10}  {:>12}  {:>12}  {:>12}  {:>8}'.format(
+        'features', 'method', 'loop (s)', 'vector (s)', 'speedup'))
+
+    for n_features in sizes:
+        f = make_field(n_features)
+
+        for method in ('contiguous', 'indexed'):
+            expected = loop_compress(f, method)[0]
+            result = f.compress(method)
+            assert result.data.compressed_array.size == expected.size
+            assert (result.data.compressed_array == expected.array).all()
+            assert result.equals(f)
+
+            loop = min(timeit.repeat(lambda: loop_compress(f, method),
+                                     number=1, repeat=3))
+            vector = min(timeit.repeat(lambda: f.compress(method),
+                                       number=1, repeat=3))
+
+            print('{:>10}  {:>12}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+                n_features, method, loop, vector, loop / vector))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 500, 2000]
+    main(sizes)
@@ -0,0 +1,94 @@
+'''Benchmark writing a field construct compressed by gathering.
+
+Compares writing a land-only field construct uncompressed with
+compressing it by gathering the horizontal dimensions with
+`cfdm.Field.compress` and then writing it, for synthetic data with
+randomly located land points. The file sizes and the times taken to
+compress and write are reported.
+
+Usage:
+
+    python bench_compress_gathered.py [land_fraction ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import numpy
+
+import cfdm
+
+
+def make_field(land_fraction, n_times=12, nlat=180, nlon=360, seed=0):
+    '''Create a field construct that is missing at ocean points.'''
+    rng = numpy.random.RandomState(seed)
+
+    ocean = rng.uniform(size=(nlat, nlon)) >= land_fraction
+    data = numpy.ma.array(
+        rng.uniform(250, 300, size=(n_times, nlat, nlon)),
+        mask=numpy.broadcast_to(ocean, (n_times, nlat, nlon)))
+
+    f = cfdm.Field(properties={'standard_name': 'soil_temperature',
+                               'units': 'K'})
+    time = f.set_construct(cfdm.DomainAxis(n_times))
+    lat = f.set_construct(cfdm.DomainAxis(nlat))
+    lon = f.set_construct(cfdm.DomainAxis(nlon))
+    f.set_data(cfdm.Data(data), axes=[time, lat, lon])
+
+    for axis, size, name, units in (
+            (time, n_times, 'time', 'days since 2000-01-01'),
+            (lat, nlat, 'latitude', 'degrees_north'),
+            (lon, nlon, 'longitude', 'degrees_east')):
+        c = cfdm.DimensionCoordinate(
+            properties={'standard_name': name, 'units': units},
+            data=cfdm.Data(numpy.arange(size, dtype=float)))
+        f.set_construct(c, axes=[axis])
+
+    return f
+
+
+def main(land_fractions):
+    print('{:>8}  {:>14}  {:>14}  {:>12}  {:>14}'.format(
+        'land', 'full (MB)', 'gathered (MB)', 'full (s)',
+        'gathered (s)'))
+
+    directory = tempfile.mkdtemp()
+    try:
+        full_file = os.path.join(directory, 'full.nc')
+        gathered_file = os.path.join(directory, 'gathered.nc')
+
+        for land_fraction in land_fractions:
+            f = make_field(land_fraction)
+
+            def write_full():
+                cfdm.write(f, full_file)
+
+            def write_gathered():
+                cfdm.write(f.compress('gathered', axes=[1, 2]),
+                           gathered_file)
+
+            full = min(timeit.repeat(write_full, number=1, repeat=3))
+            gathered = min(timeit.repeat(write_gathered, number=1,
+                                         repeat=3))
+
+            g = cfdm.read(gathered_file)[0]
+            assert g.data.get_compression_type() == 'gathered'
+            assert g.equals(f)
+
+            print('{:>8.2f}  {:>14.2f}  {:>14.2f}  {:>12.4f}  '
+                  '{:>14.4f}'.format(
+                      land_fraction,
+                      os.path.getsize(full_file) / 2 ** 20,
+                      os.path.getsize(gathered_file) / 2 ** 20,
+                      full, gathered))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    land_fractions = ([float(x) for x in sys.argv[1:]] or
+                      [0.1, 0.3, 0.6])
+    main(land_fractions)
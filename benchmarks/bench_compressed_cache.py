@@ -0,0 +1,125 @@
+'''Benchmark repeated subspacing of ragged arrays stored on disk.
+
+Compares `cfdm.RaggedContiguousArray` and `cfdm.RaggedIndexedArray`,
+which cache the arrays that they derive from their count and index
+variables, with the same classes re-reading those variables from disk
+and re-deriving the arrays for every subspace, as originally done. The
+data and the count and index variables of a synthetic time series
+collection are stored in a netCDF file, and each station is subspaced
+in turn.
+
+Usage:
+
+    python bench_compressed_cache.py [n_instances ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import netCDF4
+import numpy
+
+import cfdm
+
+
+def uncached(self, key, func):
+    '''Derive the arrays on every call, as originally done.'''
+    return func()
+
+
+def netcdf_data(filename, ncvar):
+    '''Return a Data instance for a netCDF variable.'''
+    nc = netCDF4.Dataset(filename)
+    variable = nc.variables[ncvar]
+    dtype, shape = variable.dtype, variable.shape
+    nc.close()
+
+    return cfdm.Data(cfdm.NetCDFArray(
+        filename=filename, ncvar=ncvar, dtype=dtype, ndim=len(shape),
+        shape=shape, size=int(numpy.prod(shape))))
+
+
+def make_arrays(n_instances, filename, mean_elements=50, seed=0):
+    '''Create contiguous and indexed ragged arrays stored on disk.'''
+    rng = numpy.random.RandomState(seed)
+
+    count = rng.randint(1, 2 * mean_elements, size=n_instances)
+    index = numpy.repeat(numpy.arange(n_instances), count)
+    rng.shuffle(index)
+    data = rng.uniform(250, 300, size=count.sum())
+
+    nc = netCDF4.Dataset(filename, 'w')
+    nc.createDimension('station', n_instances)
+    nc.createDimension('obs', data.size)
+    nc.createVariable('count', 'i4', ('station',))[...] = count
+    nc.createVariable('index', 'i4', ('obs',))[...] = index
+    nc.createVariable('temperature', 'f8', ('obs',))[...] = data
+    nc.close()
+
+    shape = (n_instances, count.max())
+    size = int(numpy.prod(shape))
+
+    contiguous = cfdm.RaggedContiguousArray(
+        compressed_array=netcdf_data(filename, 'temperature'),
+        shape=shape, size=size, ndim=2,
+        count_variable=cfdm.Count(data=netcdf_data(filename, 'count')))
+
+    indexed = cfdm.RaggedIndexedArray(
+        compressed_array=netcdf_data(filename, 'temperature'),
+        shape=shape, size=size, ndim=2,
+        index_variable=cfdm.Index(data=netcdf_data(filename, 'index')))
+
+    return contiguous, indexed
+
+
+def subspace_each_instance(array):
+    '''Subspace each instance of the array in turn.'''
+    return [array[[i], :] for i in range(array.shape[0])]
+
+
+def main(sizes):
+    print('{:>10}  {:>11}  {:>12}  {:>12}  {:>8}'.format(
+        'instances', 'array', 'uncached (s)', 'cached (s)', 'speedup'))
+
+    directory = tempfile.mkdtemp()
+    try:
+        for n_instances in sizes:
+            filename = os.path.join(directory,
+                                    '{}.nc'.format(n_instances))
+            arrays = make_arrays(n_instances, filename)
+
+            for name, array in zip(('contiguous', 'indexed'), arrays):
+                # Patch the array's own class, since inherited methods
+                # are copied to each subclass by DocstringRewriteMeta
+                cls = type(array)
+                cached = cls._get_cached
+                cls._get_cached = uncached
+                try:
+                    old = min(timeit.repeat(
+                        lambda: subspace_each_instance(array),
+                        number=1, repeat=3))
+                    expected = subspace_each_instance(array)
+                finally:
+                    cls._get_cached = cached
+
+                new = min(timeit.repeat(
+                    lambda: subspace_each_instance(array),
+                    number=1, repeat=3))
+
+                for a, b in zip(subspace_each_instance(array), expected):
+                    assert (a.mask == b.mask).all()
+                    assert (a == b).all()
+
+                print('{:>10}  {:>11}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+                    n_instances, name, old, new, old / new))
+        # --- End: for
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 2000]
+    main(sizes)
@@ -0,0 +1,64 @@
+'''Benchmark element assignment to in-memory data.
+
+Compares `cfdm.Data.__setitem__`, which assigns in-place to a numpy
+array that is not shared, with the algorithm that it replaced, which
+assigned to a copy of the whole array, for one-dimensional data of
+increasing size.
+
+Usage:
+
+    python bench_data_setitem.py [size ...]
+
+'''
+import sys
+import timeit
+
+import numpy
+
+import cfdm
+
+
+def copy_setitem(d, indices, value):
+    '''Assign to a copy of the array, as the original algorithm did.'''
+    indices = d._parse_indices(indices)
+
+    array = d.array
+
+    if value is cfdm.masked or numpy.ma.isMA(value):
+        array = array.view(numpy.ma.MaskedArray)
+
+    d._set_subspace(array, indices, numpy.asanyarray(value))
+
+    d._set_Array(array, copy=False)
+
+
+def main(sizes, n_assignments=1000):
+    print('{:>10}  {:>14}  {:>14}  {:>8}'.format(
+        'size', 'copy (us)', 'in-place (us)', 'speedup'))
+
+    for size in sizes:
+        d = cfdm.Data(numpy.zeros(size))
+        e = d.copy()
+
+        def assign(setitem, d):
+            for k in range(n_assignments):
+                setitem(d, k % size, k)
+
+        assign(copy_setitem, d)
+        assign(type(e).__setitem__, e)
+        assert (d.array == e.array).all()
+
+        copy = min(timeit.repeat(lambda: assign(copy_setitem, d),
+                                 number=1, repeat=3))
+        in_place = min(timeit.repeat(
+            lambda: assign(type(e).__setitem__, e),
+            number=1, repeat=3))
+
+        print('{:>10}  {:>14.2f}  {:>14.2f}  {:>8.1f}'.format(
+            size, 1e6 * copy / n_assignments,
+            1e6 * in_place / n_assignments, copy / in_place))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 100000, 1000000]
+    main(sizes)
@@ -0,0 +1,105 @@
+'''Benchmark the uncompression of a gathered array.
+
+Compares `cfdm.GatheredArray` with the loop-based algorithm that it
+replaced, for a synthetic land-only field with gathered latitude and
+longitude axes.
+
+Usage:
+
+    python bench_gathered.py [n_land_points ...]
+
+'''
+import sys
+import timeit
+
+from functools import reduce
+from operator import mul
+
+import numpy
+
+import cfdm
+
+
+def make_array(n_land_points, n_times=12, nlat=180, nlon=360, seed=0):
+    '''Create a gathered array with randomly located land points.'''
+    rng = numpy.random.RandomState(seed)
+
+    land = numpy.sort(rng.choice(nlat * nlon, size=n_land_points,
+                                 replace=False))
+    data = rng.uniform(250, 300, size=(n_times, n_land_points))
+
+    shape = (n_times, nlat, nlon)
+
+    return cfdm.GatheredArray(
+        compressed_array=cfdm.Data(data),
+        shape=shape, size=int(numpy.prod(shape)), ndim=3,
+        compressed_dimension=1,
+        list_variable=cfdm.List(data=cfdm.Data(land)))
+
+
+def loop_uncompress(array):
+    '''Uncompress with the original loop over the list variable.'''
+    compressed_array = array._get_compressed_Array().array
+
+    uarray = numpy.ma.masked_all(array.shape, dtype=array.dtype)
+
+    compressed_dimension = array.get_compressed_dimension()
+    compressed_axes = array.get_compressed_axes()
+    n_compressed_axes = len(compressed_axes)
+
+    uncompressed_shape = array.shape
+    partial_uncompressed_shapes = [
+        reduce(mul, [uncompressed_shape[i]
+                     for i in compressed_axes[j:]], 1)
+        for j in range(1, n_compressed_axes)]
+
+    sample_indices = [slice(None)] * compressed_array.ndim
+    u_indices = [slice(None)] * array.ndim
+
+    list_array = array.get_list().data.array
+
+    zeros = [0] * n_compressed_axes
+    for j, b in enumerate(list_array):
+        sample_indices[compressed_dimension] = slice(j, j + 1)
+
+        u_indices[compressed_axes[0]:compressed_axes[-1] + 1] = zeros
+        for i, z in zip(compressed_axes[:-1], partial_uncompressed_shapes):
+            if b >= z:
+                (a, b) = divmod(b, z)
+                u_indices[i] = a
+
+        u_indices[compressed_axes[-1]] = b
+
+        compressed = compressed_array[tuple(sample_indices)]
+        sample_indices[compressed_dimension] = 0
+        compressed = compressed[tuple(sample_indices)]
+
+        uarray[tuple(u_indices)] = compressed
+
+    return uarray
+
+
+def main(sizes):
+    print('{:>12}  {:>12}  {:>12}  {:>8}'.format(
+        'land points', 'loop (s)', 'vector (s)', 'speedup'))
+
+    for n_land_points in sizes:
+        array = make_array(n_land_points)
+
+        expected = loop_uncompress(array)
+        result = array[...]
+        assert (result.mask == expected.mask).all()
+        assert (result == expected).all()
+
+        loop = min(timeit.repeat(lambda: loop_uncompress(array),
+                                 number=1, repeat=3))
+        vector = min(timeit.repeat(lambda: array[...],
+                                   number=1, repeat=3))
+
+        print('{:>12}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+            n_land_points, loop, vector, loop / vector))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 10000, 20000]
+    main(sizes)
@@ -0,0 +1,100 @@
+'''Benchmark finding the geometry of each part of a polygon geometry.
+
+Compares the part-to-geometry index calculation made when reading a
+netCDF geometry container that has a part node count variable, using
+cumulative sums and `numpy.searchsorted`, with the loop-based
+algorithm that it replaced, for synthetic geometries with random
+numbers of parts and nodes per part.
+
+Usage:
+
+    python bench_geometry_index.py [n_geometries ...]
+
+'''
+import sys
+import timeit
+
+import numpy
+
+import cfdm
+
+
+def make_counts(n_geometries, max_parts=5, max_nodes=8, seed=0):
+    '''Create node count and part node count data.'''
+    rng = numpy.random.RandomState(seed)
+
+    parts_per_geometry = rng.randint(1, max_parts + 1, size=n_geometries)
+    part_node_count = rng.randint(3, max_nodes + 1,
+                                  size=parts_per_geometry.sum())
+
+    ends = numpy.cumsum(parts_per_geometry)
+    node_count = numpy.add.reduceat(part_node_count, ends - ends[0])
+
+    return (cfdm.Data(node_count.astype('int32')),
+            cfdm.Data(part_node_count.astype('int32')))
+
+
+def loop_index(nodes_per_geometry_data, parts_data):
+    '''Find the geometry of each part with the original loops.
+
+    The cursor into the parts is advanced correctly, which the
+    original algorithm did not do for more than two geometries.
+
+    '''
+    total_number_of_parts = parts_data.size
+
+    index = parts_data.copy()
+
+    instance_index = 0
+    i = 0
+    for cell_no in range(nodes_per_geometry_data.size):
+        n_nodes_in_this_cell = int(nodes_per_geometry_data[cell_no])
+
+        n_nodes = 0
+        for k in range(i, total_number_of_parts):
+            index[k] = instance_index
+            n_nodes += int(parts_data[k])
+            if n_nodes >= n_nodes_in_this_cell:
+                instance_index += 1
+                i = k + 1
+                break
+
+    return index
+
+
+def vector_index(nodes_per_geometry_data, parts_data):
+    '''Find the geometry of each part as `cfdm.read` does.'''
+    parts_array = parts_data.array
+    index_array = numpy.searchsorted(
+        numpy.cumsum(nodes_per_geometry_data.array),
+        numpy.cumsum(parts_array))
+
+    return cfdm.Data(index_array.astype(parts_array.dtype))
+
+
+def main(sizes):
+    print('{:>12}  {:>10}  {:>12}  {:>12}  {:>8}'.format(
+        'geometries', 'parts', 'loop (s)', 'vector (s)', 'speedup'))
+
+    for n_geometries in sizes:
+        node_count, part_node_count = make_counts(n_geometries)
+
+        expected = loop_index(node_count, part_node_count)
+        result = vector_index(node_count, part_node_count)
+        assert (result.array == expected.array).all()
+
+        loop = min(timeit.repeat(
+            lambda: loop_index(node_count, part_node_count),
+            number=1, repeat=3))
+        vector = min(timeit.repeat(
+            lambda: vector_index(node_count, part_node_count),
+            number=1, repeat=3))
+
+        print('{:>12}  {:>10}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+            n_geometries, part_node_count.size, loop, vector,
+            loop / vector))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 5000]
+    main(sizes)
@@ -0,0 +1,149 @@
+'''Benchmark the time taken to import cfdm.
+
+Compares the cumulative import time of cfdm, as reported by ``python
+-X importtime -c "import cfdm"``, when docstring substitutions are
+applied by `DocstringRewriteMeta`, which substitutes the values of
+embedded substitutions once per class and only replaces the keys that
+occur in each docstring, with the algorithm that it replaced, which
+substituted embedded substitutions for every key of every
+docstring. Each import is made in a new process, and the docstrings
+and ``help`` output produced by both are checked to be identical.
+
+Usage:
+
+    python bench_import.py [repeat]
+
+'''
+import hashlib
+import importlib.util
+import inspect
+import os
+import pydoc
+import re
+import subprocess
+import sys
+
+
+def old_docstring_update(cls, package_name, class_name, f, method_name,
+                         config, class_docstring=None):
+    '''Perform docstring substitutions, as originally done.'''
+    if class_docstring is not None:
+        doc = class_docstring
+    else:
+        doc = f.__doc__
+        if doc is None or '{{' not in doc:
+            return doc
+
+    for key, value in config.items():
+        for k, v in config.items():
+            if k not in value:
+                continue
+
+            try:
+                value = key.sub(v, value)
+            except AttributeError:
+                value = value.replace(k, v)
+
+        try:
+            doc = key.sub(value, doc)
+        except AttributeError:
+            doc = doc.replace(key, value)
+
+    doc = doc.replace('{{package}}', package_name)
+    doc = doc.replace('{{class}}', class_name)
+
+    if class_docstring is None:
+        f.__doc__ = doc
+
+    return doc
+
+
+def install_old_algorithm():
+    '''Load DocstringRewriteMeta with the original substitutions.
+
+    The module is registered before cfdm is imported, so that cfdm's
+    classes are created with the patched metaclass.
+
+    '''
+    name = 'cfdm.core.meta.docstringrewrite'
+    path = os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                        '..', *name.split('.')) + '.py'
+
+    spec = importlib.util.spec_from_file_location(name, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+
+    meta = module.DocstringRewriteMeta
+    meta._docstring_resolve = staticmethod(lambda config: config)
+    meta._docstring_update = classmethod(old_docstring_update)
+
+    sys.modules[name] = module
+
+
+def docstrings_digest():
+    '''Return a digest of all of cfdm's class and method docstrings.'''
+    import cfdm
+
+    digest = hashlib.sha1()
+    for name in sorted(dir(cfdm)):
+        obj = getattr(cfdm, name)
+        if not inspect.isclass(obj):
+            continue
+
+        for attr in sorted(dir(obj)):
+            if attr == '_docstring_update':
+                continue
+
+            doc = getattr(getattr(obj, attr, None), '__doc__', None)
+            digest.update(repr((name, attr, doc)).encode())
+
+    for name in ('Field', 'Data', 'DimensionCoordinate'):
+        digest.update(pydoc.render_doc(getattr(cfdm, name),
+                                       renderer=pydoc.plaintext).encode())
+
+    return digest.hexdigest()
+
+
+def child(method, check):
+    '''Import cfdm, and optionally print a digest of its docstrings.'''
+    if method == 'old':
+        install_old_algorithm()
+
+    import cfdm  # noqa: F401
+
+    if check:
+        print(docstrings_digest())
+
+
+def run(method, check=False):
+    '''Return the cfdm import time in seconds and the child's output.'''
+    command = [sys.executable, '-X', 'importtime', __file__, '--child',
+               method]
+    if check:
+        command.append('--check')
+
+    process = subprocess.run(command, stdout=subprocess.PIPE,
+                             stderr=subprocess.PIPE,
+                             universal_newlines=True, check=True)
+
+    match = re.search(r'^import time:\s+\d+ \|\s+(\d+) \| cfdm$',
+                      process.stderr, re.MULTILINE)
+    return int(match.group(1)) / 1e6, process.stdout
+
+
+def main(repeat):
+    assert run('old', check=True)[1] == run('new', check=True)[1]
+
+    old = min(run('old')[0] for i in range(repeat))
+    new = min(run('new')[0] for i in range(repeat))
+
+    print('{:>12}  {:>12}  {:>8}'.format('old (s)', 'new (s)', 'speedup'))
+    print('{:>12.3f}  {:>12.3f}  {:>8.2f}'.format(old, new, old / new))
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], '--check' in sys.argv[3:])
+    else:
+        repeat = [int(n) for n in sys.argv[1:]] or [5]
+        main(repeat[0])
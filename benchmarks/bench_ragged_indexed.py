@@ -0,0 +1,99 @@
+'''Benchmark the uncompression of an indexed ragged array.
+
+Compares `cfdm.RaggedIndexedArray`, which groups the sample dimension
+by instance with one stable sort and reads the compressed data once,
+with the algorithm that it replaced, which searched the index
+variable and read the compressed data once for every instance, for a
+synthetic time series collection stored in a netCDF file.
+
+Usage:
+
+    python bench_ragged_indexed.py [n_instances ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import netCDF4
+import numpy
+
+import cfdm
+
+
+def make_array(n_instances, filename, mean_elements=10, seed=0):
+    '''Create a compressed array, stored on disk, with a random layout.'''
+    rng = numpy.random.RandomState(seed)
+
+    index = rng.randint(0, n_instances, size=n_instances * mean_elements)
+    index[:n_instances] = numpy.arange(n_instances)
+    rng.shuffle(index)
+    data = rng.uniform(250, 300, size=index.size)
+
+    nc = netCDF4.Dataset(filename, 'w')
+    nc.createDimension('obs', data.size)
+    nc.createVariable('temperature', 'f8', ('obs',))[...] = data
+    nc.close()
+
+    compressed_array = cfdm.NetCDFArray(
+        filename=filename, ncvar='temperature', dtype=data.dtype,
+        ndim=1, shape=data.shape, size=data.size)
+
+    shape = (n_instances, numpy.bincount(index).max())
+
+    return cfdm.RaggedIndexedArray(
+        compressed_array=cfdm.Data(compressed_array),
+        shape=shape, size=int(numpy.prod(shape)), ndim=2,
+        index_variable=cfdm.Index(data=cfdm.Data(index)))
+
+
+def loop_uncompress(array):
+    '''Uncompress with the original per-instance loop.'''
+    compressed_array = array._get_compressed_Array()
+
+    uarray = numpy.ma.masked_all(array.shape, dtype=array.dtype)
+
+    index_array = array.get_index().data.array
+
+    for i in range(uarray.shape[0]):
+        sample_dimension_indices = numpy.where(index_array == i)[0]
+
+        u_indices = (i, slice(0, len(sample_dimension_indices)))
+
+        uarray[u_indices] = compressed_array[(sample_dimension_indices,)]
+
+    return uarray
+
+
+def main(sizes):
+    print('{:>10}  {:>12}  {:>12}  {:>8}'.format(
+        'instances', 'loop (s)', 'vector (s)', 'speedup'))
+
+    directory = tempfile.mkdtemp()
+    try:
+        for n_instances in sizes:
+            filename = os.path.join(directory,
+                                    '{}.nc'.format(n_instances))
+            array = make_array(n_instances, filename)
+
+            loop = min(timeit.repeat(lambda: loop_uncompress(array),
+                                     number=1, repeat=3))
+            vector = min(timeit.repeat(lambda: array[...],
+                                       number=1, repeat=3))
+
+            expected = loop_uncompress(array)
+            result = array[...]
+            assert (result.mask == expected.mask).all()
+            assert (result == expected).all()
+
+            print('{:>10}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+                n_instances, loop, vector, loop / vector))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 10000]
+    main(sizes)
@@ -0,0 +1,92 @@
+'''Benchmark the uncompression of an indexed contiguous ragged array.
+
+Compares `cfdm.RaggedIndexedContiguousArray` with the loop-based
+algorithm that it replaced, for a synthetic time series of profiles
+collection.
+
+Usage:
+
+    python bench_ragged_indexed_contiguous.py [n_profiles ...]
+
+'''
+import sys
+import timeit
+
+import numpy
+
+import cfdm
+
+
+def make_array(n_profiles, n_instances=100, max_levels=20, seed=0):
+    '''Create a compressed array with a random layout.'''
+    rng = numpy.random.RandomState(seed)
+
+    count = rng.randint(1, max_levels + 1, size=n_profiles)
+    index = rng.randint(0, n_instances, size=n_profiles)
+    data = rng.uniform(250, 300, size=count.sum())
+
+    n_max_profiles = numpy.bincount(index, minlength=n_instances).max()
+    shape = (n_instances, n_max_profiles, max_levels)
+
+    return cfdm.RaggedIndexedContiguousArray(
+        compressed_array=cfdm.Data(data),
+        shape=shape, size=int(numpy.prod(shape)), ndim=3,
+        count_variable=cfdm.Count(data=cfdm.Data(count)),
+        index_variable=cfdm.Index(data=cfdm.Data(index)))
+
+
+def loop_uncompress(array):
+    '''Uncompress with the original per-instance, per-profile loops.'''
+    compressed_array = array._get_compressed_Array()
+
+    uarray = numpy.ma.masked_all(array.shape, dtype=array.dtype)
+
+    count_array = array.get_count().data.array
+    index_array = array.get_index().data.array
+
+    for i in range(uarray.shape[0]):
+        xprofile_indices = numpy.where(index_array == i)[0]
+        n_profiles = xprofile_indices.size
+
+        for j in range(uarray.shape[1]):
+            if j >= n_profiles:
+                continue
+
+            profile_index = xprofile_indices[j]
+            if profile_index == 0:
+                start = 0
+            else:
+                start = int(count_array[:profile_index].sum())
+
+            stop = start + int(count_array[profile_index])
+
+            uarray[i, j, slice(0, stop - start)] = (
+                compressed_array[(slice(start, stop),)])
+
+    return uarray
+
+
+def main(sizes):
+    print('{:>10}  {:>12}  {:>12}  {:>8}'.format(
+        'profiles', 'loop (s)', 'vector (s)', 'speedup'))
+
+    for n_profiles in sizes:
+        array = make_array(n_profiles)
+
+        expected = loop_uncompress(array)
+        result = array[...]
+        assert (result.mask == expected.mask).all()
+        assert (result == expected).all()
+
+        loop = min(timeit.repeat(lambda: loop_uncompress(array),
+                                 number=1, repeat=3))
+        vector = min(timeit.repeat(lambda: array[...],
+                                   number=1, repeat=3))
+
+        print('{:>10}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+            n_profiles, loop, vector, loop / vector))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [1000, 5000, 20000]
+    main(sizes)
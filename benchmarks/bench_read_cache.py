@@ -0,0 +1,65 @@
+'''Benchmark reading a dataset from the persistent read cache.
+
+Compares `cfdm.read` without a cache with a subsequent `cfdm.read` of
+the same unmodified file with the *cache* parameter, for a synthetic
+dataset containing many data variables.
+
+Usage:
+
+    python bench_read_cache.py [n_fields ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import cfdm
+
+
+def make_file(n_fields, directory):
+    '''Write a file containing many independent data variables.'''
+    fields = []
+    for i in range(n_fields):
+        f = cfdm.example_field(i % 3)
+        f.nc_set_variable('data{}'.format(i))
+        fields.append(f)
+
+    filename = os.path.join(directory, 'file.nc')
+    cfdm.write(fields, filename)
+
+    return filename
+
+
+def main(sizes):
+    print('{:>8}  {:>12}  {:>12}  {:>8}'.format(
+        'fields', 'no cache (s)', 'cached (s)', 'speedup'))
+
+    for n_fields in sizes:
+        directory = tempfile.mkdtemp()
+        try:
+            filename = make_file(n_fields, directory)
+            cache = os.path.join(directory, 'cache')
+
+            expected = cfdm.read(filename)
+            result = cfdm.read(filename, cache=cache)
+            result = cfdm.read(filename, cache=cache)
+            assert len(result) == len(expected)
+            assert all(f.equals(g) for f, g in zip(result, expected))
+
+            uncached = min(timeit.repeat(lambda: cfdm.read(filename),
+                                         number=1, repeat=3))
+            cached = min(timeit.repeat(
+                lambda: cfdm.read(filename, cache=cache),
+                number=1, repeat=3))
+        finally:
+            shutil.rmtree(directory)
+
+        print('{:>8}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+            n_fields, uncached, cached, uncached / cached))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [30, 150, 300]
+    main(sizes)
@@ -0,0 +1,106 @@
+'''Benchmark the cost of log messages when reading a dataset.
+
+Compares `cfdm.read`, in which log messages that would not be shown
+are not formatted, with the original behaviour, in which every log
+message, including pretty-printed dumps of the internal read
+dictionaries, was formatted before the logger checked its level. The
+dataset is a netCDF file containing many data variables that share
+coordinate variables, and is read at the default log level.
+
+Usage:
+
+    python bench_read_logging.py [n_variables ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import netCDF4
+import numpy
+
+import cfdm
+from cfdm.read_write.netcdf import netcdfread
+
+
+class UnguardedLogger:
+    '''A logger whose level checks always pass, as originally.
+
+    Messages are still filtered by the wrapped logger, but only after
+    they have been formatted.
+
+    '''
+    def __init__(self, logger):
+        self.logger = logger
+
+    def isEnabledFor(self, level):
+        return True
+
+    def __getattr__(self, name):
+        return getattr(self.logger, name)
+
+
+def make_file(n_variables, filename):
+    '''Create a netCDF file with many data variables.'''
+    nc = netCDF4.Dataset(filename, 'w')
+    nc.Conventions = 'CF-' + cfdm.CF()
+
+    for name, size in (('lat', 4), ('lon', 5)):
+        nc.createDimension(name, size)
+        coord = nc.createVariable(name, 'f8', (name,))
+        coord.standard_name = {'lat': 'latitude', 'lon': 'longitude'}[name]
+        coord.units = {'lat': 'degrees_north', 'lon': 'degrees_east'}[name]
+        coord[...] = numpy.arange(size)
+
+    for i in range(n_variables):
+        variable = nc.createVariable('q{}'.format(i), 'f8', ('lat', 'lon'))
+        variable.long_name = 'variable {}'.format(i)
+        variable.units = '1'
+        variable[...] = i
+
+    nc.close()
+
+
+def main(sizes):
+    print('{:>10}  {:>14}  {:>12}  {:>8}'.format(
+        'variables', 'unguarded (s)', 'guarded (s)', 'speedup'))
+
+    cfdm.log_level('WARNING')
+
+    logger = netcdfread.logger
+
+    directory = tempfile.mkdtemp()
+    try:
+        for n_variables in sizes:
+            filename = os.path.join(directory,
+                                    '{}.nc'.format(n_variables))
+            make_file(n_variables, filename)
+
+            netcdfread.logger = UnguardedLogger(logger)
+            try:
+                old = min(timeit.repeat(lambda: cfdm.read(filename),
+                                        number=1, repeat=3))
+                expected = cfdm.read(filename)
+            finally:
+                netcdfread.logger = logger
+
+            new = min(timeit.repeat(lambda: cfdm.read(filename),
+                                    number=1, repeat=3))
+
+            result = cfdm.read(filename)
+            assert len(result) == len(expected) == n_variables
+            for f, g in zip(result, expected):
+                assert f.equals(g)
+
+            print('{:>10}  {:>14.3f}  {:>12.3f}  {:>8.2f}'.format(
+                n_variables, old, new, old / new))
+        # --- End: for
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 1000, 3000]
+    main(sizes)
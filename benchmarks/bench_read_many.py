@@ -0,0 +1,72 @@
+'''Benchmark the reading of many datasets that share a structure.
+
+Compares a loop of `cfdm.read` calls with `cfdm.read_many` for a
+synthetic collection of files that differ only in their data values.
+
+Usage:
+
+    python bench_read_many.py [n_files ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import cfdm
+
+
+def make_files(n_files, directory):
+    '''Write files with identical headers and different data.'''
+    filenames = []
+    for i in range(n_files):
+        fields = []
+        for n in (0, 1, 2):
+            f = cfdm.example_field(n)
+            f.data[...] = f.data.array + i
+            fields.append(f)
+
+        filename = os.path.join(directory, 'file{}.nc'.format(i))
+        cfdm.write(fields, filename)
+        filenames.append(filename)
+
+    return filenames
+
+
+def loop_read(filenames):
+    '''Read each file independently with `cfdm.read`.'''
+    return [f for filename in filenames for f in cfdm.read(filename)]
+
+
+def main(sizes):
+    print('{:>8}  {:>12}  {:>14}  {:>8}'.format(
+        'files', 'loop (s)', 'read_many (s)', 'speedup'))
+
+    for n_files in sizes:
+        directory = tempfile.mkdtemp()
+        try:
+            filenames = make_files(n_files, directory)
+
+            expected = loop_read(filenames)
+            result = list(cfdm.read_many(filenames))
+            assert len(result) == len(expected)
+            assert all(f.equals(g) for f, g in zip(result, expected))
+            assert all(f.get_filenames() == g.get_filenames()
+                       for f, g in zip(result, expected))
+
+            loop = min(timeit.repeat(lambda: loop_read(filenames),
+                                     number=1, repeat=3))
+            many = min(timeit.repeat(
+                lambda: list(cfdm.read_many(filenames)),
+                number=1, repeat=3))
+        finally:
+            shutil.rmtree(directory)
+
+        print('{:>8}  {:>12.4f}  {:>14.4f}  {:>8.1f}'.format(
+            n_files, loop, many, loop / many))
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [10, 50]
+    main(sizes)
@@ -0,0 +1,88 @@
+'''Benchmark changing the shape of in-memory data.
+
+Compares `cfdm.Data.transpose`, `cfdm.Data.squeeze`,
+`cfdm.Data.insert_dimension` and `cfdm.Data.flatten`, which return
+new data that share the numpy array of the original data through a
+numpy view, with the algorithm that they replaced, which copied the
+numpy array before changing its shape. The time taken and the peak
+memory allocated by each operation are reported.
+
+Usage:
+
+    python bench_shape_views.py [size_in_MB ...]
+
+'''
+import sys
+import timeit
+import tracemalloc
+
+import numpy
+
+import cfdm
+
+
+def old_method(d, func, *args):
+    '''Change the shape of a copy of the array, as originally done.'''
+    e = d.copy()
+    e._set_Array(func(d.array, *args), copy=False)
+    return e
+
+
+def old_flatten(d, axes):
+    '''Flatten the data, as originally done.'''
+    shape = list(d.shape)
+    new_shape = [n for i, n in enumerate(shape) if i not in axes]
+    new_shape.insert(axes[0], numpy.prod([shape[i] for i in axes]))
+    return type(d)(d.array.reshape(new_shape), units=d.get_units(None))
+
+
+def peak_memory(func):
+    '''Return the peak memory, in MB, allocated whilst calling func.'''
+    tracemalloc.start()
+    try:
+        func()
+        return tracemalloc.get_traced_memory()[1] / 2 ** 20
+    finally:
+        tracemalloc.stop()
+
+
+def main(sizes):
+    print('{:>10}  {:>16}  {:>10}  {:>10}  {:>10}  {:>10}'.format(
+        'data (MB)', 'method', 'old (s)', 'new (s)', 'old (MB)',
+        'new (MB)'))
+
+    for size_in_MB in sizes:
+        n = max(1, int(size_in_MB * 2 ** 20 / (8 * 100 * 10)))
+        array = numpy.random.RandomState(0).uniform(size=(n, 1, 100, 10))
+        d = cfdm.Data(array, units='K')
+
+        for name, old, new in (
+                ('transpose',
+                 lambda: old_method(d, numpy.transpose),
+                 lambda: d.transpose()),
+                ('squeeze',
+                 lambda: old_method(d, numpy.squeeze),
+                 lambda: d.squeeze()),
+                ('insert_dimension',
+                 lambda: old_method(d, numpy.expand_dims, 0),
+                 lambda: d.insert_dimension(0)),
+                ('flatten',
+                 lambda: old_flatten(d, [2, 3]),
+                 lambda: d.flatten([2, 3]))):
+            old_time = min(timeit.repeat(old, number=1, repeat=3))
+            new_time = min(timeit.repeat(new, number=1, repeat=3))
+
+            old_memory = peak_memory(old)
+            new_memory = peak_memory(new)
+
+            assert (old().array == new().array).all()
+
+            print('{:>10}  {:>16}  {:>10.4f}  {:>10.4f}  {:>10.1f}  '
+                  '{:>10.1f}'.format(size_in_MB, name, old_time, new_time,
+                                     old_memory, new_memory))
+        # --- End: for
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [10, 100, 400]
+    main(sizes)
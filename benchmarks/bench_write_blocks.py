@@ -0,0 +1,108 @@
+'''Benchmark the peak memory used when converting a netCDF file.
+
+Compares the peak resident set size of a process that reads a field
+construct from disk and writes it to a new file with `cfdm.write`,
+which reads and writes the data in blocks of bounded size, with the
+algorithm that it replaced, which read the whole data array into
+memory before writing it. Each measurement is made in a new process.
+
+Usage:
+
+    python bench_write_blocks.py [size_in_MB ...]
+
+'''
+import os
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+
+import netCDF4
+import numpy
+
+import cfdm
+from cfdm.read_write.netcdf import NetCDFWrite
+
+
+def whole_data_blocks(self, data, nc_variable):
+    '''Return the whole data array as one block, as originally done.'''
+    yield Ellipsis, self.implementation.get_array(data)
+
+
+def make_file(size_in_MB, filename):
+    '''Create a netCDF file containing one field construct.'''
+    n = 1000
+    m = max(1, int(size_in_MB * 2 ** 20 / (8 * n)))
+
+    f = cfdm.Field(properties={'standard_name': 'air_temperature',
+                               'units': 'K'})
+    y = f.set_construct(cfdm.DomainAxis(m))
+    x = f.set_construct(cfdm.DomainAxis(n))
+    f.set_data(cfdm.Data(numpy.random.RandomState(0).uniform(
+        250, 300, size=(m, n))), axes=[y, x])
+
+    cfdm.write(f, filename)
+
+
+def peak_MB():
+    '''Return the peak resident set size of this process in MB.'''
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def child(method, infile, outfile):
+    '''Convert a file and print the increase in peak memory.'''
+    if method == 'whole':
+        NetCDFWrite._data_blocks = whole_data_blocks
+
+    f = cfdm.read(infile)[0]
+    before = peak_MB()
+    cfdm.write(f, outfile, fmt='NETCDF3_64BIT_OFFSET')
+    print(peak_MB() - before)
+
+
+def measure(method, infile, outfile):
+    '''Return the increase in peak memory when converting, in MB.'''
+    out = subprocess.check_output(
+        [sys.executable, __file__, '--child', method, infile, outfile])
+    return float(out)
+
+
+def values(filename):
+    '''Return the data values of the field construct in a file.'''
+    nc = netCDF4.Dataset(filename)
+    out = nc.variables['air_temperature'][...]
+    nc.close()
+    return out
+
+
+def main(sizes):
+    print('{:>10}  {:>12}  {:>12}'.format(
+        'data (MB)', 'whole (MB)', 'blocks (MB)'))
+
+    directory = tempfile.mkdtemp()
+    try:
+        infile = os.path.join(directory, 'in.nc')
+        whole_file = os.path.join(directory, 'whole.nc')
+        blocks_file = os.path.join(directory, 'blocks.nc')
+
+        for size_in_MB in sizes:
+            make_file(size_in_MB, infile)
+
+            whole = measure('whole', infile, whole_file)
+            blocks = measure('blocks', infile, blocks_file)
+
+            assert (values(blocks_file) == values(whole_file)).all()
+
+            print('{:>10}  {:>12.1f}  {:>12.1f}'.format(
+                size_in_MB, whole, blocks))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(sys.argv[2], sys.argv[3], sys.argv[4])
+    else:
+        sizes = [int(n) for n in sys.argv[1:]] or [200, 800]
+        main(sizes)
@@ -0,0 +1,108 @@
+'''Benchmark writing many field constructs that share a grid.
+
+Compares `cfdm.write`, which only tests variables with matching
+fingerprints and data digests when looking for metadata that has
+already been written, with the linear search of all previously
+written variables that it replaced, for field constructs that share
+latitude and longitude coordinates but have different time
+coordinates.
+
+The time coordinates have floating point values, so it is their
+digests, which summarise their values, that avoid comparing each one
+with all of the time coordinates that have already been written.
+
+Usage:
+
+    python bench_write_many_fields.py [n_fields ...]
+
+'''
+import os
+import shutil
+import sys
+import tempfile
+import timeit
+
+import netCDF4
+
+import cfdm
+from cfdm.read_write.netcdf import NetCDFWrite
+
+
+def make_fields(n_fields):
+    '''Create field constructs that share a latitude-longitude grid.'''
+    f = cfdm.example_field(0)
+    time = f.construct('time')
+
+    fields = []
+    for i in range(n_fields):
+        g = f.copy()
+        g.nc_set_variable('q{}'.format(i))
+        g.construct('time').set_data(cfdm.Data(time.data.array + i))
+        fields.append(g)
+
+    return fields
+
+
+def loop_already_in_file(self, variable, ncdims=None, ignore_type=False):
+    '''Search all previously written variables, as originally done.'''
+    seen = self.write_vars['seen']
+
+    for value in seen.values():
+        if ncdims is not None and ncdims != value['ncdims']:
+            continue
+
+        if self.implementation.equal_components(
+                variable, value['variable'], ignore_type=ignore_type):
+            self._record_seen(variable, value['ncvar'], value['ncdims'])
+            return True
+
+    return False
+
+
+def summary(filename):
+    '''Return the variables and dimensions of a netCDF file.'''
+    nc = netCDF4.Dataset(filename)
+    out = {name: v.dimensions for name, v in nc.variables.items()}
+    nc.close()
+    return out
+
+
+def main(sizes):
+    print('{:>8}  {:>10}  {:>12}  {:>12}  {:>8}'.format(
+        'fields', 'variables', 'loop (s)', 'indexed (s)', 'speedup'))
+
+    indexed_already_in_file = NetCDFWrite._already_in_file
+
+    directory = tempfile.mkdtemp()
+    try:
+        loop_file = os.path.join(directory, 'loop.nc')
+        indexed_file = os.path.join(directory, 'indexed.nc')
+
+        for n_fields in sizes:
+            fields = make_fields(n_fields)
+
+            def write_loop():
+                NetCDFWrite._already_in_file = loop_already_in_file
+                try:
+                    cfdm.write(fields, loop_file)
+                finally:
+                    NetCDFWrite._already_in_file = indexed_already_in_file
+
+            def write_indexed():
+                cfdm.write(fields, indexed_file)
+
+            loop = min(timeit.repeat(write_loop, number=1, repeat=3))
+            indexed = min(timeit.repeat(write_indexed, number=1, repeat=3))
+
+            variables = summary(indexed_file)
+            assert variables == summary(loop_file)
+
+            print('{:>8}  {:>10}  {:>12.4f}  {:>12.4f}  {:>8.1f}'.format(
+                n_fields, len(variables), loop, indexed, loop / indexed))
+    finally:
+        shutil.rmtree(directory)
+
+
+if __name__ == '__main__':
+    sizes = [int(n) for n in sys.argv[1:]] or [100, 300, 600]
+    main(sizes)
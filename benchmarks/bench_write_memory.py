@@ -0,0 +1,94 @@
+'''Benchmark the peak memory used when writing in-memory data.
+
+Compares the peak resident set size of a process that writes a field
+construct whose data are in memory with `cfdm.write`, which passes
+read-only views of in-memory data arrays to the netCDF library, with
+the algorithm that it replaced, which passed an independent copy of
+each array. Each measurement is made in a new process.
+
+Usage:
+
+    python bench_write_memory.py [size_in_MB ...]
+
+'''
+import os
+import resource
+import subprocess
+import sys
+import tempfile
+
+import numpy
+
+import cfdm
+
+
+def copy_get_array(self, data, copy=True):
+    '''Return an independent copy of the data, as originally done.'''
+    return data.array
+
+
+def make_field(size_in_MB):
+    '''Create a field construct with in-memory data.'''
+    n = 1000
+    m = max(1, int(size_in_MB * 2 ** 20 / (8 * n)))
+
+    f = cfdm.Field(properties={'standard_name': 'air_temperature',
+                               'units': 'K'})
+    y = f.set_construct(cfdm.DomainAxis(m))
+    x = f.set_construct(cfdm.DomainAxis(n))
+    f.set_data(cfdm.Data(numpy.random.RandomState(0).uniform(
+        250, 300, size=(m, n))), axes=[y, x])
+
+    return f
+
+
+def peak_MB():
+    '''Return the peak resident set size of this process in MB.'''
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 2 ** 10
+
+
+def child(size_in_MB, method, filename):
+    '''Write a field and print the increase in peak memory.'''
+    if method == 'copy':
+        cfdm.CFDMImplementation.get_array = copy_get_array
+
+    f = make_field(size_in_MB)
+    before = peak_MB()
+    cfdm.write(f, filename)
+    print(peak_MB() - before)
+
+
+def measure(size_in_MB, method, filename):
+    '''Return the increase in peak memory when writing, in MB.'''
+    out = subprocess.check_output(
+        [sys.executable, __file__, '--child', str(size_in_MB), method,
+         filename])
+    return float(out)
+
+
+def main(sizes):
+    print('{:>10}  {:>12}  {:>12}'.format(
+        'data (MB)', 'copy (MB)', 'view (MB)'))
+
+    fd, filename = tempfile.mkstemp('.nc')
+    os.close(fd)
+    try:
+        for size_in_MB in sizes:
+            copy = measure(size_in_MB, 'copy', filename)
+            view = measure(size_in_MB, 'view', filename)
+
+            g = cfdm.read(filename)[0]
+            assert g.equals(make_field(size_in_MB))
+
+            print('{:>10}  {:>12.1f}  {:>12.1f}'.format(
+                size_in_MB, copy, view))
+    finally:
+        os.remove(filename)
+
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ['--child']:
+        child(float(sys.argv[2]), sys.argv[3], sys.argv[4])
+    else:
+        sizes = [int(n) for n in sys.argv[1:]] or [50, 200, 800]
+        main(sizes)
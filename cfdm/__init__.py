@@ -91,11 +91,13 @@ from .functions import (
     atol,
     configuration,
     environment,
+    file_pool_size,
     log_level,
     rtol,
     _disable_logging,
     _reset_log_emergence_level,
     _is_valid_log_level_int,
+    _is_enabled_for,
     Configuration,
     Constant,
     ConstantAccess,
@@ -149,7 +151,9 @@ from .abstract           import Implementation
 from .cfdmimplementation import (CFDMImplementation,
                                  implementation)
 
-from .read_write import (read,
+from .read_write import (clear_read_cache,
+                         read,
+                         read_many,
                          write)
 
 from .examplefield import example_field
@@ -180,3 +184,7 @@ def detail(self, message, *args, **kwargs):
 
 
 logging.Logger.detail = detail
+
+# Allow the log level to be overridden separately in each thread or
+# asynchronous task (see _manage_log_level_via_verbosity)
+logging.Logger.isEnabledFor = _is_enabled_for
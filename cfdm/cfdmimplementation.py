@@ -20,6 +20,7 @@ from . import (AuxiliaryCoordinate,
 from .data import (Data,
                    GatheredArray,
                    NetCDFArray,
+                   NumpyArray,
                    RaggedContiguousArray,
                    RaggedIndexedArray,
                    RaggedIndexedContiguousArray)
@@ -296,20 +297,58 @@ class CFDMImplementation(Implementation):
         '''
         return field.insert_dimension(axis, position=position)
 
-    def get_array(self, data):
+    def get_array(self, data, copy=True):
         '''Return the data as a `numpy` array.
 
     :Parameters:
 
         data: data instance
 
+        copy: `bool`, optional
+            If False then, for data that are already in memory,
+            return a read-only view of the underlying numpy array
+            rather than an independent copy of it. By default an
+            independent copy is always returned.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
     :Returns:
 
         `numpy.ndarray`
 
         '''
+        if not copy:
+            array = self.get_array_view(data)
+            if array is not None:
+                return array
+        # --- End: if
+
         return data.array
 
+    def get_array_view(self, data):
+        '''Return a read-only view of data that are already in memory.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        data: data instance
+
+    :Returns:
+
+        `numpy.ndarray` or `None`
+            A read-only view of the underlying numpy array, or `None`
+            if the data are not in memory.
+
+        '''
+        Array = data._get_Array(None)
+        if not isinstance(Array, NumpyArray):
+            return None
+
+        array = Array._get_component('array').view()
+        array.flags.writeable = False
+        return array
+
     def get_auxiliary_coordinates(self, field, axes=None, exact=False):
         '''Return auxiliary coordinate constructs that span particular axes.
 
@@ -27,11 +27,16 @@ retrieve and set the values with the dedicated get-and-set functions.
       The minimal level of seriousness for which log messages are
       shown.  See `cfdm.log_level`.
 
+    FILE_POOL_SIZE: `int`
+      The maximum number of idle netCDF files that are kept open for
+      reuse. See `cfdm.file_pool_size`.
+
 '''
 CONSTANTS = {
     'ATOL': sys.float_info.epsilon,
     'RTOL': sys.float_info.epsilon,
     'LOG_LEVEL': logging.getLevelName(logging.getLogger().level),
+    'FILE_POOL_SIZE': 16,
 }
 
 
@@ -131,7 +131,14 @@ class Container(metaclass=DocstringRewriteMeta):
                 default = copy(default)
                 default.args = (message,)
 
-            raise default
+            try:
+                raise default
+            finally:
+                # Break the reference cycle between the exception
+                # and this frame, which would otherwise keep the
+                # calling frames, and their local variables, alive
+                # until the next garbage collection
+                del default
 
         return default
 
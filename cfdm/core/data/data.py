@@ -124,6 +124,16 @@ class Data(abstract.Container):
             self.set_fill_value(fill_value)
 
         if _use_array and array is not None:
+            if isinstance(array, numpy.ndarray):
+                # The input numpy array may be modified elsewhere, so
+                # it is not owned by the data
+                array = NumpyArray(array)
+            elif not copy and isinstance(array, NumpyArray):
+                # Copying is cheap, since it is copy-on-write, and
+                # ensures that the sharing of the numpy array with the
+                # input is recorded
+                copy = True
+
             self._set_Array(array, copy=copy)
 
     def __data__(self):
@@ -776,8 +786,11 @@ class Data(abstract.Container):
         if not isinstance(array, Array):
             if not isinstance(array, numpy.ndarray):
                 array = numpy.asanyarray(array)
+                copy = False
 
-            array = NumpyArray(array)
+            # A numpy array that is not to be copied is owned by the
+            # data
+            array = NumpyArray(array, _owned=not copy)
 
         if copy:
             array = array.copy()
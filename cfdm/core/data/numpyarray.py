@@ -9,7 +9,11 @@ class NumpyArray(abstract.Array):
     .. versionadded:: (cfdm) 1.7.0
 
     '''
-    def __init__(self, array=None):
+    # Whether or not the numpy array is owned by the instances that
+    # share it. See `__init__` for details.
+    _owned = False
+
+    def __init__(self, array=None, _owned=False):
         '''**Initialization**
 
     :Parameters:
@@ -17,29 +21,166 @@ class NumpyArray(abstract.Array):
         array: `numpy.ndarray`
             The numpy array.
 
+        _owned: `bool`, optional
+            If True then the numpy array is only referenced by this
+            instance, and so may be shared with its copies on a
+            copy-on-write basis. By default the numpy array may also
+            be referenced elsewhere and modified independently of
+            this instance, so it is never shared with copies and is
+            copied prior to any in-place modification.
+
         '''
         super().__init__()
 
         self._set_component('array', array, copy=False)
 
-#    def __deepcopy__(self, memo):
-#        '''Called by the `copy.deepcopy` function.
-#
-#    x.__deepcopy__() <==> copy.deepcopy(x)
-#
-#    Copy-on-write is employed. Therefore, after copying, care must be
-#    taken when making in-place modifications to attributes of either
-#    the original or the new copy.
-#
-#    .. versionadded:: (cfdm) 1.8.7.0
-#
-#    **Examples:**
-#
-#    >>> import copy
-#    >>> y = copy.deepcopy(x)
-#
-#        '''
-#        return self.copy()
+        # The number of instances that are sharing the numpy
+        # array. This list is shared between copies.
+        self._references = [1]
+
+        self._owned = bool(_owned)
+
+    def __del__(self):
+        '''Called when the instance is about to be destroyed.
+
+    The instance no longer shares its numpy array with its copies.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+        '''
+        references = getattr(self, '_references', None)
+        if references is not None:
+            references[0] -= 1
+
+    def __deepcopy__(self, memo):
+        '''Called by the `copy.deepcopy` function.
+
+    x.__deepcopy__() <==> copy.deepcopy(x)
+
+    Copy-on-write is employed. See `copy` for details.
+
+    .. versionadded:: (cfdm) 1.8.7.0
+
+    **Examples:**
+
+    >>> import copy
+    >>> y = copy.deepcopy(x)
+
+        '''
+        return self.copy()
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _is_shared(self):
+        '''Whether or not the numpy array may be shared.
+
+    The numpy array may be shared with copies of this instance, or
+    with other references to the numpy array that was used to
+    initialise it. Such a numpy array must not be modified in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_unshare`, `copy`
+
+    :Returns:
+
+        `bool`
+            `True` if the numpy array may be shared, otherwise
+            `False`.
+
+    **Examples:**
+
+    >>> a = {{package}}.{{class}}(numpy.arange(9), _owned=True)
+    >>> a._is_shared()
+    False
+    >>> b = a.copy()
+    >>> a._is_shared(), b._is_shared()
+    (True, True)
+    >>> b._unshare()
+    >>> a._is_shared(), b._is_shared()
+    (False, False)
+
+    >>> c = {{package}}.{{class}}(numpy.arange(9))
+    >>> c._is_shared()
+    True
+
+        '''
+        return not self._owned or self._references[0] > 1
+
+    def _unshare(self):
+        '''Ensure that the numpy array is not shared.
+
+    If the numpy array may be shared then it is replaced with an
+    independent copy of itself, so that it may be safely modified
+    in-place.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_is_shared`, `copy`
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> b = a.copy()
+    >>> b._unshare()
+    >>> b._is_shared()
+    False
+
+        '''
+        if not self._is_shared():
+            return
+
+        self._references[0] -= 1
+        self._references = [1]
+        self._owned = True
+        self._components = self._components.copy()
+        self._set_component('array', self.array, copy=False)
+
+    def _set_view(self, func, *args, **kwargs):
+        '''Replace the numpy array with a view of itself.
+
+    The view is created by applying a function, such as
+    `numpy.transpose`, that returns a view of the numpy array rather
+    than a copy. The view continues to share the numpy array's memory,
+    so the new numpy array is shared with exactly the same instances
+    as the old one, and copy-on-write continues to apply to it.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_is_shared`, `_unshare`
+
+    :Parameters:
+
+        func: function
+            The function that creates the view. It is passed the
+            numpy array followed by any other positional and keyword
+            arguments.
+
+        args, kwargs: optional
+            Any other arguments to *func*.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> a = {{package}}.{{class}}(numpy.arange(6).reshape(2, 3),
+    ...                             _owned=True)
+    >>> b = a.copy()
+    >>> b._set_view(numpy.transpose)
+    >>> a.shape, b.shape
+    ((2, 3), (3, 2))
+    >>> b._is_shared()
+    True
+
+        '''
+        array = func(self._get_component('array'), *args, **kwargs)
+        self._set_component('array', array, copy=False)
 
     @property
     def dtype(self):
@@ -188,12 +329,18 @@ class NumpyArray(abstract.Array):
 
     ``a.copy() is equivalent to ``copy.deepcopy(a)``.
 
-    Copy-on-write is employed. Therefore, after copying, care must be
-    taken when making in-place modifications to attributes of either
-    the original or the new copy.
+    Copy-on-write is employed, so the copy shares the numpy array with
+    the original instance until either of them replaces it with an
+    independent copy by calling `_unshare`, which must be done prior
+    to any in-place modification of the numpy array. The exception is
+    a numpy array that may be referenced elsewhere, such as one that
+    was used to initialise the instance, which could be modified
+    without copy-on-write and so is copied immediately.
 
     .. versionadded:: (cfdm) 1.8.7.0
 
+    .. seealso:: `_is_shared`, `_unshare`
+
     :Returns:
 
         `{{class}}`
@@ -207,6 +354,12 @@ class NumpyArray(abstract.Array):
         klass = self.__class__
         new = klass.__new__(klass)
         new.__dict__ = self.__dict__.copy()
+        new._components = self._components.copy()
+        self._references[0] += 1
+
+        if not self._owned:
+            new._unshare()
+
         return new
 
 # --- End: class
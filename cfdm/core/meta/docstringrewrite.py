@@ -60,6 +60,11 @@ class DocstringRewriteMeta(type):
                 )
         # --- End: for
 
+        # Substitute embedded substitutions once for the class,
+        # rather than once for every docstring
+        docstring_rewrite = DocstringRewriteMeta._docstring_resolve(
+            docstring_rewrite)
+
         # ------------------------------------------------------------
         # Find the package depth
         # ------------------------------------------------------------
@@ -575,6 +580,47 @@ class DocstringRewriteMeta(type):
 
         return set(out)
 
+    @staticmethod
+    def _docstring_resolve(config):
+        '''Substitute the non-special substitutions embedded within the
+    values of docstring substitutions.
+
+    Any non-special substitutions embedded within an embedded
+    substitution are *not* replaced.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_docstring_substitutions`, `_docstring_update`
+
+    :Parameters:
+
+        config: `dict`
+            The docstring substitutions.
+
+    :Returns:
+
+        `dict`
+            The docstring substitutions with embedded substitutions
+            replaced.
+
+        '''
+        out = {}
+        for key, value in config.items():
+            if isinstance(value, str):
+                for k, v in config.items():
+                    try:
+                        # Compiled regular expression substitution
+                        value = k.sub(v, value)
+                    except AttributeError:
+                        # String substitution
+                        if k in value:
+                            value = value.replace(k, v)
+            # --- End: if
+
+            out[key] = value
+
+        return out
+
     @classmethod
     def _docstring_update(cls, package_name, class_name, f,
                           method_name, config, class_docstring=None):
@@ -582,6 +628,12 @@ class DocstringRewriteMeta(type):
 
     .. versionadded:: (cfdm) 1.8.7.0
 
+    :Parameters:
+
+        config: `dict`
+            The docstring substitutions, with embedded substitutions
+            already replaced by `_docstring_resolve`.
+
         '''
         if class_docstring is not None:
             doc = class_docstring
@@ -595,29 +647,13 @@ class DocstringRewriteMeta(type):
         # Do general substitutions first
         # ------------------------------------------------------------
         for key, value in config.items():
-            # Substitute non-special substitutions embedded within
-            # this value, updating the value if any are found. Note
-            # that any non-special substitutions embedded within the
-            # embedded substituion are *not* replaced.
-            for k, v in config.items():
-                if k not in value:
-                    continue
-
-                try:
-                    # Compiled regular expression substitution
-                    value = key.sub(v, value)
-                except AttributeError:
-                    # String substitution
-                    value = value.replace(k, v)
-            # --- End: for
-
-            # Substitute the key for the value
             try:
                 # Compiled regular expression substitution
                 doc = key.sub(value, doc)
             except AttributeError:
                 # String substitution
-                doc = doc.replace(key, value)
+                if key in doc:
+                    doc = doc.replace(key, value)
         # --- End: for
 
         # ------------------------------------------------------------
@@ -91,6 +91,242 @@ class CompressedArray(Array):
 
         self._set_component('compressed_Array', array, copy=False)
 
+        # Invalidate any arrays derived from the ancillary variables.
+        # A new dictionary is created, rather than clearing the
+        # existing one, so that any copies of this array retain their
+        # cached arrays.
+        self._ancillary_cache = {}
+
+    def _get_cached(self, key, func):
+        '''Return a cached array derived from the ancillary variables.
+
+    Arrays derived from the count, index and list variables are
+    computed on first use and then cached, so that they are not
+    re-read from disk, nor re-computed, on each subspace. The cache is
+    shared with any copies of the array, and so the cached arrays are
+    read-only.
+
+    The cache is invalidated by `_set_compressed_Array`.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        key: `str`
+            The name of the cached array.
+
+        func: function
+            A function that takes no arguments and returns the array,
+            or a `tuple` of arrays, to be cached if *key* has not yet
+            been cached.
+
+    :Returns:
+
+            The cached array, or `tuple` of arrays.
+
+    **Examples:**
+
+    >>> count_array = a._get_cached(
+    ...     'count', lambda: a.get_count().data.array)
+
+        '''
+        cache = self.__dict__.get('_ancillary_cache')
+        if cache is None:
+            cache = {}
+            self._ancillary_cache = cache
+
+        try:
+            return cache[key]
+        except KeyError:
+            pass
+
+        value = func()
+        for array in (value if isinstance(value, tuple) else (value,)):
+            array.flags.writeable = False
+
+        cache[key] = value
+        return value
+
+    def _parse_indices(self, indices):
+        '''Parse indices of the uncompressed array.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        indices:
+            The indices that define a subspace of the uncompressed
+            array. See `__getitem__` for details.
+
+    :Returns:
+
+        `list`, `tuple`
+            The indices of each uncompressed dimension as a
+            one-dimensional numpy array of non-negative integers; and
+            the positions of the dimensions that have been indexed by
+            a single integer, and so are to be dropped from the
+            subspace.
+
+    **Examples:**
+
+    >>> a.shape
+    (4, 9)
+    >>> a._parse_indices(Ellipsis)
+    ([array([0, 1, 2, 3]), array([0, 1, 2, 3, 4, 5, 6, 7, 8])], ())
+    >>> a._parse_indices([[1, -1], slice(2, 5)])
+    ([array([1, 3]), array([2, 3, 4])], ())
+    >>> a._parse_indices([2, slice(None, None, -4)])
+    ([array([2]), array([8, 4, 0])], (0,))
+
+        '''
+        shape = self.shape
+
+        if indices is Ellipsis:
+            indices = (slice(None),) * len(shape)
+
+        parsed = []
+        dropped = []
+        for i, (index, size) in enumerate(zip(indices, shape)):
+            if isinstance(index, slice):
+                parsed.append(numpy.arange(*index.indices(size)))
+                continue
+
+            index = numpy.asanyarray(index)
+            if not index.ndim:
+                dropped.append(i)
+                index = index.reshape(1)
+
+            parsed.append(numpy.arange(size)[index])
+        # --- End: for
+
+        return parsed, tuple(dropped)
+
+    def _read_indices(self, indices, parsed_indices):
+        '''Return indices for reading uncompressed dimensions.
+
+    Slices are retained so that they may be applied efficiently to an
+    array on disk, and all other indices are replaced by their parsed
+    equivalents.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_parse_indices`, `_read_compressed`
+
+    :Parameters:
+
+        indices:
+            The indices that define a subspace of the uncompressed
+            array. See `__getitem__` for details.
+
+        parsed_indices: `list`
+            The parsed indices, as returned by `_parse_indices`.
+
+    :Returns:
+
+        `list`
+            The index of each uncompressed dimension.
+
+    **Examples:**
+
+    >>> a.shape
+    (4, 9)
+    >>> indices = [2, slice(1, 3)]
+    >>> a._read_indices(indices, a._parse_indices(indices)[0])
+    [array([2]), slice(1, 3, None)]
+
+        '''
+        if indices is Ellipsis:
+            return [slice(None)] * len(parsed_indices)
+
+        return [index if isinstance(index, slice) else parsed
+                for index, parsed in zip(indices, parsed_indices)]
+
+    def _read_compressed(self, samples, indices=None, gap=4096):
+        '''Read elements of the compressed dimension into memory.
+
+    Only the parts of the compressed array that contain the requested
+    elements are read. Runs of requested elements that are separated
+    by fewer than *gap* unrequested elements are read together, so
+    that the number of reads from an array on disk is kept small.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        samples: `numpy.ndarray`
+            The positions along the compressed dimension of the
+            required elements, in any order and possibly with
+            repeats.
+
+        indices: sequence, optional
+            Indices of the compressed array for the dimensions other
+            than the compressed dimension. The index for the
+            compressed dimension itself is ignored. By default all of
+            the other dimensions are read in full.
+
+        gap: `int`, optional
+            The largest number of unrequested elements between two
+            requested elements that may be read in a single read.
+
+    :Returns:
+
+        `numpy.ndarray`
+            The compressed data, with the compressed dimension
+            containing the requested elements in the order given by
+            *samples*.
+
+    **Examples:**
+
+    >>> a._read_compressed(numpy.array([6, 7, 8, 9, 0]))
+
+        '''
+        compressed_array = self._get_compressed_Array()
+        axis = self.get_compressed_dimension()
+
+        if indices is None:
+            indices = [slice(None)] * compressed_array.ndim
+        else:
+            indices = list(indices)
+
+        samples, inverse = numpy.unique(samples, return_inverse=True)
+
+        # Find the runs of requested elements that are to be read
+        # together
+        breaks = numpy.where(numpy.diff(samples) > gap)[0] + 1
+        starts = samples[numpy.insert(breaks, 0, 0)]
+        stops = samples[numpy.append(breaks - 1, -1)] + 1
+
+        arrays = []
+        for start, stop in zip(starts.tolist(), stops.tolist()):
+            indices[axis] = slice(start, stop)
+            array = compressed_array[tuple(indices)]
+            if not isinstance(array, numpy.ndarray):
+                # The compressed array is a Data object
+                array = array.array
+
+            arrays.append(array)
+        # --- End: for
+
+        if len(arrays) == 1:
+            array = arrays[0]
+        elif any(numpy.ma.isMA(a) for a in arrays):
+            array = numpy.ma.concatenate(arrays, axis=axis)
+        else:
+            array = numpy.concatenate(arrays, axis=axis)
+
+        # Find the position of each requested element in the array
+        # that has been read
+        run_sizes = stops - starts
+        run = numpy.repeat(numpy.arange(starts.size), run_sizes)
+        offsets = numpy.cumsum(run_sizes) - run_sizes
+        positions = numpy.arange(run.size) - offsets[run] + starts[run]
+        positions = numpy.searchsorted(positions, samples)
+
+        if numpy.ma.isMA(array):
+            return numpy.ma.take(array, positions[inverse], axis=axis)
+
+        return numpy.take(array, positions[inverse], axis=axis)
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -19,7 +19,7 @@ from ..decorators import (
 )
 
 from . import abstract
-from . import NumpyArray
+from . import NumpyArray, NetCDFArray
 
 
 logger = logging.getLogger(__name__)
@@ -141,7 +141,7 @@ class Data(Container,
                 array = numpy.asanyarray(array)
 
             array = array.astype(dtype)
-            array = NumpyArray(array)
+            array = NumpyArray(array, _owned=True)
 
         if mask is not None:
             if isinstance(array, abstract.Array):
@@ -151,6 +151,10 @@ class Data(Container,
 
             array = numpy.ma.array(array, mask=mask)
             array = NumpyArray(array)
+        elif _use_array and isinstance(array, numpy.ndarray):
+            # The input numpy array may be modified elsewhere, so it
+            # is not owned by the data
+            array = NumpyArray(array)
 
         super().__init__(array=array, units=units, calendar=calendar,
                          fill_value=fill_value, source=source,
@@ -261,7 +265,11 @@ class Data(Container,
         if array is None:
             raise ValueError("No array!!")
 
-        array = array[indices]
+        if isinstance(array, NetCDFArray):
+            # Defer reading from disk until the data are required
+            array = array._subspace(indices)
+        else:
+            array = array[indices]
 
         out = self.copy(array=False)
         out._set_Array(array, copy=False)
@@ -386,7 +394,22 @@ class Data(Container,
         '''
         indices = self._parse_indices(indices)
 
-        array = self.array
+        array = None
+
+        source = self._get_Array(None)
+        if (isinstance(source, NumpyArray) and
+                len([i for i in indices if not isinstance(i, slice)]) < 2):
+            # The data are in memory, so assign to the numpy array
+            # in-place, rather than to a copy of it. If the numpy
+            # array is shared then it is copied first, but only once.
+            source._unshare()
+            array = source._get_component('array')
+            if not array.flags.writeable:
+                array = None
+        # --- End: if
+
+        if array is None:
+            array = self.array
 
         if value is cfdm_masked or numpy.ma.isMA(value):
             # The data is not masked but the assignment is masking
@@ -618,14 +641,61 @@ class Data(Container,
     >>> d._set_Array(a)
 
         '''
-        if not isinstance(array, abstract.Array):
+        if not isinstance(array, core.Array):
             if not isinstance(array, numpy.ndarray):
+                # A new numpy array does not need copying
                 array = numpy.asanyarray(array)
+                copy = False
 
-            array = NumpyArray(array)
+            # A numpy array that is not to be copied is owned by the
+            # data
+            array = NumpyArray(array, _owned=not copy)
 
         super()._set_Array(array, copy=copy)
 
+    def _set_view(self, func, *args, **kwargs):
+        '''Replace the array with a view of itself.
+
+    The view is created by a function, such as `numpy.transpose`, that
+    changes the shape or strides of a numpy array without copying its
+    values. If the data are in memory then the function is applied to
+    the underlying numpy array, which continues to be shared on a
+    copy-on-write basis with any copies of the data, so that no values
+    are copied. Otherwise the data are read into memory first.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_set_Array`
+
+    :Parameters:
+
+        func: function
+            The function that creates the view. It is passed the
+            numpy array followed by any other positional and keyword
+            arguments.
+
+        args, kwargs: optional
+            Any other arguments to *func*.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> d.shape
+    (19, 73, 96)
+    >>> d._set_view(numpy.transpose, (2, 0, 1))
+    >>> d.shape
+    (96, 19, 73)
+
+        '''
+        array = self._get_Array()
+        if isinstance(array, NumpyArray):
+            array._set_view(func, *args, **kwargs)
+        else:
+            self._set_Array(func(self.array, *args, **kwargs), copy=False)
+
     def _set_CompressedArray(self, array, copy=True):
         '''Set the compressed array.
 
@@ -1378,9 +1448,7 @@ class Data(Container,
                 "Can't insert dimension: "
                 "Invalid position: {!r}".format(position))
 
-        array = numpy.expand_dims(self.array, position)
-
-        d._set_Array(array, copy=False)
+        d._set_view(numpy.expand_dims, position)
 
         # Delete hdf5 chunksizes
         d.nc_clear_hdf5_chunksizes()
@@ -1837,10 +1905,7 @@ class Data(Container,
         if not axes:
             return d
 
-        array = self.array
-        array = numpy.squeeze(array, axes)
-
-        d._set_Array(array, copy=False)
+        d._set_view(numpy.squeeze, axes)
 
         # Delete hdf5 chunksizes
         d.nc_clear_hdf5_chunksizes()
@@ -1978,10 +2043,7 @@ class Data(Container,
         if axes == tuple(range(ndim)):
             return d
 
-        array = self.array
-        array = numpy.transpose(array, axes=axes)
-
-        d._set_Array(array, copy=False)
+        d._set_view(numpy.transpose, axes)
 
         return d
 
@@ -2444,11 +2506,11 @@ class Data(Container,
         new_shape = [n for i, n in enumerate(shape) if i not in axes]
         new_shape.insert(axes[0], numpy.prod([shape[i] for i in axes]))
 
-        array = d.array.reshape(new_shape)
+        d._set_view(numpy.reshape, new_shape)
 
-        out = type(self)(array, units=d.get_units(None),
+        out = type(self)(d._get_Array(), units=d.get_units(None),
                          calendar=d.get_calendar(None),
-                         fill_value=d.get_fill_value(None))
+                         fill_value=d.get_fill_value(None), copy=False)
 
         if inplace:
             d.__dict__ = out.__dict__
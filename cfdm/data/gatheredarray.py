@@ -1,6 +1,3 @@
-from functools import reduce
-from operator import mul
-
 import numpy
 
 from . import abstract
@@ -19,6 +16,10 @@ class GatheredArray(abstract.CompressedArray):
     .. versionadded:: (cfdm) 1.7.0
 
     '''
+    # The maximum number of compressed array elements to be
+    # uncompressed at once
+    _chunk_size = 2 ** 22
+
     def __init__(self, compressed_array=None, shape=None, size=None,
                  ndim=None, compressed_dimension=None,
                  list_variable=None):
@@ -75,54 +76,125 @@ class GatheredArray(abstract.CompressedArray):
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress only the requested subspace
         # ------------------------------------------------------------
+        parsed_indices, dropped = self._parse_indices(indices)
 
-        compressed_array = self._get_compressed_Array().array
-
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
-
-        # Initialise the uncomprssed array
         compressed_dimension = self.get_compressed_dimension()
-
         compressed_axes = self.get_compressed_axes()
 
-        n_compressed_axes = len(compressed_axes)
-
-        uncompressed_shape = self.shape
-        partial_uncompressed_shapes = [
-            reduce(mul, [uncompressed_shape[i]
-                         for i in compressed_axes[j:]], 1)
-            for j in range(1, n_compressed_axes)]
+        # Along the compressed axes, uncompress the sorted unique
+        # requested indices, and reorder them afterwards if required
+        unique_indices = list(parsed_indices)
+        reorder = [slice(None)] * self.ndim
+        for i in compressed_axes:
+            unique_indices[i] = numpy.unique(parsed_indices[i])
+            if not numpy.array_equal(unique_indices[i], parsed_indices[i]):
+                reorder[i] = numpy.searchsorted(unique_indices[i],
+                                                parsed_indices[i])
+        # --- End: for
+
+        # Initialise the uncompressed subspace
+        uarray = numpy.ma.masked_all([i.size for i in unique_indices],
+                                     dtype=self.dtype)
+
+        list_indices = self._get_cached('list', self._list_indices)
+
+        # Find the list elements that lie within the requested
+        # subspace, and their locations in the uncompressed subspace
+        selected = numpy.ones(list_indices[0].shape, dtype=bool)
+        locations = []
+        for i, x in zip(compressed_axes, list_indices):
+            location = numpy.full((self.shape[i],), -1, dtype=int)
+            location[unique_indices[i]] = numpy.arange(unique_indices[i].size)
+            location = location[x]
+            selected &= location >= 0
+            locations.append(location)
+        # --- End: for
+
+        samples = numpy.where(selected)[0]
+        if samples.size and uarray.size:
+            # The locations of the selected list elements in the
+            # uncompressed subspace. The compressed axes are
+            # contiguous, so assigning to them with these integer
+            # arrays replaces them with a single dimension in the
+            # same position as the compressed dimension.
+            u_indices = [slice(None)] * self.ndim
+            for i, location in zip(compressed_axes, locations):
+                u_indices[i] = location[samples]
+
+            # Indices of the compressed array
+            sample_indices = self._read_indices(indices, parsed_indices)
+            sample_indices = (
+                sample_indices[:compressed_dimension] + [slice(None)] +
+                sample_indices[compressed_axes[-1] + 1:])
+
+            # Bound the memory used by the compressed data by reading
+            # and scattering it in chunks along its outermost
+            # uncompressed dimension
+            c_axis = int(compressed_dimension == 0)
+            if c_axis < len(sample_indices):
+                u_axis = c_axis
+                if c_axis > compressed_dimension:
+                    u_axis += len(compressed_axes) - 1
+
+                chunk_size = samples.size * uarray.size // (
+                    uarray.shape[u_axis] *
+                    numpy.prod([uarray.shape[i] for i in compressed_axes]))
+                chunk_size = max(1, self._chunk_size // max(chunk_size, 1))
+            else:
+                c_axis = None
+
+            if c_axis is None or chunk_size >= uarray.shape[u_axis]:
+                # Read and scatter all of the selected list elements
+                # in one go
+                uarray[tuple(u_indices)] = self._read_compressed(
+                    samples, sample_indices)
+            else:
+                index = sample_indices[c_axis]
+                parsed = parsed_indices[u_axis]
+                for start in range(0, parsed.size, chunk_size):
+                    stop = start + chunk_size
+                    if isinstance(index, slice):
+                        step = index.indices(self.shape[u_axis])[2]
+                        last = int(parsed[start:stop][-1]) + step
+                        sample_indices[c_axis] = slice(
+                            int(parsed[start]), last if last >= 0 else None,
+                            step)
+                    else:
+                        sample_indices[c_axis] = parsed[start:stop]
+
+                    u_indices[u_axis] = slice(start, stop)
+                    uarray[tuple(u_indices)] = self._read_compressed(
+                        samples, sample_indices)
+        # --- End: if
+
+        if any(not isinstance(x, slice) for x in reorder):
+            uarray = self.get_subspace(uarray, reorder, copy=False)
+
+        if dropped:
+            uarray = uarray.squeeze(axis=dropped)
+
+        return uarray
+
+    def _list_indices(self):
+        '''Return the uncompressed indices of each list element.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_get_cached`
 
-        sample_indices = [slice(None)] * compressed_array.ndim
-        u_indices = [slice(None)] * self.ndim
-
-        list_array = self.get_list().data.array
-
-        zeros = [0] * n_compressed_axes
-        for j, b in enumerate(list_array):
-            sample_indices[compressed_dimension] = slice(j, j+1)
-
-            # Note that it is important for indices a and b to be
-            # integers (rather than the slices a:a+1 and b:b+1) so
-            # that these dimensions are dropped from uarray[u_indices]
-            u_indices[compressed_axes[0]:compressed_axes[-1]+1] = zeros
-            for i, z in zip(compressed_axes[:-1], partial_uncompressed_shapes):
-                if b >= z:
-                    (a, b) = divmod(b, z)
-                    u_indices[i] = a
-            # --- End: for
-            u_indices[compressed_axes[-1]] = b
-
-            compressed = compressed_array[tuple(sample_indices)]
-            sample_indices[compressed_dimension] = 0
-            compressed = compressed[tuple(sample_indices)]
+    :Returns:
 
-            uarray[tuple(u_indices)] = compressed
+        `tuple`
+            For each compressed dimension, the index of each element
+            of the list variable along that dimension.
 
-        return self.get_subspace(uarray, indices, copy=True)
+        '''
+        compressed_shape = [self.shape[i] for i in self.get_compressed_axes()]
+        list_array = numpy.asanyarray(self.get_list().data.array,
+                                      dtype=int)
+        return numpy.unravel_index(list_array, compressed_shape)
 
     def get_list(self, default=ValueError()):
         '''Return the list variable for a compressed array.
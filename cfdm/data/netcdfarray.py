@@ -6,6 +6,8 @@ from . import abstract
 
 from .numpyarray import NumpyArray
 
+from ..netcdffilepool import file_pool, netcdf_lock
+
 
 class NetCDFArray(abstract.Array):
     '''An underlying array stored in a netCDF file.
@@ -94,7 +96,8 @@ class NetCDFArray(abstract.Array):
         self._set_component('netcdf', None, copy=False)
         self._set_component('group', group, copy=False)
 
-        # By default, close the netCDF file after data array access
+        # By default, release the netCDF file back to the file pool
+        # after data array access
         self._set_component('close', True, copy=False)
 
         if ndim is not None:
@@ -127,41 +130,50 @@ class NetCDFArray(abstract.Array):
         then these indices work independently along each dimension
         (similar to the way vector subscripts work in Fortran).
 
+    If the array is itself a subspace of the netCDF variable, as
+    created by `_subspace`, then the indices are relative to that
+    subspace, and only the requested elements are read from the file.
+
     .. versionadded:: (cfdm) 1.7.0
 
         '''
-        netcdf = self.open()
-
-        # Traverse the group structure, if there is one (CF>=1.8).
-        group = self.get_group()
-        if group:
-            for g in group[:-1]:
-                netcdf = netcdf.groups[g]
-
-            netcdf = netcdf.groups[group[-1]]
-
-        ncvar = self.get_ncvar()
-        mask = self.get_mask()
-
-        if ncvar is not None:
-            # Get the variable by netCDF name
-            variable = netcdf.variables[ncvar]
-            variable.set_auto_mask(mask)
-            array = variable[indices]
-        else:
-            # Get the variable by netCDF ID
-            varid = self.get_varid()
-
-            for variable in netcdf.variables.values():
-                if variable._varid == varid:
-                    variable.set_auto_mask(mask)
-                    array = variable[indices]
-                    break
-        # --- End: if
-
-        if self._get_component('close'):
-            # Close the netCDF file
-            self.close()
+        indices = self._compose_indices(indices)
+
+        # The netCDF-C library is not thread-safe
+        with netcdf_lock:
+            netcdf = self.open()
+
+            # Traverse the group structure, if there is one (CF>=1.8).
+            group = self.get_group()
+            if group:
+                for g in group[:-1]:
+                    netcdf = netcdf.groups[g]
+
+                netcdf = netcdf.groups[group[-1]]
+
+            ncvar = self.get_ncvar()
+            mask = self.get_mask()
+
+            if ncvar is not None:
+                # Get the variable by netCDF name
+                variable = netcdf.variables[ncvar]
+                variable.set_auto_mask(mask)
+                array = variable[indices]
+            else:
+                # Get the variable by netCDF ID
+                varid = self.get_varid()
+
+                for variable in netcdf.variables.values():
+                    if variable._varid == varid:
+                        variable.set_auto_mask(mask)
+                        array = variable[indices]
+                        break
+            # --- End: if
+
+            if self._get_component('close'):
+                # Close the netCDF file
+                self.close()
+        # --- End: with
 
         string_type = isinstance(array, str)
         if string_type:
@@ -227,6 +239,177 @@ class NetCDFArray(abstract.Array):
 
         return "file={0} {1}".format(self.get_filename(), name)
 
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _compose_indices(self, indices):
+        '''Compose indices with those that define the array's subspace.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_subspace`
+
+    :Parameters:
+
+        indices:
+            Indices of the array, as accepted by `__getitem__`.
+
+    :Returns:
+
+            The equivalent indices of the netCDF variable. Each index
+            is either a `slice` or a sequence of integers.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 20)
+    >>> b = a._subspace([slice(2, 8), [1, 3, 5, 6]])
+    >>> b._compose_indices([slice(None, None, -2), [3, 0]])
+    (slice(7, 1, -2), array([6, 1]))
+
+        '''
+        ranges = self._get_component('indices', None)
+        if ranges is None:
+            # The array spans the whole netCDF variable
+            return indices
+
+        if indices is not Ellipsis:
+            ranges = self._compose_ranges(ranges, indices)
+
+        out = []
+        for r in ranges:
+            if isinstance(r, range):
+                # Convert a range to a slice, remembering that a stop
+                # of -1 means "continue to the start of the dimension"
+                # for a range, but "stop before the last element" for
+                # a slice
+                stop = r.stop
+                if stop < 0:
+                    stop = None
+
+                r = slice(r.start, stop, r.step)
+
+            out.append(r)
+        # --- End: for
+
+        return tuple(out)
+
+    @classmethod
+    def _compose_ranges(cls, ranges, indices):
+        '''Apply indices to the elements selected from each dimension.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_compose_indices`, `_subspace`
+
+    :Parameters:
+
+        ranges: sequence
+            For each dimension of the netCDF variable, the positions
+            of the selected elements as either a `range` or a
+            one-dimensional numpy integer array.
+
+        indices: sequence
+            For each dimension, a `slice` or a sequence of integers or
+            booleans to be applied to the selected elements.
+
+    :Returns:
+
+        `list`
+            For each dimension of the netCDF variable, the positions
+            of the newly selected elements as either a `range` or a
+            one-dimensional numpy integer array.
+
+    **Examples:**
+
+    >>> a._compose_ranges([range(2, 8), range(20)],
+    ...                   [slice(None, None, -2), [3, 0]])
+    [range(7, 1, -2), array([3, 0])]
+    >>> a._compose_ranges([range(2, 8), numpy.array([6, 1, 2, 3])],
+    ...                   [[0, 1, 2], slice(1, None)])
+    [range(2, 5), range(1, 4)]
+
+        '''
+        out = []
+        for r, index in zip(ranges, indices):
+            if isinstance(r, range) and isinstance(index, slice):
+                out.append(r[index])
+                continue
+
+            if not isinstance(index, slice):
+                index = numpy.asanyarray(index)
+
+            r = numpy.asanyarray(r)[index]
+
+            # Replace contiguous increasing positions with a range,
+            # which may be read more efficiently. Other positions are
+            # left as they are, because netCDF4 does not allow strided
+            # reads of string variables.
+            if r.size and (r.size == 1 or (numpy.diff(r) == 1).all()):
+                r = range(int(r[0]), int(r[-1]) + 1)
+
+            out.append(r)
+        # --- End: for
+
+        return out
+
+    def _subspace(self, indices):
+        '''Return a subspace of the array without reading any data.
+
+    The new array defines its subspace of the netCDF variable, and
+    data are only read from the file when the new array is indexed,
+    at which time only the requested elements are read. Successive
+    subspaces are composed, so that ``a._subspace(i)._subspace(j)``
+    identifies exactly the same elements as ``a[i][j]``.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `__getitem__`
+
+    :Parameters:
+
+        indices:
+            The indices that define the subspace, as accepted by
+            `__getitem__`, except that each dimension's index must be
+            a `slice` object or a sequence of integers.
+
+    :Returns:
+
+        `{{class}}`
+            The subspaced array.
+
+    **Examples:**
+
+    >>> a.shape
+    (10, 20)
+    >>> b = a._subspace([slice(2, 8), [1, 3, 5, 6]])
+    >>> b.shape
+    (6, 4)
+    >>> c = b._subspace([slice(None, None, -2), [3, 0]])
+    >>> c.shape
+    (3, 2)
+    >>> (c.array == a.array[7:1:-2][:, [6, 1]]).all()
+    True
+
+        '''
+        ranges = self._get_component('indices', None)
+        if ranges is None:
+            ranges = [range(size) for size in self.shape]
+
+        if indices is not Ellipsis:
+            ranges = self._compose_ranges(ranges, indices)
+
+        shape = tuple(len(r) for r in ranges)
+
+        new = self.copy()
+        new._components = self._components.copy()
+        new._set_component('netcdf', None, copy=False)
+        new._set_component('indices', tuple(ranges), copy=False)
+        new._set_component('shape', shape, copy=False)
+        new._set_component('size', int(numpy.prod(shape)), copy=False)
+
+        return new
+
     # ----------------------------------------------------------------
     # Attributes
     # ----------------------------------------------------------------
@@ -424,6 +607,10 @@ class NetCDFArray(abstract.Array):
     def close(self):
         '''Close the `netCDF4.Dataset` for the file containing the data.
 
+    The dataset is returned to the process-wide pool of open files,
+    from which it may be reused by subsequent data array accesses. See
+    `{{package}}.file_pool_size` for details.
+
     .. versionadded:: (cfdm) 1.7.0
 
     :Returns:
@@ -439,7 +626,9 @@ class NetCDFArray(abstract.Array):
         if netcdf is None:
             return
 
-        netcdf.close()
+        if not file_pool.release(netcdf):
+            netcdf.close()
+
         self._set_component('netcdf', None, copy=False)
 
     @property
@@ -465,8 +654,14 @@ class NetCDFArray(abstract.Array):
     def open(self):
         '''Return an open `netCDF4.Dataset` for the file containing the array.
 
+    An idle dataset for the file is taken from the process-wide pool
+    of open files, if one is available, otherwise the file is
+    opened. See `{{package}}.file_pool_size` for details.
+
     .. versionadded:: (cfdm) 1.7.0
 
+    .. seealso:: `close`
+
     :Returns:
 
         `netCDF4.Dataset`
@@ -479,9 +674,11 @@ class NetCDFArray(abstract.Array):
     'eastward_wind'
 
         '''
-        if self._get_component('netcdf') is None:
+        netcdf = self._get_component('netcdf')
+        if netcdf is None:
+            filename = self.get_filename()
             try:
-                netcdf = netCDF4.Dataset(self.get_filename(), 'r')
+                netcdf = file_pool.acquire(filename)
             except RuntimeError as error:
                 raise RuntimeError("{}: {}".format(error, filename))
 
@@ -506,6 +703,6 @@ class NetCDFArray(abstract.Array):
     >>> b = a.to_memory()
 
         '''
-        return NumpyArray(self[...])
+        return NumpyArray(self[...], _owned=True)
 
 # --- End: class
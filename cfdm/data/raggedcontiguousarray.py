@@ -75,35 +75,61 @@ class RaggedContiguousArray(mixin.RaggedContiguous,
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress only the requested subspace
+        #
+        # The uncompressed array has dimensions (instance dimension,
+        # element dimension), followed by any uncompressed dimensions.
         # ------------------------------------------------------------
+        parsed_indices, dropped = self._parse_indices(indices)
+        u_instances, u_elements = parsed_indices[:2]
 
-        compressed_array = self._get_compressed_Array()
+        # Initialise the uncompressed subspace
+        uarray = numpy.ma.masked_all([i.size for i in parsed_indices],
+                                     dtype=self.dtype)
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        count_array, start_array = self._get_cached(
+            'count', self._count_arrays)
 
-        # --------------------------------------------------------
-        # Compression by contiguous ragged array
-        #
-        # The uncompressed array has dimensions (instance
-        # dimension, element dimension).
-        # --------------------------------------------------------
+        # Find the location in the sample dimension of the start of
+        # each requested instance
+        count = count_array[u_instances][:, numpy.newaxis]
+        start = start_array[u_instances]
+
+        # Find the locations in the sample dimension of the requested
+        # elements
+        elements = u_elements[numpy.newaxis, :]
+        exists = elements < count
+        samples = (start[:, numpy.newaxis] + elements)[exists]
+
+        if samples.size:
+            # Read the requested elements, and the requested parts of
+            # any trailing uncompressed dimensions
+            sample_indices = self._read_indices(indices, parsed_indices)
+            uarray[exists] = self._read_compressed(samples,
+                                                   sample_indices[1:])
+
+        if dropped:
+            uarray = uarray.squeeze(axis=dropped)
 
-        count_array = self.get_count().data.array
+        return uarray
 
-        start = 0
-        for i, n in enumerate(count_array):
-            n = int(n)
-            sample_indices = slice(start, start + n)
+    def _count_arrays(self):
+        '''Return the count variable and the start of each instance.
 
-            u_indices = (i,
-                         slice(0, sample_indices.stop - sample_indices.start))
+    .. versionadded:: (cfdm) 1.8.8.0
 
-            uarray[u_indices] = compressed_array[(sample_indices,)]
-            start += n
+    .. seealso:: `_get_cached`
 
-        return self.get_subspace(uarray, indices, copy=True)
+    :Returns:
+
+        `tuple`
+            The number of elements in each instance, and the location
+            in the sample dimension of the start of each instance.
+
+        '''
+        count_array = numpy.asanyarray(self.get_count().data.array,
+                                       dtype=int)
+        return count_array, numpy.cumsum(count_array) - count_array
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
@@ -73,31 +73,68 @@ class RaggedIndexedArray(mixin.RaggedIndexed,
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress only the requested subspace
+        #
+        # The uncompressed array has dimensions (instance dimension,
+        # element dimension), followed by any uncompressed dimensions.
         # ------------------------------------------------------------
+        parsed_indices, dropped = self._parse_indices(indices)
+        u_instances, u_elements = parsed_indices[:2]
 
-        compressed_array = self._get_compressed_Array()
+        # Initialise the uncompressed subspace
+        uarray = numpy.ma.masked_all([i.size for i in parsed_indices],
+                                     dtype=self.dtype)
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        order, start, size = self._get_cached('index', self._index_arrays)
 
-        # --------------------------------------------------------
-        # Compression by indexed ragged array.
-        #
-        # The uncompressed array has dimensions (instance
-        # dimension, element dimension).
-        # --------------------------------------------------------
-        index_array = self.get_index().data.array
+        # Find the run of each requested instance in the sample
+        # dimension sorted by instance
+        start = start[u_instances]
+        size = size[u_instances]
+
+        # Find the locations in the sample dimension of the requested
+        # elements of each requested instance
+        elements = u_elements[numpy.newaxis, :]
+        exists = elements < size[:, numpy.newaxis]
+        samples = order[(start[:, numpy.newaxis] + elements)[exists]]
+
+        if samples.size:
+            # Read the requested elements, and the requested parts of
+            # any trailing uncompressed dimensions
+            sample_indices = self._read_indices(indices, parsed_indices)
+            uarray[exists] = self._read_compressed(samples,
+                                                   sample_indices[1:])
+
+        if dropped:
+            uarray = uarray.squeeze(axis=dropped)
+
+        return uarray
+
+    def _index_arrays(self):
+        '''Return the sample dimension grouped by instance.
 
-        for i in range(uarray.shape[0]):
-            sample_dimension_indices = numpy.where(index_array == i)[0]
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_get_cached`
+
+    :Returns:
+
+        `tuple`
+            The sample dimension positions sorted by instance, and the
+            start and size of each instance's run within them.
+
+        '''
+        index_array = numpy.asanyarray(self.get_index().data.array,
+                                       dtype=int)
 
-            u_indices = (i,  # slice(i, i+1),
-                         slice(0, len(sample_dimension_indices)))
+        # A stable sort keeps each instance's elements in the order in
+        # which they appear in the sample dimension
+        order = numpy.argsort(index_array, kind='stable')
 
-            uarray[u_indices] = compressed_array[(sample_dimension_indices,)]
+        size = numpy.bincount(index_array, minlength=self.shape[0])
+        start = numpy.cumsum(size) - size
 
-        return self.get_subspace(uarray, indices, copy=True)
+        return order, start, size
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
@@ -82,56 +82,99 @@ class RaggedIndexedContiguousArray(mixin.RaggedContiguous,
 
         '''
         # ------------------------------------------------------------
-        # Method: Uncompress the entire array and then subspace it
+        # Method: Uncompress only the requested subspace
+        #
+        # The uncompressed array has dimensions (instance dimension,
+        # profile dimension, element dimension), followed by any
+        # uncompressed dimensions.
         # ------------------------------------------------------------
+        parsed_indices, dropped = self._parse_indices(indices)
+        u_instances, u_profiles, u_elements = parsed_indices[:3]
 
-        compressed_array = self._get_compressed_Array()
+        # Initialise the uncompressed subspace
+        uarray = numpy.ma.masked_all([i.size for i in parsed_indices],
+                                     dtype=self.dtype)
 
-        # Initialise the un-sliced uncompressed array
-        uarray = numpy.ma.masked_all(self.shape, dtype=self.dtype)
+        count_array, profile_start, profiles = self._get_cached(
+            'profiles', self._profile_arrays)
 
-        count_array = self.get_count().data.array
-        index_array = self.get_index().data.array
+        profiles = profiles[numpy.ix_(u_instances, u_profiles)]
+        profiles = profiles[..., numpy.newaxis]
 
-        # Loop over instances
-        for i in range(uarray.shape[0]):
+        # Find the locations in the sample dimension of the requested
+        # elements
+        elements = u_elements[numpy.newaxis, numpy.newaxis, :]
+        exists = elements < count_array[profiles]
+        samples = (profile_start[profiles] + elements)[exists]
 
-            # For all of the profiles in ths instance, find the
-            # locations in the count array of the number of elements
-            # in the profile
-            xprofile_indices = numpy.where(index_array == i)[0]
+        if samples.size:
+            # Read the requested elements, and the requested parts of
+            # any trailing uncompressed dimensions
+            sample_indices = self._read_indices(indices, parsed_indices)
+            uarray[exists] = self._read_compressed(samples,
+                                                   sample_indices[2:])
 
-            # Find the number of profiles in this instance
-            n_profiles = xprofile_indices.size
+        if dropped:
+            uarray = uarray.squeeze(axis=dropped)
 
-            # Loop over profiles in this instance
-            for j in range(uarray.shape[1]):
-                if j >= n_profiles:
-                    continue
+        return uarray
 
-                # Find the location in the count array of the number
-                # of elements in this profile
-                profile_index = xprofile_indices[j]
+    def _profile_arrays(self):
+        '''Return the locations of the profiles in the sample dimension.
 
-                if profile_index == 0:
-                    start = 0
-                else:
-                    start = int(count_array[:profile_index].sum())
+    .. versionadded:: (cfdm) 1.8.8.0
 
-                stop = start + int(count_array[profile_index])
+    .. seealso:: `_get_cached`
 
-                sample_indices = slice(start, stop)
-
-                u_indices = (i,  # slice(i, i+1),
-                             j,  # slice(j, j+1),
-                             slice(0, stop-start))
-                # slice(0, sample_indices.stop - sample_indices.start))
+    :Returns:
 
-                uarray[u_indices] = compressed_array[(sample_indices,)]
-            # --- End: for
-        # --- End: for
+        `tuple`
+            The number of elements in each profile, the location in
+            the sample dimension of the start of each profile, and
+            the profile of each uncompressed (instance, profile) pair.
+            A missing profile is flagged with -1, and is given zero
+            elements by a final zero appended to the first two
+            arrays.
 
-        return self.get_subspace(uarray, indices, copy=True)
+        '''
+        count_array = numpy.asanyarray(self.get_count().data.array,
+                                       dtype=int)
+        index_array = numpy.asanyarray(self.get_index().data.array,
+                                       dtype=int)
+
+        # Find the location in the sample dimension of the start of
+        # each profile
+        n_profiles = count_array.size
+        profile_start = numpy.cumsum(count_array) - count_array
+
+        # Find the position of each profile within its instance,
+        # i.e. the number of preceding profiles that belong to the
+        # same instance. A stable sort keeps each instance's profiles
+        # in the order in which they appear in the count array.
+        order = numpy.argsort(index_array, kind='stable')
+        sorted_index = index_array[order]
+        first = numpy.ones((n_profiles,), dtype=bool)
+        first[1:] = sorted_index[1:] != sorted_index[:-1]
+        group_start = numpy.maximum.accumulate(
+            numpy.where(first, numpy.arange(n_profiles), 0))
+
+        profile_position = numpy.empty((n_profiles,), dtype=int)
+        profile_position[order] = numpy.arange(n_profiles) - group_start
+
+        # Map each uncompressed (instance, profile) pair to its
+        # profile in the count array, ignoring profiles that do not
+        # fit into the uncompressed array.
+        profiles = numpy.full(self.shape[:2], -1, dtype=int)
+        fits = profile_position < self.shape[1]
+        profiles[index_array[fits], profile_position[fits]] = (
+            numpy.arange(n_profiles)[fits])
+
+        # Appending a zero-sized profile means that a missing profile,
+        # flagged with -1, contains no elements.
+        count_array = numpy.append(count_array, 0)
+        profile_start = numpy.append(profile_start, 0)
+
+        return count_array, profile_start, profiles
 
     def to_memory(self):
         '''Bring an array on disk into memory and retain it there.
@@ -4,10 +4,9 @@ from functools import (
 )
 
 from .functions import (
-    log_level,
-    _disable_logging,
-    _reset_log_emergence_level,
     _is_valid_log_level_int,
+    _log_level_override,
+    _verbosity_to_logging_level,
 )
 
 from .constants import ValidLogLevels
@@ -104,7 +103,7 @@ def _inplace_enabled_define_and_cleanup(instance):
     return x
 
 
-def _manage_log_level_via_verbosity(method_with_verbose_kwarg, calls=[0]):
+def _manage_log_level_via_verbosity(method_with_verbose_kwarg):
     '''A decorator for managing log message filtering by verbosity
     argument.
 
@@ -121,22 +120,18 @@ def _manage_log_level_via_verbosity(method_with_verbose_kwarg, calls=[0]):
     Only use this to decorate functions which make log calls directly
     and have a 'verbose' keyword argument set to None by default.
 
-    Note that the 'calls' keyword argument is to automatically track
-    the number of decorated functions that are being (or about to be)
-    executed, with the purpose of preventing resetting of the
-    effective log level at the completion of decorated functions that
-    are called inside other decorated functions (see comments in
-    'finally' statement for further explanation).  Note (when it is of
-    concern) that this approach may not be thread-safe.
+    Note that the overriding level is stored in a context variable
+    rather than being applied to the root logger, so that it applies
+    only to the thread or asynchronous task that made the call. Calls
+    made concurrently from other threads or tasks are therefore not
+    affected by it. Work that is passed to other threads must be run
+    in a copy of the current context (see `contextvars.copy_context`)
+    for the override to apply to it.
 
     '''
 
     @wraps(method_with_verbose_kwarg)
     def verbose_override_wrapper(self, *args, **kwargs):
-        # Increment indicates that one decorated function has started
-        # execution
-        calls[0] += 1
-
         # Deliberately error if verbose kwarg not set, if not by user
         # then as a default to the decorated function, as this is
         # crucial to usage.
@@ -166,44 +161,24 @@ def _manage_log_level_via_verbosity(method_with_verbose_kwarg, calls=[0]):
         elif verbose is False:
             verbose = 0  # corresponds to disabling logs i.e. no verbosity
 
-        # Override log levels for the function & all it calls (to
-        # reset at end)
-        if verbose is not None:  # None as default, note exclude True & False
-            if _is_valid_log_level_int(verbose):
-                _reset_log_emergence_level(verbose)
-            else:
-                raise ValueError(invalid_arg_msg)
+        # Override the log level for the function & all it calls in
+        # this context (to reset at end). None as default, in which
+        # case any override set by an enclosing decorated function
+        # continues to apply.
+        if verbose is None:
+            return method_with_verbose_kwarg(self, *args, **kwargs)
+
+        if not _is_valid_log_level_int(verbose):
+            raise ValueError(invalid_arg_msg)
 
-        # First need to (temporarily) re-enable global logging if
-        # disabled in the cases where you do not want to disable it
-        # anyway:
-        if (log_level() == 'DISABLE' and verbose not in (0, None)):
-            _disable_logging(at_level='NOTSET')  # enables all logging again
+        token = _log_level_override.set(_verbosity_to_logging_level(verbose))
 
-        # After method completes, re-set any changes to log level or
-        # enabling
+        # After method completes, re-set the override to its previous
+        # value, even if the method errors
         try:
             return method_with_verbose_kwarg(self, *args, **kwargs)
-        except Exception:
-            raise
-        finally:  # so that crucial 'teardown' code runs even if
-            # method errors Decrement indicates one decorated function
-            # has finished execution
-            calls[0] -= 1
-            # Due to the incrementing and decrementing of 'calls', it
-            # will only be zero when the outermost decorated method
-            # has finished, so the following condition prevents
-            # resetting occurring once inner functions complete (which
-            # would mean any subsequent code in the outer function
-            # would undesirably regain the global level):
-            if calls[0] == 0:
-                if verbose == 0:
-                    _disable_logging(at_level='NOTSET')  # lift deactivation
-                elif (verbose is not None and
-                      _is_valid_log_level_int(verbose)):
-                    _reset_log_emergence_level(log_level())
-                if log_level() == 'DISABLE' and verbose != 0:
-                    _disable_logging()  # disable again after re-enabling
+        finally:
+            _log_level_override.reset(token)
 
     return verbose_override_wrapper
 
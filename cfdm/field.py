@@ -1,5 +1,7 @@
 import logging
 
+import numpy
+
 from . import mixin
 from . import core
 from . import Constructs
@@ -8,8 +10,6 @@ from . import Count
 from . import Index
 from . import List
 
-from .constants import masked as cfdm_masked
-
 from .data import (
     RaggedContiguousArray,
     RaggedIndexedArray,
@@ -301,13 +301,12 @@ class Field(mixin.NetCDFVariable,
         indices = data._parse_indices(indices)
         indices = tuple(indices)
 
-        new = self.copy()  # data=False)
+        # Copy the field without any of its data, so that only the
+        # subspaced data are created
+        new = self.copy(data=False)
 
         data_axes = self.get_data_axes()
 
-        # Open any files that contained the original data (this not
-        # necessary, is an optimisation)
-
         # ------------------------------------------------------------
         # Subspace the field's data
         # ------------------------------------------------------------
@@ -321,30 +320,40 @@ class Field(mixin.NetCDFVariable,
             new.set_construct(domain_axis, key=key)
 
         # ------------------------------------------------------------
-        # Subspace other constructs that contain arrays
+        # Subspace other constructs that contain arrays, and restore
+        # the unchanged data of those that don't span the subspaced
+        # axes
         # ------------------------------------------------------------
-        self_constructs = self.constructs
-        new_constructs_data_axes = new.constructs.data_axes()
-
-        if data_axes:
-            for key, construct in new.constructs.filter_by_axis(
-                    'or', *data_axes).items():
-                needs_slicing = False
-                dice = []
-                for axis in new_constructs_data_axes[key]:
-                    if axis in data_axes:
-                        needs_slicing = True
-                        dice.append(indices[data_axes.index(axis)])
-                    else:
-                        dice.append(slice(None))
-                # --- End: for
+        self_constructs_data_axes = self.constructs.data_axes()
+
+        # Find the axes that are not being subspaced in their
+        # entirety
+        subspaced_axes = [
+            axis for axis, index, size in zip(data_axes, indices, shape)
+            if not (isinstance(index, slice) and
+                    index.indices(size) == (0, size, 1))
+        ]
+
+        for key, construct in self.constructs.filter_by_data().items():
+            needs_slicing = False
+            dice = []
+            for axis in self_constructs_data_axes.get(key, ()):
+                if axis in subspaced_axes:
+                    needs_slicing = True
+                    dice.append(indices[data_axes.index(axis)])
+                else:
+                    dice.append(slice(None))
+            # --- End: for
 
-                if needs_slicing:
-                    new.set_construct(construct[tuple(dice)],
-                                      key=key, copy=False)
-        # --- End: if
+            if needs_slicing:
+                construct = construct[tuple(dice)]
+            else:
+                construct = construct.copy()
+
+            new.set_construct(construct, key=key, copy=False)
+        # --- End: for
 
-        new.set_data(new_data, copy=False)
+        new.set_data(new_data, axes=data_axes, copy=False)
 
         return new
 
@@ -806,10 +815,23 @@ class Field(mixin.NetCDFVariable,
 
             * ``'gathered'``
 
-              Compression by gathering over any subset of the field
-              construct data dimensions.
+              Compression by gathering over any subset of adjacent
+              field construct data dimensions, given by the *axes*
+              parameter. The elements of the gathered dimensions for
+              which the field construct data are missing at all
+              positions of the other dimensions are removed to create
+              the compressed data. Metadata constructs whose data span
+              all of the gathered dimensions are also compressed.
 
-              *Not yet available.*
+        axes: (sequence of) `int`, optional
+            The positions of the field construct data dimensions to
+            be compressed by gathering. The dimensions must be
+            adjacent. Required, and only allowed, for compression by
+            gathering.
+
+            {{axes int examples}}
+
+            .. versionadded:: (cfdm) 1.8.8.0
 
         count_properties: `dict`, optional
             Provide properties to the count variable for contiguous
@@ -873,13 +895,61 @@ class Field(mixin.NetCDFVariable,
     [0 0 0 1 1 1 1 1 1 1 2 2 2 2 2 3 3 3 3 3 3 3 3 3]
     >>> {{package}}.write(g, 'compressed_file_indexed.nc')
 
+    >>> print(f.data.shape)
+    (12, 73, 96)
+    >>> g = f.compress('gathered', axes=[1, 2])
+    >>> g.data.get_compression_type()
+    'gathered'
+    >>> print(g.data.compressed_array.shape)
+    (12, 2381)
+    >>> g.data.get_list()
+    <{{repr}}List: (2381) >
+    >>> g.equals(f)
+    True
+
         '''
-        def _empty_compressed_data(data, shape):
-            return data.empty(shape=shape, dtype=data.dtype,
+        def _compressed_data(data, mask, ndim):
+            # Gather the elements of the data that are selected by the
+            # mask, which spans the first ndim dimensions of the data
+            # after they have been reshaped to the mask's shape
+            array = data.array
+            array = array.reshape(mask.shape + array.shape[ndim:])
+            return self._Data(array[mask], units=data.get_units(None),
+                              calendar=data.get_calendar(None))
+        # --- End: def
+
+        def _gathered_data(data, position, n, list_array):
+            # Gather the elements of the data at the positions given
+            # by the list array, after the n dimensions starting at
+            # the given position have been combined into one. None is
+            # returned if any non-missing values would be removed.
+            array = data.array
+            shape = array.shape
+            array = array.reshape(shape[:position] + (-1,) +
+                                  shape[position + n:])
+
+            removed = numpy.ones((array.shape[position],), dtype=bool)
+            removed[list_array] = False
+            if not numpy.ma.getmaskarray(array).compress(
+                    removed, axis=position).all():
+                return None
+
+            return self._Data(array.take(list_array, axis=position),
                               units=data.get_units(None),
                               calendar=data.get_calendar(None))
         # --- End: def
 
+        def _GatheredArray(self, compressed_data, data,
+                           compressed_dimension, list_variable):
+            return self._GatheredArray(
+                compressed_data,
+                shape=data.shape,
+                size=data.size,
+                ndim=data.ndim,
+                compressed_dimension=compressed_dimension,
+                list_variable=list_variable)
+        # --- End: def
+
         def _RaggedContiguousArray(self, compressed_data, data,
                                    count_variable):
             return self._RaggedContiguousArray(compressed_data,
@@ -910,18 +980,17 @@ class Field(mixin.NetCDFVariable,
                 index_variable=index_variable)
         # --- End: def
 
-        def _compress_metadata(f, method, count, N, axes, Array_func,
-                               **kwargs):
+        def _compress_metadata(f, mask, axes, Array_func, **kwargs):
             '''Compress metadata constructs for a field by a chosen method.
 
         :Parameters:
 
             f: `Field`
 
-            count: sequence of `int`
-
-            N: `int`
-                The number of elements in the compressed array.
+            mask: `numpy.ndarray`
+                The elements to retain in the compressed arrays. The
+                mask spans the metadata constructs' dimensions, with
+                all but the last dimension flattened into one.
 
             axes: sequence of `str`
 
@@ -934,9 +1003,6 @@ class Field(mixin.NetCDFVariable,
             `None`
 
             '''
-            if method == 'indexed_contiguous':
-                shape1 = f.data.shape[1]
-
             for key, c in f.constructs.filter_by_axis('or').items():
                 c_axes = f.get_data_axes(key)
                 if c_axes != axes:
@@ -944,39 +1010,15 @@ class Field(mixin.NetCDFVariable,
                     # exactly the same axes in the same order
                     continue
 
-                # Initialize the compressed data for the metadata
-                # construct
                 data = c.get_data(None)
-                if data is not None:
-                    compressed_data = _empty_compressed_data(data, (N,))
-
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == 'indexed_contiguous' and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                                data.flatten(range(data.ndim-1))):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(count,
-                                           data.flatten(range(data.ndim-1))):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                # --- End: if
+                if data is None:
+                    continue
+
+                ndim = data.ndim
 
                 # Insert the compressed data into the metadata
                 # construct
+                compressed_data = _compressed_data(data, mask, ndim)
                 y = Array_func(f, compressed_data, data=data,
                                **kwargs)
                 data._set_CompressedArray(y, copy=False)
@@ -986,37 +1028,9 @@ class Field(mixin.NetCDFVariable,
                     if data is None:
                         continue
 
-                    b_shape = data.shape[c.data.ndim:]
-                    compressed_data = _empty_compressed_data(
-                        data, (N,) + b_shape)
-
-                    # Populate the compressed data for the metadata
-                    # construct
-                    start = 0
-                    if method == 'indexed_contiguous' and c.data.ndim == 2:
-                        c_start = 0
-                        for i, d in enumerate(
-                                data.flatten(range(c.data.ndim-1))):
-                            c_start = shape1 * i
-                            c_end = c_start + shape1
-                            last = sum(n > 0 for n in count[c_start:c_end])
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    else:
-                        for last, d in zip(
-                                count, data.flatten(range(c.data.ndim-1))):
-                            if not last:
-                                continue
-
-                            end = start + last
-                            compressed_data[start:end] = d[:last]
-                            start += last
-                    # --- End: if
-
                     # Insert the compressed data into the metadata
-                    # construct
+                    # construct's bounds
+                    compressed_data = _compressed_data(data, mask, ndim)
                     y = Array_func(f, compressed_data, data=data,
                                    **kwargs)
                     data._set_CompressedArray(y, copy=False)
@@ -1064,51 +1078,72 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Compression by gathering
             # --------------------------------------------------------
-            pass
+            if axes is None:
+                raise ValueError(
+                    "Must specify the axes to be compressed by "
+                    "gathering")
+
+            try:
+                iaxes = sorted(f.data._parse_axes(axes))
+            except ValueError as error:
+                raise ValueError(
+                    "Can't compress by gathering: {}".format(error))
+
+            position = iaxes[0]
+            n = len(iaxes)
+            if iaxes != list(range(position, position + n)):
+                raise ValueError(
+                    "Can't compress by gathering: Axes must be "
+                    "adjacent. Got {}".format(axes))
+
+            # Find the elements of the gathered dimensions at which
+            # the data are not missing everywhere
+            not_missing = ~numpy.ma.getmaskarray(data.array)
+            other_axes = tuple(i for i in range(data.ndim)
+                               if i not in iaxes)
+            list_array = numpy.flatnonzero(
+                not_missing.any(axis=other_axes))
+
+            compressed_field_data = _gathered_data(data, position, n,
+                                                   list_array)
+        elif axes is not None:
+            raise ValueError(
+                "Can't set axes for {!r} compression".format(method))
         else:
             # --------------------------------------------------------
             # DSG compression
             # --------------------------------------------------------
-            flattened_data = data.flatten(range(data.ndim-1))
-
-            count = []
-            for d in flattened_data:
-                last = d.size
-                for i in d[::-1]:
-                    if i is not cfdm_masked:
-                        break
-                    else:
-                        last -= 1
-                # --- End: for
-
-                count.append(last)
-
-            N = sum(count)
-            compressed_field_data = _empty_compressed_data(data, (N,))
-
-            start = 0
-            for last, d in zip(count, flattened_data):
-                if not last:
-                    continue
-
-                end = start + last
-                compressed_field_data[start:end] = d[:last]
-                start += last
+            # Find the number of elements in each feature, i.e. the
+            # position after its last non-missing value, for the data
+            # flattened to 2 dimensions
+            size = data.shape[-1]
+            array = data.array.reshape(-1, size)
+            not_missing = ~numpy.ma.getmaskarray(array)
+            count = numpy.where(
+                not_missing.any(axis=1),
+                size - numpy.argmax(not_missing[:, ::-1], axis=1),
+                0)
+
+            # The elements to retain in the compressed data
+            mask = numpy.arange(size) < count[:, numpy.newaxis]
+
+            compressed_field_data = self._Data(
+                array[mask], units=data.get_units(None),
+                calendar=data.get_calendar(None))
         # --- End: if
 
         if method == 'contiguous':
             # --------------------------------------------------------
             # Ragged contiguous
             # --------------------------------------------------------
-            count_variable = self._Count(
-                properties=count_properties,
-                data=self._Data([n for n in count if n]))
+            count_variable = self._Count(properties=count_properties,
+                                         data=self._Data(count))
 
             x = _RaggedContiguousArray(self, compressed_field_data,
                                        data,
                                        count_variable=count_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, mask, f.get_data_axes(),
                                _RaggedContiguousArray,
                                count_variable=count_variable)
 
@@ -1116,23 +1151,15 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Ragged indexed
             # --------------------------------------------------------
-            index_variable = self._Index(properties=index_properties,
-                                         data=self._Data.empty(shape=(N,),
-                                                               dtype=int))
-
-            start = 0
-            for i, (last, d) in enumerate(zip(count, flattened_data)):
-                if not last:
-                    continue
-
-                end = start + last
-                index_variable.data[start:end] = i
-                start += last
+            index_variable = self._Index(
+                properties=index_properties,
+                data=self._Data(numpy.repeat(numpy.arange(count.size),
+                                             count)))
 
             x = _RaggedIndexedArray(self, compressed_field_data, data,
                                     index_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, mask, f.get_data_axes(),
                                _RaggedIndexedArray,
                                index_variable=index_variable)
 
@@ -1140,33 +1167,34 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Ragged indexed contiguous
             # --------------------------------------------------------
-            index = []
-            shape1 = f.data.shape[1]
-            for i in range(f.data.shape[0]):
-                start = shape1 * i
-                end = start + shape1
-                index.extend([i] * sum(n > 0 for n in count[start:end]))
+            # The number of non-empty timeseries or trajectories in
+            # each feature
+            n_profiles = (count.reshape(f.data.shape[:2]) > 0).sum(axis=1)
 
             count_variable = self._Count(
                 properties=count_properties,
-                data=self._Data([n for n in count if n]))
-            index_variable = self._Index(properties=index_properties,
-                                         data=self._Data(index))
+                data=self._Data(count[count > 0]))
+            index_variable = self._Index(
+                properties=index_properties,
+                data=self._Data(numpy.repeat(
+                    numpy.arange(n_profiles.size), n_profiles)))
 
             x = _RaggedIndexedContiguousArray(self,
                                               compressed_field_data,
                                               data, count_variable,
                                               index_variable)
 
-            _compress_metadata(f, method, count, N, f.get_data_axes(),
+            _compress_metadata(f, mask, f.get_data_axes(),
                                _RaggedIndexedContiguousArray,
                                count_variable=count_variable,
                                index_variable=index_variable)
 
             # Compress metadata constructs that span the index axis,
             # but not the count axis.
-            _compress_metadata(f, method, count, len(index),
-                               f.get_data_axes()[:-1],
+            mask = (numpy.arange(f.data.shape[1]) <
+                    n_profiles[:, numpy.newaxis])
+
+            _compress_metadata(f, mask, f.get_data_axes()[:-1],
                                _RaggedIndexedArray,
                                index_variable=index_variable)
 
@@ -1174,8 +1202,47 @@ class Field(mixin.NetCDFVariable,
             # --------------------------------------------------------
             # Gathered
             # --------------------------------------------------------
-            raise ValueError(
-                "Compression by gathering is not yet available - sorry!")
+            list_variable = self._List(properties=list_properties,
+                                       data=self._Data(list_array))
+
+            x = _GatheredArray(self, compressed_field_data, data,
+                               compressed_dimension=position,
+                               list_variable=list_variable)
+
+            # Compress metadata constructs, other than dimension
+            # coordinate constructs, that span all of the gathered
+            # axes, unless that would remove any of their non-missing
+            # values
+            compressed_axes = f.get_data_axes()[position:position + n]
+            for key, c in f.constructs.filter_by_type(
+                    'auxiliary_coordinate',
+                    'cell_measure',
+                    'domain_ancillary',
+                    'field_ancillary').filter_by_axis(
+                        'and', *compressed_axes).items():
+                datas = [c.get_data(None)]
+                if c.has_bounds():
+                    datas.append(c.get_bounds_data(None))
+
+                datas = [d for d in datas if d is not None]
+
+                # The gathered axes are adjacent and in the same order
+                # as in the field's data, since the constructs have
+                # been transposed
+                c_position = f.get_data_axes(key).index(compressed_axes[0])
+
+                compressed_datas = [
+                    _gathered_data(d, c_position, n, list_array)
+                    for d in datas]
+                if any(d is None for d in compressed_datas):
+                    continue
+
+                for d, compressed_data in zip(datas, compressed_datas):
+                    y = _GatheredArray(self, compressed_data, d,
+                                       compressed_dimension=c_position,
+                                       list_variable=list_variable)
+                    d._set_CompressedArray(y, copy=False)
+            # --- End: for
 
         else:
             raise ValueError(
@@ -1,3 +1,4 @@
+import contextvars
 import logging
 import os
 import platform
@@ -28,6 +29,8 @@ from .docstring import _docstring_substitution_definitions
 
 from .constants import CONSTANTS, ValidLogLevels
 
+from .netcdffilepool import file_pool
+
 
 # --------------------------------------------------------------------
 # Merge core and non-core docstring substitution dictionaries without
@@ -40,7 +43,8 @@ _docstring_substitution_definitions = _subs
 del _subs
 
 
-def configuration(atol=None, rtol=None, log_level=None):
+def configuration(atol=None, rtol=None, log_level=None,
+                  file_pool_size=None):
     '''View or set any number of constants in the project-wide configuration.
 
     The full list of global constants that are provided in a dictionary to
@@ -49,6 +53,7 @@ def configuration(atol=None, rtol=None, log_level=None):
     * `atol`
     * `rtol`
     * `log_level`
+    * `file_pool_size`
 
     These are all constants that apply throughout `cfdm`, except for in
     specific functions only if overridden by the corresponding keyword
@@ -64,7 +69,7 @@ def configuration(atol=None, rtol=None, log_level=None):
 
     .. versionadded:: (cfdm) 1.8.6
 
-    .. seealso:: `atol`, `rtol`, `log_level`
+    .. seealso:: `atol`, `rtol`, `log_level`, `file_pool_size`
 
     :Parameters:
 
@@ -88,6 +93,13 @@ def configuration(atol=None, rtol=None, log_level=None):
             * ``'DETAIL'`` (``3``);
             * ``'DEBUG'`` (``-1``).
 
+        file_pool_size: `int` or `Constant`, optional
+            The new value of the maximum number of idle netCDF files
+            that are kept open for reuse. The default is to not change
+            the current value.
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
     :Returns:
 
          `Configuration`
@@ -102,11 +114,13 @@ def configuration(atol=None, rtol=None, log_level=None):
     >>> cfdm.configuration()
     <{{repr}}Configuration: {'atol': 2.220446049250313e-16,
                      'rtol': 2.220446049250313e-16,
-                     'log_level': 'WARNING'}>
+                     'log_level': 'WARNING',
+                     'file_pool_size': 16}>
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'WARNING'}
+     'log_level': 'WARNING',
+     'file_pool_size': 16}
 
     Make a change to one constant and see that it is reflected in the
     configuration:
@@ -116,7 +130,8 @@ def configuration(atol=None, rtol=None, log_level=None):
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'DEBUG'}
+     'log_level': 'DEBUG',
+     'file_pool_size': 16}
 
     Access specific values by key querying, noting the equivalency to
     using its bespoke function:
@@ -131,38 +146,46 @@ def configuration(atol=None, rtol=None, log_level=None):
     >>> print(cfdm.configuration(atol=5e-14, log_level='INFO'))
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'DEBUG'}
+     'log_level': 'DEBUG',
+     'file_pool_size': 16}
     >>> print(cfdm.configuration())
-    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO'}
+    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO',
+     'file_pool_size': 16}
 
     Set a single constant without using its bespoke function:
 
     >>> print(cfdm.configuration(rtol=1e-17))
-    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO'}
+    {'atol': 5e-14, 'rtol': 2.220446049250313e-16, 'log_level': 'INFO',
+     'file_pool_size': 16}
     >>> cfdm.configuration()
-    {'atol': 5e-14, 'rtol': 1e-17, 'log_level': 'INFO'}
+    {'atol': 5e-14, 'rtol': 1e-17, 'log_level': 'INFO',
+     'file_pool_size': 16}
 
     Use as a context manager:
 
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'WARNING'}
+     'log_level': 'WARNING',
+     'file_pool_size': 16}
     >>> with cfdm.configuration(atol=9, rtol=10):
     ...     print(cfdm.configuration())
     ...
-    {'atol': 9.0, 'rtol': 10.0, 'log_level': 'WARNING'}
+    {'atol': 9.0, 'rtol': 10.0, 'log_level': 'WARNING',
+     'file_pool_size': 16}
     >>> print(cfdm.configuration())
     {'atol': 2.220446049250313e-16,
      'rtol': 2.220446049250313e-16,
-     'log_level': 'WARNING'}
+     'log_level': 'WARNING',
+     'file_pool_size': 16}
 
     '''
     return _configuration(
         Configuration,
         new_atol=atol,
         new_rtol=rtol,
-        new_log_level=log_level
+        new_log_level=log_level,
+        new_file_pool_size=file_pool_size,
     )
 
 
@@ -204,6 +227,7 @@ def _configuration(_Configuration, **kwargs):
         'new_atol': atol,
         'new_rtol': rtol,
         'new_log_level': log_level,
+        'new_file_pool_size': file_pool_size,
     }
 
     old_values = {}
@@ -311,6 +335,59 @@ def _disable_logging(at_level=None):
         logging.disable(level=logging.CRITICAL)
 
 
+# The minimum severity of log messages that are shown in the current
+# thread or asynchronous task, overriding the global log level, or
+# None if the global log level applies. It is set for the duration of
+# calls to methods decorated with `_manage_log_level_via_verbosity`,
+# so that the verbosity of one call never affects concurrent calls.
+_log_level_override = contextvars.ContextVar('cfdm_log_level_override',
+                                             default=None)
+
+_logger_is_enabled_for = logging.Logger.isEnabledFor
+
+
+def _verbosity_to_logging_level(verbose):
+    '''Return the logging module level for a valid verbosity integer.
+
+    A verbosity of ``0`` (``'DISABLE'``) returns a level above
+    ``CRITICAL``, so that no log messages are shown.
+
+    '''
+    name = ValidLogLevels(verbose).name
+    if name == 'DISABLE':
+        return logging.CRITICAL + 1
+
+    return getattr(logging, name)
+
+
+def _is_enabled_for(logger, level):
+    '''Whether a logger would process a message of the given level.
+
+    This replaces `logging.Logger.isEnabledFor`. When a log level
+    override has been set for the current context by
+    `_manage_log_level_via_verbosity` then it is used in place of the
+    level of the root logger, and in place of any level at which
+    logging has been disabled, otherwise the standard check is made.
+
+    '''
+    override = _log_level_override.get()
+    if override is None:
+        return _logger_is_enabled_for(logger, level)
+
+    if override > logging.CRITICAL:
+        return False
+
+    # Find the logger that sets the effective level
+    while not logger.level and logger.parent is not None:
+        logger = logger.parent
+
+    if logger.parent is None:
+        # The effective level is that of the root logger
+        return level >= override
+
+    return level >= logger.level
+
+
 def environment(display=True, paths=True):
     '''Return the names, versions and paths of all dependencies.
 
@@ -1272,6 +1349,106 @@ class log_level(ConstantAccess):
         return arg
 
 
+class file_pool_size(ConstantAccess):
+    '''The maximum number of idle netCDF files that are kept open for
+    reuse.
+
+    Reading data from a netCDF file requires the file to be opened,
+    which can take much longer than reading a small subspace of one of
+    its variables. To avoid repeatedly opening the same files, open
+    files are kept in a process-wide pool after their data have been
+    read, and are reused by subsequent reads from any construct.
+
+    When the number of idle open files exceeds the pool size, the
+    least recently used files are closed. Files that have been
+    modified since they were opened are never reused. A pool size of
+    ``0`` disables the pool, so that every file is closed as soon as
+    its data have been read. Reducing the pool size immediately closes
+    any idle files beyond the new limit.
+
+    Note that a file that is open in the pool can not be overwritten
+    with the `netCDF4` package in the same process until it has been
+    closed, for instance by temporarily setting the pool size to
+    ``0``. Files written with `{{package}}.write` are closed in the
+    pool automatically.
+
+    The default pool size is ``16``.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `configuration`
+
+    :Parameters:
+
+        arg: `int` or `Constant`, optional
+            The new value of the pool size. The default is to not
+            change the current value.
+
+    :Returns:
+
+        `Constant`
+            The value prior to the change, or the current value if no
+            new value was specified.
+
+    **Examples:**
+
+    >>> {{package}}.{{class}}()
+    <{{repr}}Constant: 16>
+    >>> print({{package}}.{{class}}())
+    16
+
+    >>> old = {{package}}.{{class}}(64)
+    >>> {{package}}.{{class}}()
+    <{{repr}}Constant: 64>
+    >>> {{package}}.{{class}}(old)
+    <{{repr}}Constant: 64>
+    >>> {{package}}.{{class}}()
+    <{{repr}}Constant: 16>
+
+    Use as a context manager to close all idle files:
+
+    >>> with {{package}}.{{class}}(0):
+    ...     print({{package}}.{{class}}())
+    ...
+    0
+    >>> print({{package}}.{{class}}())
+    16
+
+    '''
+    _name = 'FILE_POOL_SIZE'
+
+    def _parse(cls, arg):
+        '''Parse a new constant value.
+
+    The idle files of the pool are trimmed to the new size.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        cls:
+            This class.
+
+        arg:
+            The given new constant value.
+
+    :Returns:
+
+            A version of the new constant value suitable for insertion
+            into the `CONSTANTS` dictionary.
+
+        '''
+        size = int(arg)
+        if size < 0:
+            raise ValueError(
+                "The file pool size must be a non-negative integer. "
+                "Got {!r}".format(arg))
+
+        file_pool.trim(size)
+
+        return size
+
+
 def ATOL(*new_atol):
     '''Alias for `cfdm.atol`.
 
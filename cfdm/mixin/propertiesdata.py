@@ -73,7 +73,7 @@ class PropertiesData(Properties):
     (1, 10, 1)
 
         '''
-        new = self.copy()
+        new = self.copy(data=False)
 
         data = self.get_data(None)
         if data is not None:
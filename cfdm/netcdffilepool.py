@@ -0,0 +1,361 @@
+import os
+import threading
+
+from collections import OrderedDict
+
+import netCDF4
+
+from .constants import CONSTANTS
+
+
+class NetCDFFilePool:
+    '''A process-wide pool of open, read-only `netCDF4.Dataset` handles.
+
+    Opening a netCDF file, and in particular a netCDF4/HDF5 file, is
+    expensive compared with reading a small subspace of one of its
+    variables. The pool keeps handles open after use so that
+    subsequent reads from the same file, from any `NetCDFArray` or
+    `NetCDFRead` instance, can reuse them.
+
+    A handle is checked out for exclusive use by `acquire` and
+    returned to the pool by `release`. Idle handles are retained in
+    least recently used order, and the least recently used idle
+    handles are closed whenever the number of idle handles exceeds the
+    pool size given by `cfdm.file_pool_size`. A pool size of zero
+    disables pooling, so that every handle is closed as soon as it is
+    released.
+
+    An idle handle is discarded, rather than reused, if its file has
+    been modified since it was opened, as judged by the file's inode,
+    size and modification time.
+
+    Handles inherited from a parent process are never used or closed
+    by a forked child process.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    '''
+    def __init__(self):
+        '''**Initialisation**
+
+        '''
+        # Idle handles in least recently used order, keyed by their
+        # identities. Each value is a tuple of (filename, signature,
+        # netCDF4.Dataset).
+        self._idle = OrderedDict()
+
+        # Handles that are currently checked out, keyed by their
+        # identities
+        self._in_use = {}
+
+        # Handles inherited from a parent process
+        self._forked = []
+
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+        if hasattr(os, 'register_at_fork'):
+            os.register_at_fork(after_in_child=self._after_fork)
+
+    def __len__(self):
+        '''The number of open handles in the pool.
+
+    x.__len__() <==> len(x)
+
+        '''
+        with self._lock:
+            return len(self._idle) + len(self._in_use)
+
+    # ----------------------------------------------------------------
+    # Private methods
+    # ----------------------------------------------------------------
+    def _after_fork(self):
+        '''Forget about any handles that were opened by a parent process.
+
+    The handles are retained, but never used or closed, so that
+    resources shared with the parent process are not disturbed.
+
+    :Returns:
+
+        `None`
+
+        '''
+        self._forked.extend(entry[2] for entry in self._idle.values())
+        self._forked.extend(entry[2] for entry in self._in_use.values())
+        self._idle = OrderedDict()
+        self._in_use = {}
+        self._lock = threading.RLock()
+        self._pid = os.getpid()
+
+    def _check_pid(self):
+        '''Reset the pool if it is being accessed from a forked process.
+
+    :Returns:
+
+        `None`
+
+        '''
+        if os.getpid() != self._pid:
+            self._after_fork()
+
+    @classmethod
+    def _close(cls, nc):
+        '''Close a `netCDF4.Dataset`, ignoring one that is already closed.
+
+    :Parameters:
+
+        nc: `netCDF4.Dataset`
+
+    :Returns:
+
+        `None`
+
+        '''
+        try:
+            nc.close()
+        except RuntimeError:
+            pass
+
+    @classmethod
+    def _filename(cls, filename):
+        '''Return the key used by the pool for a file name.
+
+    :Parameters:
+
+        filename: `str`
+
+    :Returns:
+
+        `str`
+
+        '''
+        if filename.startswith(('http://', 'https://')):
+            return filename
+
+        return os.path.abspath(filename)
+
+    @classmethod
+    def _signature(cls, filename):
+        '''Return an identifier of the current state of a file.
+
+    :Parameters:
+
+        filename: `str`
+
+    :Returns:
+
+        `tuple` or `None`
+            The file's inode, size and modification time, or `None` if
+            the file can not be inspected (as is the case for an
+            OPeNDAP URL).
+
+        '''
+        try:
+            stat = os.stat(filename)
+        except (OSError, ValueError):
+            return None
+
+        return (stat.st_ino, stat.st_size, stat.st_mtime_ns)
+
+    # ----------------------------------------------------------------
+    # Methods
+    # ----------------------------------------------------------------
+    def acquire(self, filename):
+        '''Check out an open, read-only handle for a netCDF file.
+
+    An idle handle for the file is reused if one exists and the file
+    has not been modified since it was opened, otherwise the file is
+    opened. The handle must be given back with `release` once it is no
+    longer required.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `release`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the netCDF file or OPeNDAP URL.
+
+    :Returns:
+
+        `netCDF4.Dataset`
+            The open dataset.
+
+    **Examples:**
+
+    >>> nc = pool.acquire('file.nc')
+    >>> variable = nc.variables['tas']
+    >>> pool.release(nc)
+    True
+
+        '''
+        key = self._filename(filename)
+        signature = self._signature(key)
+
+        with self._lock:
+            self._check_pid()
+
+            found = None
+            stale = []
+            for nc_id, (name, sig, nc) in reversed(self._idle.items()):
+                if name != key:
+                    continue
+
+                if sig == signature and nc.isopen():
+                    found = nc_id
+                    break
+
+                stale.append(nc_id)
+            # --- End: for
+
+            for nc_id in stale:
+                self._close(self._idle.pop(nc_id)[2])
+
+            if found is not None:
+                entry = self._idle.pop(found)
+                self._in_use[found] = entry
+                return entry[2]
+        # --- End: with
+
+        nc = netCDF4.Dataset(filename, 'r')
+
+        with self._lock:
+            self._in_use[id(nc)] = (key, signature, nc)
+
+        return nc
+
+    def release(self, nc):
+        '''Give back a handle that was checked out with `acquire`.
+
+    The handle is retained as an idle handle, unless the pool size is
+    zero in which case it is closed. The least recently used idle
+    handles are closed if the pool is over its size limit.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `acquire`
+
+    :Parameters:
+
+        nc: `netCDF4.Dataset`
+            The handle to be released.
+
+    :Returns:
+
+        `bool`
+            `True` if the handle belongs to the pool, `False`
+            otherwise. A handle that does not belong to the pool is
+            not closed.
+
+    **Examples:**
+
+    >>> nc = pool.acquire('file.nc')
+    >>> pool.release(nc)
+    True
+    >>> pool.release(netCDF4.Dataset('file.nc'))
+    False
+
+        '''
+        with self._lock:
+            self._check_pid()
+
+            entry = self._in_use.pop(id(nc), None)
+            if entry is None:
+                return False
+
+            if nc.isopen():
+                self._idle[id(nc)] = entry
+                self.trim()
+        # --- End: with
+
+        return True
+
+    def close(self, filename=None):
+        '''Close idle handles.
+
+    Handles that are currently checked out are not closed, but will
+    not be returned to the pool when they are released.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`, optional
+            Only close handles for this file. By default all idle
+            handles are closed.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> pool.close('file.nc')
+    >>> pool.close()
+
+        '''
+        if filename is not None:
+            filename = self._filename(filename)
+
+        with self._lock:
+            self._check_pid()
+
+            for nc_id, (name, _, nc) in tuple(self._idle.items()):
+                if filename is None or name == filename:
+                    del self._idle[nc_id]
+                    self._close(nc)
+            # --- End: for
+
+            for nc_id, (name, sig, nc) in tuple(self._in_use.items()):
+                if filename is None or name == filename:
+                    # Give the checked out handle a signature that can
+                    # never match, so that it is closed on its next
+                    # reuse attempt
+                    self._in_use[nc_id] = (name, False, nc)
+
+    def trim(self, size=None):
+        '''Close least recently used idle handles to fit the pool size.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        size: `int`, optional
+            The maximum number of idle handles to retain. By default
+            the value of `cfdm.file_pool_size` is used.
+
+    :Returns:
+
+        `None`
+
+    **Examples:**
+
+    >>> pool.trim()
+    >>> pool.trim(0)
+
+        '''
+        if size is None:
+            size = CONSTANTS['FILE_POOL_SIZE']
+
+        with self._lock:
+            while len(self._idle) > size:
+                _, (_, _, nc) = self._idle.popitem(last=False)
+                self._close(nc)
+
+# --- End: class
+
+
+'''The process-wide pool of open netCDF files that is shared by all
+`NetCDFArray` and `NetCDFRead` instances.
+
+'''
+file_pool = NetCDFFilePool()
+
+
+'''A process-wide lock that serialises access to the netCDF-C library,
+which is not thread-safe, by code that may be run concurrently in
+different threads.
+
+'''
+netcdf_lock = threading.RLock()
@@ -1,5 +1,6 @@
 from .abstract import (IO,
                        IORead,
                        IOWrite)
-from .read import read
+from .cache import clear_read_cache
+from .read import read, read_many
 from .write import write
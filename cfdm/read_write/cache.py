@@ -0,0 +1,291 @@
+import glob
+import hashlib
+import os
+import pickle
+import tempfile
+
+from ..core import __version__
+
+
+def _cache_directory(cache):
+    '''Return the directory of the read cache.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        cache: `bool` or `str`
+            The *cache* parameter of `cfdm.read`. If `True` then the
+            default directory is used, which is the ``cfdm``
+            subdirectory of the directory given by the
+            ``XDG_CACHE_HOME`` environment variable, or of
+            ``~/.cache`` if the variable is not set. Otherwise it is
+            the name of the directory.
+
+    :Returns:
+
+        `str`
+            The absolute path of the directory.
+
+    '''
+    if cache is True:
+        cache = os.path.join(
+            os.environ.get('XDG_CACHE_HOME', os.path.join('~', '.cache')),
+            'cfdm')
+
+    return os.path.abspath(os.path.expanduser(os.path.expandvars(cache)))
+
+
+def _file_key(filename):
+    '''Return the name stem of the cache entries for a file.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The absolute path of the file.
+
+    :Returns:
+
+        `str`
+
+    '''
+    return hashlib.sha1(filename.encode('utf-8')).hexdigest()
+
+
+def _file_stat(filename):
+    '''Return the properties of a file that identify its contents.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The name of the file.
+
+    :Returns:
+
+        `tuple`
+            The file's absolute path, modification time in
+            nanoseconds and size in bytes.
+
+    '''
+    filename = os.path.abspath(filename)
+    stat = os.stat(filename)
+    return (filename, stat.st_mtime_ns, stat.st_size)
+
+
+def _entry_name(directory, filename, options):
+    '''Return the file name of a cache entry.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        directory: `str`
+            The directory of the cache.
+
+        filename: `str`
+            The absolute path of the dataset.
+
+        options: `tuple`
+            The read options that affect the returned field
+            constructs.
+
+    :Returns:
+
+        `str`
+
+    '''
+    options = hashlib.sha1(repr(options).encode('utf-8')).hexdigest()
+    return os.path.join(directory, '{}-{}.pickle'.format(
+        _file_key(filename), options))
+
+
+def _signature(filename, external):
+    '''Return the signature of a dataset and its external files.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The name of the dataset.
+
+        external: sequence of `str`
+            The names of the external files.
+
+    :Returns:
+
+        `tuple`
+
+    '''
+    return (__version__, _file_stat(filename),
+            tuple(_file_stat(f) for f in external))
+
+
+def load(cache, filename, external, options):
+    '''Load the field constructs of a dataset from the read cache.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        cache: `bool` or `str`
+            The *cache* parameter of `cfdm.read`.
+
+        filename: `str`
+            The name of the dataset.
+
+        external: sequence of `str`
+            The names of the external files.
+
+        options: `tuple`
+            The read options that affect the returned field
+            constructs.
+
+    :Returns:
+
+        `list` or `None`
+            The field constructs, or `None` if there is no valid
+            cache entry for the dataset.
+
+    '''
+    filename = os.path.abspath(filename)
+    entry = _entry_name(_cache_directory(cache), filename, options)
+
+    try:
+        with open(entry, 'rb') as fh:
+            signature = pickle.load(fh)
+            if signature != _signature(filename, external):
+                # The entry is stale
+                return None
+
+            return pickle.load(fh)
+    except Exception:
+        # The entry does not exist or is unreadable, in which case it
+        # will be overwritten
+        return None
+
+
+def save(cache, filename, external, options, fields):
+    '''Save the field constructs of a dataset to the read cache.
+
+    The entry is written to a temporary file that is then renamed, so
+    that concurrent readers never see an incomplete entry. Failure to
+    write the entry is not an error.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        cache: `bool` or `str`
+            The *cache* parameter of `cfdm.read`.
+
+        filename: `str`
+            The name of the dataset.
+
+        external: sequence of `str`
+            The names of the external files.
+
+        options: `tuple`
+            The read options that affect the returned field
+            constructs.
+
+        fields: `list`
+            The field constructs read from the dataset.
+
+    :Returns:
+
+        `None`
+
+    '''
+    filename = os.path.abspath(filename)
+    directory = _cache_directory(cache)
+
+    try:
+        os.makedirs(directory, mode=0o700, exist_ok=True)
+
+        fd, tmpfile = tempfile.mkstemp(suffix='.tmp', dir=directory)
+        try:
+            with os.fdopen(fd, 'wb') as fh:
+                pickle.dump(_signature(filename, external), fh,
+                            protocol=pickle.HIGHEST_PROTOCOL)
+                pickle.dump(fields, fh, protocol=pickle.HIGHEST_PROTOCOL)
+
+            os.replace(tmpfile,
+                       _entry_name(directory, filename, options))
+        except BaseException:
+            os.remove(tmpfile)
+            raise
+    except (OSError, pickle.PicklingError):
+        pass
+
+
+def clear_read_cache(filenames=None, cache=True):
+    '''Remove entries from the read cache.
+
+    The read cache stores the field constructs read from datasets by
+    `cfdm.read` with the *cache* parameter. An entry is ignored, and
+    then replaced, whenever its dataset or external files have been
+    modified, or when the cfdm version has changed, so clearing the
+    cache is only needed to reclaim disk space or to discard entries
+    that are known to be invalid for other reasons, for instance for
+    a dataset that was modified without changing its size or
+    modification time.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cfdm.read`
+
+    :Parameters:
+
+        filenames: (sequence of) `str`, optional
+            Only remove the entries of these datasets. By default all
+            entries are removed.
+
+        cache: `bool` or `str`, optional
+            The cache directory, as given by the *cache* parameter of
+            `cfdm.read`. By default the default directory is used.
+
+    :Returns:
+
+        `int`
+            The number of removed entries.
+
+    **Examples:**
+
+    >>> f = cfdm.read('file.nc', cache=True)
+    >>> cfdm.clear_read_cache('file.nc')
+    1
+    >>> cfdm.clear_read_cache()
+    0
+
+    '''
+    directory = _cache_directory(cache)
+
+    if filenames is None:
+        patterns = ['*.pickle']
+    else:
+        if isinstance(filenames, str):
+            filenames = (filenames,)
+
+        patterns = [
+            _file_key(os.path.abspath(os.path.expanduser(
+                os.path.expandvars(filename)))) + '-*.pickle'
+            for filename in filenames
+        ]
+
+    n = 0
+    for pattern in patterns:
+        for entry in glob.glob(os.path.join(directory, pattern)):
+            try:
+                os.remove(entry)
+            except FileNotFoundError:
+                continue
+
+            n += 1
+    # --- End: for
+
+    return n
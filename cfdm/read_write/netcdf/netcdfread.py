@@ -22,6 +22,10 @@ from ...decorators import _manage_log_level_via_verbosity
 
 from ...functions import log_level
 
+from ...data import NetCDFArray
+
+from ...netcdffilepool import file_pool, netcdf_lock
+
 from .. import IORead
 
 from . import constants
@@ -270,7 +274,8 @@ class NetCDFRead(IORead):
         '''Close all netCDF files that have been opened.
 
     Includes the input file being read, any external files, and any
-    temporary flattened files.
+    temporary flattened files. Files that were opened from the
+    process-wide file pool are returned to it, rather than closed.
 
     :Returns:
 
@@ -282,7 +287,8 @@ class NetCDFRead(IORead):
 
         '''
         for nc in self.read_vars['datasets']:
-            nc.close()
+            if not file_pool.release(nc):
+                nc.close()
 
         # Close temporary flattened files
         for flat_file in self.read_vars['flat_files']:
@@ -294,6 +300,9 @@ class NetCDFRead(IORead):
     If the file has hierarchical groups then a flattened version of it
     is returned, and the original grouped file remains open.
 
+    The file is taken from the process-wide pool of open files, if it
+    is available there.
+
     .. versionadded:: (cfdm) 1.7.0
 
     :Paramters:
@@ -319,7 +328,7 @@ class NetCDFRead(IORead):
 
         '''
         try:
-            nc = netCDF4.Dataset(filename, 'r')
+            nc = file_pool.acquire(filename)
         except RuntimeError as error:
             raise RuntimeError("{}: {}".format(error, filename))
 
@@ -348,7 +357,7 @@ class NetCDFRead(IORead):
                                      lax_mode=True,
                                      _copy_data=False)
 
-            nc.close()
+            file_pool.release(nc)
             nc = flat_nc
 
             g['has_groups'] = True
@@ -489,6 +498,158 @@ class NetCDFRead(IORead):
 
         return cdl
 
+    def copy_fields(self, fields, original, filename, mask=True):
+        '''Copy fields read from a netCDF file, taking their data from
+    another netCDF file with the same header.
+
+    This allows the fields of a file to be created without reading
+    it, when the fields of another file with an identical
+    `header_signature` have already been read. The data of the copies
+    are read lazily from the new file, and data that were read into
+    memory when the original fields were created (such as those of
+    scalar coordinate variables that were converted to dimension
+    coordinate constructs) are read again from the new file.
+
+    The fields must not contain compressed data or have come from a
+    file with hierarchical groups, since their structure may also
+    depend on data values in the file.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `header_signature`, `read`
+
+    :Parameters:
+
+        fields: sequence of field constructs
+            The fields read from the *original* file.
+
+        original: `str`
+            The name of the file from which the fields were read.
+
+        filename: `str`
+            The name of the file from which the copies take their
+            data.
+
+        mask: `bool`, optional
+            The value of the *mask* parameter that was used to read
+            the fields. See `read` for details.
+
+    :Returns:
+
+        `list`
+            The copied fields.
+
+    **Examples:**
+
+    >>> f = r.read('file1.nc')
+    >>> if r.header_signature('file2.nc') == r.header_signature('file1.nc'):
+    ...     g = r.copy_fields(f, 'file1.nc', 'file2.nc')
+
+        '''
+        implementation = self.implementation
+
+        out = []
+        for f in fields:
+            f = f.copy()
+
+            variables = [f]
+            variables.extend(
+                implementation.get_constructs(f, data=True).values())
+
+            for construct in (
+                    tuple(implementation.get_coordinates(f).values()) +
+                    tuple(implementation.get_domain_ancillaries(f).values())):
+                bounds = implementation.get_bounds(construct, None)
+                if bounds is not None:
+                    variables.append(bounds)
+            # --- End: for
+
+            for variable in variables:
+                data = implementation.get_data(variable, None)
+                if data is None:
+                    continue
+
+                array = data.source(None)
+                if isinstance(array, NetCDFArray):
+                    if array.get_filename() != original:
+                        # Data from an external file
+                        continue
+
+                    array = implementation.initialise_NetCDFArray(
+                        filename=filename,
+                        ncvar=array.get_ncvar(),
+                        group=array.get_group(),
+                        dtype=array.dtype,
+                        ndim=array.ndim,
+                        shape=array.shape,
+                        size=array.size,
+                        mask=array.get_mask())
+                else:
+                    ncvar = implementation.nc_get_variable(variable, None)
+                    if ncvar is None:
+                        continue
+
+                    array = self._read_variable(filename, ncvar, mask=mask)
+                    if array.size != data.size:
+                        raise ValueError(
+                            "Can't copy fields from {} to {}: {!r} has a "
+                            "different size".format(original, filename,
+                                                    ncvar))
+
+                    array = array.reshape(data.shape)
+                # --- End: if
+
+                data._set_Array(array, copy=False)
+            # --- End: for
+
+            out.append(f)
+
+        return out
+
+    @classmethod
+    def header_signature(cls, filename):
+        '''Return a description of the header of a netCDF file.
+
+    The description comprises the file format and the names, sizes
+    and attributes of every dimension, variable and group. Two files
+    with equal header signatures differ, at most, in the values of
+    their variables' data.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `copy_fields`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the netCDF file or OPeNDAP URL.
+
+    :Returns:
+
+        `tuple`
+            The header signature, which may be used as a dictionary
+            key.
+
+    **Examples:**
+
+    >>> r.header_signature('file1.nc') == r.header_signature('file2.nc')
+    True
+
+        '''
+        with netcdf_lock:
+            try:
+                nc = file_pool.acquire(filename)
+            except RuntimeError as error:
+                raise RuntimeError("{}: {}".format(error, filename))
+
+            try:
+                signature = (nc.data_model, cls._group_signature(nc))
+            finally:
+                file_pool.release(nc)
+        # --- End: with
+
+        return signature
+
     def default_netCDF_fill_value(self, ncvar):
         '''The default netCDF fill value for a variable.
 
@@ -753,12 +914,13 @@ class NetCDFRead(IORead):
         # Open the netCDF file to be read
         # ------------------------------------------------------------
         nc = self.file_open(filename, flatten=True, verbose=None)
-        logger.info(
-            "Reading netCDF file: {}".format(filename)
-        )  # pragma: no cover
-        logger.info(
-            "    Input netCDF dataset:\n        {}\n".format(nc)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "Reading netCDF file: {}".format(filename)
+            )  # pragma: no cover
+            logger.info(
+                "    Input netCDF dataset:\n        {}\n".format(nc)
+            )  # pragma: no cover
 
         # ----------------------------------------------------------------
         # Put the file's global attributes into the global
@@ -781,10 +943,11 @@ class NetCDFRead(IORead):
         # --- End: for
 
         g['global_attributes'] = global_attributes
-        logger.debug(
-            "    Global attributes:\n" +
-            pformat(g['global_attributes'], indent=4)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "    Global attributes:\n" +
+                pformat(g['global_attributes'], indent=4)
+            )  # pragma: no cover
 
         # ------------------------------------------------------------
         # Find the CF version for the file
@@ -1038,11 +1201,12 @@ class NetCDFRead(IORead):
                 for name, value in variable_dimensions.items()
             }
 
-        logger.debug("    General read variables:")  # pragma: no cover
-        logger.debug(
-            "        read_vars['variable_dimensions'] =\n" +
-            pformat(variable_dimensions, indent=12)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    General read variables:")  # pragma: no cover
+            logger.debug(
+                "        read_vars['variable_dimensions'] =\n" +
+                pformat(variable_dimensions, indent=12)
+            )  # pragma: no cover
 
         # The netCDF attributes for each variable
         #
@@ -1132,50 +1296,51 @@ class NetCDFRead(IORead):
         #       '/forecasts/model/t': 't'}
         g['dimension_basename'] = dimension_basename
 
-        logger.debug(
-            "        read_vars['dimension_isunlimited'] =\n" +
-            pformat(g['dimension_isunlimited'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['internal_dimension_sizes'] =\n" +
-            pformat(g['internal_dimension_sizes'], indent=12)
-        )  # pragma: no cover
-
-        logger.debug("    Groups read vars:")  # pragma: no cover
-        logger.debug(
-            "        read_vars['variable_groups'] =\n" +
-            pformat(g['variable_groups'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['variable_basename'] =\n" +
-            pformat(variable_basename, indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['dimension_groups'] =\n" +
-            pformat(g['dimension_groups'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['dimension_basename'] =\n" +
-            pformat(g['dimension_basename'], indent=12)
-        )  # pragma: no cover
-
-        logger.debug(
-            "        read_vars['flattener_variables'] =\n" +
-            pformat(g['flattener_variables'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['flattener_dimensions'] =\n" +
-            pformat(g['flattener_dimensions'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['flattener_attributes'] =\n" +
-            pformat(g['flattener_attributes'], indent=12)
-        )  # pragma: no cover
-
-        logger.debug(
-            "    netCDF dimensions: " +
-            pformat(internal_dimension_sizes)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "        read_vars['dimension_isunlimited'] =\n" +
+                pformat(g['dimension_isunlimited'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['internal_dimension_sizes'] =\n" +
+                pformat(g['internal_dimension_sizes'], indent=12)
+            )  # pragma: no cover
+
+            logger.debug("    Groups read vars:")  # pragma: no cover
+            logger.debug(
+                "        read_vars['variable_groups'] =\n" +
+                pformat(g['variable_groups'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['variable_basename'] =\n" +
+                pformat(variable_basename, indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['dimension_groups'] =\n" +
+                pformat(g['dimension_groups'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['dimension_basename'] =\n" +
+                pformat(g['dimension_basename'], indent=12)
+            )  # pragma: no cover
+
+            logger.debug(
+                "        read_vars['flattener_variables'] =\n" +
+                pformat(g['flattener_variables'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['flattener_dimensions'] =\n" +
+                pformat(g['flattener_dimensions'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['flattener_attributes'] =\n" +
+                pformat(g['flattener_attributes'], indent=12)
+            )  # pragma: no cover
+
+            logger.debug(
+                "    netCDF dimensions: " +
+                pformat(internal_dimension_sizes)
+            )  # pragma: no cover
 
         # ------------------------------------------------------------
         # List variables
@@ -1303,11 +1468,12 @@ class NetCDFRead(IORead):
                 g['do_not_create_field'].add(geometry_ncvar)
         # --- End: if
 
-        logger.debug("    Compression read vars:")  # pragma: no cover
-        logger.debug(
-            "        read_vars['compression'] =\n" +
-            pformat(g['compression'], indent=12)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    Compression read vars:")  # pragma: no cover
+            logger.debug(
+                "        read_vars['compression'] =\n" +
+                pformat(g['compression'], indent=12)
+            )  # pragma: no cover
 
         # ------------------------------------------------------------
         # Parse external variables (CF>=1.7)
@@ -1332,13 +1498,14 @@ class NetCDFRead(IORead):
         # Get external variables (CF>=1.7)
         # ------------------------------------------------------------
         if g['CF>=1.7']:
-            logger.info(
-                "    External variables: {}".format(
-                    sorted(g['external_variables']))
-            )  # pragma: no cover
-            logger.info(
-                "    External files    : {}".format(g['external_files']),
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    External variables: {}".format(
+                        sorted(g['external_variables']))
+                )  # pragma: no cover
+                logger.info(
+                    "    External files    : {}".format(g['external_files']),
+                )  # pragma: no cover
 
             if g['external_files'] and g['external_variables']:
                 self._get_variables_from_external_files(
@@ -1372,15 +1539,16 @@ class NetCDFRead(IORead):
                 )
         # --- End: if
 
-        logger.debug("    Reference read vars:")  # pragma: no cover
-        logger.debug(
-            "        read_vars['references'] =\n" +
-            pformat(g['references'], indent=12)
-        )  # pragma: no cover
-        logger.debug(
-            "        read_vars['referencers'] =\n" +
-            pformat(g['referencers'], indent=12)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("    Reference read vars:")  # pragma: no cover
+            logger.debug(
+                "        read_vars['references'] =\n" +
+                pformat(g['references'], indent=12)
+            )  # pragma: no cover
+            logger.debug(
+                "        read_vars['referencers'] =\n" +
+                pformat(g['referencers'], indent=12)
+            )  # pragma: no cover
 
         # ------------------------------------------------------------
         # Discard fields created from netCDF variables that are
@@ -1406,21 +1574,24 @@ class NetCDFRead(IORead):
                 fields[ncvar] = all_fields[ncvar]
         # --- End: for
 
-        logger.info(
-            "    Referenced netCDF variables:\n        "
-            + "\n        ".join(referenced_variables)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    Referenced netCDF variables:\n        "
+                + "\n        ".join(referenced_variables)
+            )  # pragma: no cover
         if g['do_not_create_field']:
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "        "
+                    + "\n        ".join(
+                        [ncvar
+                         for ncvar in sorted(g['do_not_create_field'])])
+                )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
             logger.info(
-                "        "
-                + "\n        ".join(
-                    [ncvar
-                     for ncvar in sorted(g['do_not_create_field'])])
+                "    Unreferenced netCDF variables:\n        " +
+                "\n        ".join(unreferenced_variables)
             )  # pragma: no cover
-        logger.info(
-            "    Unreferenced netCDF variables:\n        " +
-            "\n        ".join(unreferenced_variables)
-        )  # pragma: no cover
 
         # ------------------------------------------------------------
         # If requested, reinstate fields created from netCDF variables
@@ -1487,6 +1658,108 @@ class NetCDFRead(IORead):
         # ------------------------------------------------------------
         return out
 
+    @classmethod
+    def _attributes_signature(cls, x):
+        '''Return a description of the attributes of a netCDF object.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `header_signature`
+
+    :Parameters:
+
+        x: `netCDF4.Dataset`, `netCDF4.Group` or `netCDF4.Variable`
+
+    :Returns:
+
+        `tuple`
+
+        '''
+        out = []
+        for attr in x.ncattrs():
+            value = x.getncattr(attr)
+            if isinstance(value, (numpy.ndarray, numpy.generic)):
+                value = (value.dtype.str, numpy.shape(value),
+                         value.tobytes())
+
+            out.append((attr, value))
+
+        return tuple(out)
+
+    @classmethod
+    def _group_signature(cls, group):
+        '''Return a description of a netCDF group and its sub-groups.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `header_signature`
+
+    :Parameters:
+
+        group: `netCDF4.Dataset` or `netCDF4.Group`
+
+    :Returns:
+
+        `tuple`
+
+        '''
+        return (
+            tuple((name, dimension.size, dimension.isunlimited())
+                  for name, dimension in group.dimensions.items()),
+            tuple((name, str(variable.dtype), variable.dimensions,
+                   cls._attributes_signature(variable))
+                  for name, variable in group.variables.items()),
+            cls._attributes_signature(group),
+            tuple((name, cls._group_signature(subgroup))
+                  for name, subgroup in group.groups.items())
+        )
+
+    def _read_variable(self, filename, ncvar, mask=True):
+        '''Read the data of a netCDF variable in the root group of a
+    file.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `copy_fields`
+
+    :Parameters:
+
+        filename: `str`
+            The name of the netCDF file.
+
+        ncvar: `str`
+            The name of the netCDF variable.
+
+        mask: `bool`, optional
+            If False then do not mask by convention.
+
+    :Returns:
+
+        `numpy.ndarray`
+
+        '''
+        with netcdf_lock:
+            nc = file_pool.acquire(filename)
+            try:
+                variable = nc.variables.get(ncvar)
+                if variable is None:
+                    raise ValueError(
+                        "Can't read non-existent variable {!r} from "
+                        "{}".format(ncvar, filename))
+
+                ndim = variable.ndim
+                if variable.dtype != str and variable.dtype.kind in 'SU':
+                    # Remove the trailing string-length dimension
+                    ndim = max(ndim - 1, 0)
+            finally:
+                file_pool.release(nc)
+        # --- End: with
+
+        array = self.implementation.initialise_NetCDFArray(
+            filename=filename, ncvar=ncvar, ndim=ndim, mask=mask)
+
+        return array[...]
+
     def _check_valid(self, field, construct):
         '''Issue a warning if a construct with data has valid_[min|max|range]
     properties.
@@ -1717,9 +1990,10 @@ class NetCDFRead(IORead):
         '''
         g = self.read_vars
 
-        logger.info(
-            "        List variable: compress = {}".format(compress),
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "        List variable: compress = {}".format(compress),
+            )  # pragma: no cover
 
         gathered_ncdimension = g['variable_dimensions'][ncvar][0]
 
@@ -1761,10 +2035,11 @@ class NetCDFRead(IORead):
         '''
         g = self.read_vars
 
-        logger.info(
-            "    count variable: sample_dimension = {}".format(
-                sample_dimension),
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    count variable: sample_dimension = {}".format(
+                    sample_dimension),
+            )  # pragma: no cover
 
         instance_dimension = g['variable_dimensions'][ncvar][0]
 
@@ -1782,9 +2057,10 @@ class NetCDFRead(IORead):
         else:
             element_dimension = 'element'
 
-        logger.info(
-            "    featureType = {}".format(g['featureType'])
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    featureType = {}".format(g['featureType'])
+            )  # pragma: no cover
 
         element_dimension = self._set_ragged_contiguous_parameters(
                 elements_per_instance=elements_per_instance,
@@ -1837,9 +2113,10 @@ class NetCDFRead(IORead):
         else:
             element_dimension = 'element'
 
-        logger.info(
-            "    featureType = {}".format(g['featureType'])
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    featureType = {}".format(g['featureType'])
+            )  # pragma: no cover
 
         element_dimension = self._set_ragged_indexed_parameters(
             index=index,
@@ -1865,23 +2142,25 @@ class NetCDFRead(IORead):
     '''
         g = self.read_vars
 
-        logger.debug(
-            "    Pre-processing indexed and contiguous compression "
-            "for instance dimension: {}".format(instance_dimension)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "    Pre-processing indexed and contiguous compression "
+                "for instance dimension: {}".format(instance_dimension)
+            )  # pragma: no cover
 
         profile_dimension = g['compression'][sample_dimension][
             'ragged_contiguous']['profile_dimension']
 
-        logger.debug(
-            "        sample_dimension  : {}".format(sample_dimension)
-        )  # pragma: no cover
-        logger.debug(
-            "        instance_dimension: {}".format(instance_dimension)
-        )  # pragma: no cover
-        logger.debug(
-            "        profile_dimension : {}".format(profile_dimension)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "        sample_dimension  : {}".format(sample_dimension)
+            )  # pragma: no cover
+            logger.debug(
+                "        instance_dimension: {}".format(instance_dimension)
+            )  # pragma: no cover
+            logger.debug(
+                "        profile_dimension : {}".format(profile_dimension)
+            )  # pragma: no cover
 
         contiguous = g['compression'][sample_dimension]['ragged_contiguous']
         indexed = g['compression'][profile_dimension]['ragged_indexed']
@@ -1911,26 +2190,28 @@ class NetCDFRead(IORead):
             'element_dimension_2_size': element_dimension_2_size,
         }
 
-        logger.debug(
-            "    Created read_vars['compression'][{!r}]"
-            "['ragged_indexed_contiguous']".format(
-                  sample_dimension)
-        )  # pragma: no cover
-
-        logger.debug(
-            "    Implied dimensions: {} -> {}".format(
-                sample_dimension,
-                g['compression'][sample_dimension][
-                    'ragged_indexed_contiguous']['implied_ncdimensions']
-            )
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "    Created read_vars['compression'][{!r}]"
+                "['ragged_indexed_contiguous']".format(
+                      sample_dimension)
+            )  # pragma: no cover
+
+            logger.debug(
+                "    Implied dimensions: {} -> {}".format(
+                    sample_dimension,
+                    g['compression'][sample_dimension][
+                        'ragged_indexed_contiguous']['implied_ncdimensions']
+                )
+            )  # pragma: no cover
 
         del g['compression'][sample_dimension]['ragged_contiguous']
 
-        logger.debug(
-            "    Removed "
-            "read_vars['compression'][{!r}]['ragged_contiguous']".format(
-                sample_dimension))  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "    Removed "
+                "read_vars['compression'][{!r}]['ragged_contiguous']".format(
+                    sample_dimension))  # pragma: no cover
 
     def _parse_geometry(self, parent_ncvar, attributes):
         '''Parse a geometry container variable.
@@ -1976,14 +2257,16 @@ class NetCDFRead(IORead):
             g['variable_geometry'][parent_ncvar] = geometry_ncvar
             return
 
-        logger.info(
-            "    Geometry container = {!r}".format(geometry_ncvar)
-        )  # pragma: no cover
-        logger.debug(
-            "        netCDF attributes: {}".format(
-                 pformat(attributes[geometry_ncvar], indent=12)
-            )
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    Geometry container = {!r}".format(geometry_ncvar)
+            )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "        netCDF attributes: {}".format(
+                     pformat(attributes[geometry_ncvar], indent=12)
+                )
+            )  # pragma: no cover
 
         geometry_type = attributes[geometry_ncvar].get('geometry_type')
 
@@ -2004,22 +2287,23 @@ class NetCDFRead(IORead):
         parsed_part_node_count = self._split_string_by_white_space(
             geometry_ncvar, part_node_count, variables=True)
 
-        logger.info(
-            "        parsed_node_coordinates = {}".format(
-                parsed_node_coordinates)
-        )  # pragma: no cover
-        logger.info(
-            "        parsed_interior_ring    = {}".format(
-                parsed_interior_ring)
-        )  # pragma: no cover
-        logger.info(
-            "        parsed_node_count       = {}".format(
-                parsed_node_count)
-        )  # pragma: no cover
-        logger.info(
-            "        parsed_part_node_count  = {}".format(
-                parsed_part_node_count)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "        parsed_node_coordinates = {}".format(
+                    parsed_node_coordinates)
+            )  # pragma: no cover
+            logger.info(
+                "        parsed_interior_ring    = {}".format(
+                    parsed_interior_ring)
+            )  # pragma: no cover
+            logger.info(
+                "        parsed_node_count       = {}".format(
+                    parsed_node_count)
+            )  # pragma: no cover
+            logger.info(
+                "        parsed_part_node_count  = {}".format(
+                    parsed_part_node_count)
+            )  # pragma: no cover
 
         cf_compliant = True
 
@@ -2057,9 +2341,10 @@ class NetCDFRead(IORead):
         node_dimension = (
             g['variable_dimensions'][parsed_node_coordinates[0]][0])
 
-        logger.info(
-            "        node_dimension = {!r}".format(node_dimension)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "        node_dimension = {!r}".format(node_dimension)
+            )  # pragma: no cover
 
         if node_count is None:
             # --------------------------------------------------------
@@ -2136,34 +2421,33 @@ class NetCDFRead(IORead):
             parts = self._create_Count(ncvar=part_node_count,
                                        ncdim=part_dimension)
 
-            total_number_of_parts = self.implementation.get_data_size(parts)
-
             parts_data = self.implementation.get_data(parts)
 
             nodes_per_geometry_data = self.implementation.get_data(
                 nodes_per_geometry)
 
+            # --------------------------------------------------------
+            # Find the geometry to which each part belongs: a part
+            # belongs to the first geometry whose last node is at or
+            # after the part's last node. The same index also serves
+            # the interior ring variable, which spans the part
+            # dimension.
+            # --------------------------------------------------------
+            parts_array = self.implementation.get_array(parts_data)
+            last_node_of_part = numpy.cumsum(parts_array)
+            last_node_of_geometry = numpy.cumsum(
+                self.implementation.get_array(nodes_per_geometry_data))
+
+            index_array = numpy.searchsorted(last_node_of_geometry,
+                                             last_node_of_part)
+
             index = self.implementation.initialise_Index()
-            self.implementation.set_data(index, data=parts_data)
-
-            instance_index = 0
-            i = 0
-            for cell_no in range(self.implementation.get_data_size(
-                    nodes_per_geometry)):
-                n_nodes_in_this_cell = int(nodes_per_geometry_data[cell_no])
-
-                # Initialise partial_node_count, a running count of
-                # how many nodes there are in this geometry
-                n_nodes = 0
-
-                for k in range(i, total_number_of_parts):
-                    index.data[k] = instance_index
-                    n_nodes += int(parts_data[k])
-                    if n_nodes >= n_nodes_in_this_cell:
-                        instance_index += 1
-                        i += k + 1
-                        break
-            # --- End: for
+            self.implementation.set_data(
+                index,
+                data=self.implementation.initialise_Data(
+                    array=index_array.astype(parts_array.dtype),
+                    copy=False),
+                copy=False)
 
             element_dimension_1 = self._set_ragged_contiguous_parameters(
                 elements_per_instance=parts,
@@ -2350,11 +2634,12 @@ class NetCDFRead(IORead):
 
         g['new_dimensions'][element_dimension] = element_dimension_size
 
-        logger.debug(
-            "    Created "
-            "read_vars['compression'][{!r}]['ragged_indexed']".format(
-                indexed_sample_dimension)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "    Created "
+                "read_vars['compression'][{!r}]['ragged_indexed']".format(
+                    indexed_sample_dimension)
+            )  # pragma: no cover
 
         return element_dimension
 
@@ -2725,6 +3010,11 @@ class NetCDFRead(IORead):
         # Reset 'domain_ancillary_key'
         g['domain_ancillary_key'] = {}
 
+        # Reset 'vertical_crs', so that the datum of a grid mapping
+        # is only added to the vertical coordinate references of the
+        # same field
+        g['vertical_crs'] = {}
+
         nc = g['variable_dataset'][field_ncvar]
 
         dimensions = g['variable_dimensions'][field_ncvar]
@@ -2734,10 +3024,11 @@ class NetCDFRead(IORead):
             'non-compliance': {}
         }
 
-        logger.info(
-            "    Converting netCDF variable {}({}) to a Field:".format(
-                field_ncvar, ', '.join(dimensions))
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    Converting netCDF variable {}({}) to a Field:".format(
+                    field_ncvar, ', '.join(dimensions))
+            )  # pragma: no cover
 
         # ------------------------------------------------------------
         # Combine the global and group properties with the data
@@ -2753,10 +3044,11 @@ class NetCDFRead(IORead):
 
         field_properties.update(g['variable_attributes'][field_ncvar])
 
-        logger.debug(
-            "        netCDF attributes:\n" +
-            pformat(field_properties, indent=12)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                "        netCDF attributes:\n" +
+                pformat(field_properties, indent=12)
+            )  # pragma: no cover
 
         # Take cell_methods out of the data variable's properties
         # since it will need special processing once the domain has
@@ -2877,17 +3169,19 @@ class NetCDFRead(IORead):
                     self.implementation.get_construct_data_size(coord),
                     ncdim)
 
-                logger.detail(
-                    "        [a] Inserting {!r}".format(domain_axis)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [a] Inserting {!r}".format(domain_axis)
+                    )  # pragma: no cover
                 axis = self.implementation.set_domain_axis(
                     field=f,
                     construct=domain_axis,
                     copy=False)
 
-                logger.detail(
-                    "        [b] Inserting {!r}{}".format(coord, method)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [b] Inserting {!r}{}".format(coord, method)
+                    )  # pragma: no cover
                 dim = self.implementation.set_dimension_coordinate(
                     field=f, construct=coord,
                     axes=[axis], copy=False)
@@ -2917,9 +3211,10 @@ class NetCDFRead(IORead):
                     size = g['internal_dimension_sizes'][ncdim]
 
                 domain_axis = self._create_domain_axis(size, ncdim)
-                logger.detail(
-                    "        [c] Inserting {!r}".format(domain_axis)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [c] Inserting {!r}".format(domain_axis)
+                    )  # pragma: no cover
                 axis = self.implementation.set_domain_axis(
                     field=f,
                     construct=domain_axis,
@@ -2945,9 +3240,10 @@ class NetCDFRead(IORead):
 
         data = self._create_data(field_ncvar, f, unpacked_dtype=unpacked_dtype)
 
-        logger.detail(
-            "        [d] Inserting {!r}".format(data)
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.DETAIL):
+            logger.detail(
+                "        [d] Inserting {!r}".format(data)
+            )  # pragma: no cover
 
         self.implementation.set_data(f, data, axes=data_axes, copy=False)
 
@@ -2992,9 +3288,11 @@ class NetCDFRead(IORead):
                         # String valued scalar coordinate. T turn it
                         # into a 1-d auxiliary coordinate construct.
                         domain_axis = self._create_domain_axis(1)
-                        logger.detail(
-                            "        [d] Inserting {!r}".format(domain_axis)
-                        )  # pragma: no cover
+                        if logger.isEnabledFor(logging.DETAIL):
+                            logger.detail(
+                                "        [d] Inserting {!r}".format(
+                                    domain_axis)
+                            )  # pragma: no cover
                         dim = self.implementation.set_domain_axis(
                             f, domain_axis)
 
@@ -3027,17 +3325,19 @@ class NetCDFRead(IORead):
                     domain_axis = self._create_domain_axis(
                         self.implementation.get_construct_data_size(coord)
                     )
-                    logger.detail(
-                        "        [e] Inserting {!r}".format(domain_axis)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.DETAIL):
+                        logger.detail(
+                            "        [e] Inserting {!r}".format(domain_axis)
+                        )  # pragma: no cover
                     axis = self.implementation.set_domain_axis(
                         field=f,
                         construct=domain_axis,
                         copy=False)
 
-                    logger.detail(
-                        "        [e] Inserting {!r}".format(coord)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.DETAIL):
+                        logger.detail(
+                            "        [e] Inserting {!r}".format(coord)
+                        )  # pragma: no cover
                     dim = self.implementation.set_dimension_coordinate(
                         f, coord,
                         axes=[axis],
@@ -3057,9 +3357,10 @@ class NetCDFRead(IORead):
                     del g['auxiliary_coordinate'][ncvar]
                 else:
                     # Insert auxiliary coordinate
-                    logger.detail(
-                        "        [f] Inserting {!r}".format(coord)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.DETAIL):
+                        logger.detail(
+                            "        [f] Inserting {!r}".format(coord)
+                        )  # pragma: no cover
 
                     aux = self.implementation.set_auxiliary_coordinate(
                         f, coord, axes=dimensions, copy=False)
@@ -3115,9 +3416,10 @@ class NetCDFRead(IORead):
                     g['auxiliary_coordinate'][node_ncvar] = coord
 
                 # Insert auxiliary coordinate
-                logger.detail(
-                    "        [f] Inserting {!r}".format(coord)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [f] Inserting {!r}".format(coord)
+                    )  # pragma: no cover
 
                 # TODO check that geometry_dimension is a dimension of
                 # the data variable
@@ -3210,9 +3512,10 @@ class NetCDFRead(IORead):
 
             # Still here? Create a formula terms coordinate reference.
             for ncvar, domain_anc, axes in domain_ancillaries:
-                logger.detail(
-                    "        [g] Inserting {!r}".format(domain_anc)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [g] Inserting {!r}".format(domain_anc)
+                    )  # pragma: no cover
 
                 da_key = self.implementation.set_domain_ancillary(
                     field=f, construct=domain_anc, axes=axes, copy=False)
@@ -3239,9 +3542,10 @@ class NetCDFRead(IORead):
                 construct=coordinate_reference,
                 copy=False)
 
-            logger.detail(
-                "        [l] Inserting {!r}".format(coordinate_reference)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.DETAIL):
+                logger.detail(
+                    "        [l] Inserting {!r}".format(coordinate_reference)
+                )  # pragma: no cover
 
             g['vertical_crs'][key] = coordinate_reference
         # --- End: for
@@ -3322,10 +3626,11 @@ class NetCDFRead(IORead):
                             if vcoord in coordinates:
                                 # Add the datum to an already existing
                                 # vertical coordinate reference
-                                logger.detail(
-                                    "        [k] Inserting "
-                                    "{!r} into {!r}".format(datum, vcr)
-                                )  # pragma: no cover
+                                if logger.isEnabledFor(logging.DETAIL):
+                                    logger.detail(
+                                        "        [k] Inserting "
+                                        "{!r} into {!r}".format(datum, vcr)
+                                    )  # pragma: no cover
 
                                 self.implementation.set_datum(
                                     coordinate_reference=vcr,
@@ -3357,9 +3662,10 @@ class NetCDFRead(IORead):
                             construct=coordref,
                             copy=False)
 
-                        logger.detail(
-                            "        [l] Inserting {!r}".format(coordref)
-                        )  # pragma: no cover
+                        if logger.isEnabledFor(logging.DETAIL):
+                            logger.detail(
+                                "        [l] Inserting {!r}".format(coordref)
+                            )  # pragma: no cover
 
                         self._reference(grid_mapping_ncvar,
                                         field_ncvar)
@@ -3394,9 +3700,10 @@ class NetCDFRead(IORead):
                         cell = self._create_cell_measure(measure, ncvar)
                         g['cell_measure'][ncvar] = cell
 
-                    logger.detail(
-                        "        [h] Inserting {!r}".format(cell)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.DETAIL):
+                        logger.detail(
+                            "        [h] Inserting {!r}".format(cell)
+                        )  # pragma: no cover
 
                     key = self.implementation.set_cell_measure(
                         field=f, construct=cell,
@@ -3444,9 +3751,10 @@ class NetCDFRead(IORead):
                 cell_method = self._create_cell_method(
                     axes, method, properties)
 
-                logger.detail(
-                    "        [i] Inserting {!r}".format(cell_method)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.DETAIL):
+                    logger.detail(
+                        "        [i] Inserting {!r}".format(cell_method)
+                    )  # pragma: no cover
 
                 self.implementation.set_cell_method(field=f,
                                                     construct=cell_method,
@@ -3480,9 +3788,10 @@ class NetCDFRead(IORead):
                         g['field_ancillary'][ncvar] = field_anc
 
                     # Insert the field ancillary
-                    logger.detail(
-                        "        [j] Inserting {!r}".format(field_anc)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.DETAIL):
+                        logger.detail(
+                            "        [j] Inserting {!r}".format(field_anc)
+                        )  # pragma: no cover
                     key = self.implementation.set_field_ancillary(
                         field=f, construct=field_anc, axes=axes, copy=False)
                     self._reference(ncvar, field_ncvar)
@@ -3782,10 +4091,11 @@ class NetCDFRead(IORead):
         else:  # pragma: no cover
             dimensions = '(' + ', '.join(dimensions) + ')'  # pragma: no cover
 
-        logger.info(
-            "    Error processing netCDF variable {}{}: {}".format(
-                ncvar, dimensions, d['reason'])
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    Error processing netCDF variable {}{}: {}".format(
+                    ncvar, dimensions, d['reason'])
+            )  # pragma: no cover
 
         return d
 
@@ -5144,11 +5454,9 @@ class NetCDFRead(IORead):
         '''
         g = self.read_vars
 
-        variable = g['variables'][ncvar]
-
         ncdimensions = list(g['variable_dimensions'][ncvar])
 
-        if self._is_char(ncvar) and variable.ndim >= 1:
+        if self._is_char(ncvar) and ncdimensions:
             # Remove the trailing string-length dimension
             ncdimensions.pop()
 
@@ -5676,10 +5984,11 @@ class NetCDFRead(IORead):
 
             # Though an error of sorts, set as debug level message;
             # read not terminated
-            logger.debug(
-                "    Error processing netCDF variable {}: {}".format(
-                    field_ncvar, d['reason'])
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "    Error processing netCDF variable {}: {}".format(
+                        field_ncvar, d['reason'])
+                )  # pragma: no cover
 
             return False
 
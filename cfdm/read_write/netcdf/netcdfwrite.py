@@ -1,4 +1,6 @@
 import copy
+import hashlib
+import itertools
 import logging
 import os
 import re
@@ -15,6 +17,9 @@ from .. import IOWrite
 from . import constants
 
 from ...decorators import _manage_log_level_via_verbosity
+from ...functions import atol, rtol
+
+from ...netcdffilepool import file_pool, netcdf_lock
 
 
 logger = logging.getLogger(__name__)
@@ -23,6 +28,10 @@ logger = logging.getLogger(__name__)
 class NetCDFWrite(IOWrite):
     '''
     '''
+    # The approximate maximum number of bytes of data that are
+    # written to a netCDF variable at once. See `_data_blocks`.
+    _write_block_size = 2 ** 27
+
     def cf_description_of_file_contents_attributes(self):
         '''Description of file contents properties
 
@@ -149,7 +158,8 @@ class NetCDFWrite(IOWrite):
         ncvar_names = g['ncvar_names']
         ncdim_names = g['ncdim_to_size']
 
-        existing_names = g['ncvar_names'].union(ncdim_names)
+        def existing(name):
+            return name in ncvar_names or name in ncdim_names
 
         if dimsize is not None:
             if not role:
@@ -169,13 +179,19 @@ class NetCDFWrite(IOWrite):
                     return ncdim
         # --- End: if
 
-        if base in existing_names:
-            counter = g.setdefault('count_' + base, 1)
+        if existing(base):
+            # Names are never removed, so all names with a suffix
+            # less than the one previously found for this base are
+            # still in use
+            counters = g['name_counters']
+            counter = counters.get(base, 1)
 
             ncvar = '{0}_{1}'.format(base, counter)
-            while ncvar in existing_names:
+            while existing(ncvar):
                 counter += 1
                 ncvar = '{0}_{1}'.format(base, counter)
+
+            counters[base] = counter
         else:
             ncvar = base
 
@@ -569,10 +585,11 @@ class NetCDFWrite(IOWrite):
 
         if axis is not None:
             domain_axis = self.implementation.get_domain_axes(f)[axis]
-            logger.info(
-                '    Writing {!r} to netCDF dimension: {}'.format(
-                    domain_axis, ncdim)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    '    Writing {!r} to netCDF dimension: {}'.format(
+                        domain_axis, ncdim)
+                )  # pragma: no cover
 
             size = self.implementation.get_domain_axis_size(f, axis)
             g['axis_to_ncdim'][axis] = ncdim
@@ -1085,6 +1102,11 @@ class NetCDFWrite(IOWrite):
     When `True` is returned, the input variable is added to the
     g['seen'] dictionary.
 
+    Only the variables in the g['seen'] dictionary that have the same
+    fingerprint (see `_seen_fingerprint`) and a matching data digest
+    (see `_seen_digest` and `_equal_digests`) as the input variable
+    are tested for equality.
+
     .. versionadded:: (cfdm) 1.7.0
 
     :Parameters:
@@ -1106,26 +1128,256 @@ class NetCDFWrite(IOWrite):
 
         seen = g['seen']
 
-        for value in seen.values():
+        candidates = g['seen_fingerprints'].get(
+            self._seen_fingerprint(variable), ())
+
+        digest = False
+        for key in candidates:
+            value = seen[key]
             if ncdims is not None and ncdims != value['ncdims']:
                 # The netCDF dimensions (names and order) of the input
                 # variable are different to those of this variable in
                 # the 'seen' dictionary
                 continue
 
+            if (not ignore_type and
+                    not isinstance(value['variable'], type(variable))):
+                continue
+
+            if digest is False:
+                digest = self._seen_digest(variable)
+
+            if not self._equal_digests(
+                    digest, self._seen_digest(value['variable'], key=key)):
+                continue
+
             # Still here?
             if self.implementation.equal_components(
                     variable, value['variable'], ignore_type=ignore_type):
-                seen[id(variable)] = {
-                    'variable': variable,
-                    'ncvar': value['ncvar'],
-                    'ncdims': value['ncdims']
-                }
+                self._record_seen(variable, value['ncvar'],
+                                  value['ncdims'], digest=digest)
                 return True
         # --- End: for
 
         return False
 
+    def _record_seen(self, variable, ncvar, ncdims, digest=None):
+        '''Record that a variable has been written to the file.
+
+    The variable is added to the g['seen'] dictionary and indexed by
+    its fingerprint for `_already_in_file`.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable:
+            The variable that has been written.
+
+        ncvar: `str`
+            The netCDF name of the written variable.
+
+        ncdims: `tuple` or `None`
+            The netCDF dimensions of the written variable.
+
+        digest: optional
+            The digest of the variable's data, if it is already
+            known.
+
+    :Returns:
+
+        `None`
+
+        '''
+        g = self.write_vars
+
+        key = id(variable)
+        if key not in g['seen']:
+            g['seen_fingerprints'].setdefault(
+                self._seen_fingerprint(variable), []).append(key)
+
+        g['seen'][key] = {
+            'variable': variable,
+            'ncvar': ncvar,
+            'ncdims': ncdims
+        }
+
+        if digest is not None:
+            g['seen_digests'][key] = digest
+
+    def _seen_fingerprint(self, variable):
+        '''Return the fingerprint of a variable's data.
+
+    The fingerprint comprises the shape, data type, units and calendar
+    of the data, all of which must be the same for two variables to be
+    equal. It is cheap to find, since the data array is not accessed.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable:
+
+    :Returns:
+
+        `tuple` or `None`
+            The fingerprint, or `None` if the variable has no data.
+
+        '''
+        try:
+            data = self.implementation.get_data(variable, None)
+        except AttributeError:
+            # This variable can't have data (e.g. a coordinate
+            # reference)
+            return None
+
+        if data is None:
+            return None
+
+        return (
+            self.implementation.get_data_shape(data, isdata=True),
+            data.dtype.str,
+            self.implementation.get_data_units(data, None),
+            self.implementation.get_data_calendar(data, None),
+        )
+
+    def _seen_digest(self, variable, key=None):
+        '''Return a digest of the values of a variable's data.
+
+    Two variables whose data have the same fingerprint (see
+    `_seen_fingerprint`) and are equal have matching digests (see
+    `_equal_digests`).
+
+    Data with boolean, integer or string values have a hash of their
+    mask and values as a digest. Floating point values may be equal
+    within the numerical tolerance without being identical, so their
+    digest is a hash of their mask and a summary of their values,
+    comprising their minimum, maximum and mean, that is compared
+    within the numerical tolerance.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        variable:
+
+        key: `int`, optional
+            The key of the variable in the g['seen'] dictionary, for
+            which the digest is to be stored for reuse.
+
+    :Returns:
+
+        `str` or `tuple` or `None`
+            The digest, or `None` if the variable has no data or its
+            data values are not boolean, integer, string or floating
+            point.
+
+        '''
+        digests = self.write_vars['seen_digests']
+        if key is not None and key in digests:
+            return digests[key]
+
+        try:
+            data = self.implementation.get_data(variable, None)
+        except AttributeError:
+            data = None
+
+        if data is None:
+            digest = None
+        else:
+            array = self.implementation.get_array(data, copy=False)
+            kind = array.dtype.kind
+            if kind not in 'biuSUf':
+                # Complex and object arrays can't be summarised, so
+                # compare them all
+                digest = None
+            else:
+                mask = numpy.ma.getmaskarray(array)
+                values = numpy.ma.getdata(array)[~mask]
+
+                digest = hashlib.sha1(mask.tobytes())
+                if kind != 'f':
+                    digest.update(values.tobytes())
+                    digest = digest.hexdigest()
+                elif values.size and numpy.isfinite(values).all():
+                    values = values.astype(float)
+                    absolute = numpy.abs(values)
+                    digest = (
+                        digest.hexdigest(),
+                        (values.size, values.min(), values.max(),
+                         values.mean(), absolute.max(), absolute.mean())
+                    )
+                else:
+                    # Without any finite values to summarise, only
+                    # the mask can be compared
+                    digest = (digest.hexdigest(), None)
+        # --- End: if
+
+        if key is not None:
+            digests[key] = digest
+
+        return digest
+
+    def _equal_digests(self, digest0, digest1):
+        '''Whether or not two data digests are consistent with equality.
+
+    Digests of boolean, integer and string values (see `_seen_digest`)
+    must be identical. Digests of floating point values must have
+    identical masks, and their minima, maxima and means must be equal
+    within the numerical tolerance that is applied to their values by
+    `equal_components`. If every pair of corresponding values is equal
+    within the tolerance then so are these, so data that are equal
+    always have matching digests.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        digest0, digest1:
+            The digests to compare.
+
+    :Returns:
+
+        `bool`
+            `True` if the data may be equal, `False` if they are
+            not.
+
+        '''
+        if not (isinstance(digest0, tuple) and isinstance(digest1, tuple)):
+            return digest0 == digest1
+
+        mask0, summary0 = digest0
+        mask1, summary1 = digest1
+        if mask0 != mask1:
+            return False
+
+        if summary0 is None or summary1 is None:
+            return summary0 is summary1
+
+        size, min0, max0, mean0, max_abs0, mean_abs0 = summary0
+        _, min1, max1, mean1, max_abs1, mean_abs1 = summary1
+
+        absolute_tolerance = atol().value
+        relative_tolerance = rtol().value
+
+        # Allow for rounding errors in the summaries, which are
+        # greatest for the mean
+        eps = numpy.finfo(float).eps
+
+        # The extreme values differ by no more than the tolerance of
+        # the largest magnitude
+        max_abs = max(max_abs0, max_abs1)
+        tolerance = (absolute_tolerance +
+                     (relative_tolerance + eps) * max_abs)
+        if abs(min0 - min1) > tolerance or abs(max0 - max1) > tolerance:
+            return False
+
+        # The means differ by no more than the mean tolerance
+        mean_abs = max(mean_abs0, mean_abs1)
+        tolerance = (absolute_tolerance +
+                     (relative_tolerance + size * eps) * mean_abs)
+        return abs(mean0 - mean1) <= tolerance
+
     def _write_geometry_container(self, field, geometry_container):
         '''Write a netCDF geometry container variable.
 
@@ -1151,11 +1403,12 @@ class NetCDFWrite(IOWrite):
             default='geometry_container')
         ncvar = self._netcdf_name(ncvar)
 
-        logger.info(
-            '    Writing geometry container variable: {}'.format(ncvar)
-        )  # pragma: no cover
-        logger.info(
-            '        {}'.format(geometry_container))  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                '    Writing geometry container variable: {}'.format(ncvar)
+            )  # pragma: no cover
+            logger.info(
+                '        {}'.format(geometry_container))  # pragma: no cover
 
         kwargs = {'varname': ncvar,
                   'datatype': 'S1',
@@ -1265,10 +1518,11 @@ class NetCDFWrite(IOWrite):
             # create it now.
             ncdim_to_size = g['ncdim_to_size']
             if bounds_ncdim not in ncdim_to_size:
-                logger.info(
-                    '    Writing size {} netCDF dimension for '
-                    'bounds: {}'.format(size, bounds_ncdim)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        '    Writing size {} netCDF dimension for '
+                        'bounds: {}'.format(size, bounds_ncdim)
+                    )  # pragma: no cover
 
                 ncdim_to_size[bounds_ncdim] = size
 
@@ -1441,9 +1695,7 @@ class NetCDFWrite(IOWrite):
                 # We need to log the original Bounds variable as being
                 # in the file, too. This is so that the geometry
                 # container variable can be created later on.
-                g['seen'][id(bounds)] = {'ncvar': ncvar,
-                                         'variable': bounds,
-                                         'ncdims': None}
+                self._record_seen(bounds, ncvar, None)
             else:
                 # The node coordiante variable already exists, but the
                 # corresponding encoding variables span the wrong
@@ -1458,10 +1710,11 @@ class NetCDFWrite(IOWrite):
             ncdim_to_size = g['ncdim_to_size']
             if ncdim not in ncdim_to_size:
                 size = self.implementation.get_data_size(nodes)
-                logger.info(
-                    '    Writing size {} netCDF node dimension: '
-                    '{}'.format(size, ncdim)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        '    Writing size {} netCDF node dimension: '
+                        '{}'.format(size, ncdim)
+                    )  # pragma: no cover
 
                 ncdim_to_size[ncdim] = size
 
@@ -1516,11 +1769,7 @@ class NetCDFWrite(IOWrite):
             # We need to log the original Bounds variable as being in
             # the file, too. This is so that the geometry container
             # variable can be created later on.
-            g['seen'][id(bounds)] = {
-                'ncvar': ncvar,
-                'variable': bounds,
-                'ncdims': None
-            }
+            self._record_seen(bounds, ncvar, None)
         # --- End: if
 
         if coord_ncvar is not None:
@@ -1824,7 +2073,8 @@ class NetCDFWrite(IOWrite):
         # Create the part node count flattened data
         array = self.implementation.get_array(self.implementation.get_data(
             bounds))
-        array = numpy.trim_zeros(numpy.ma.count(array, axis=2).flatten())
+        array = numpy.ma.count(array, axis=2).flatten()
+        array = array[array > 0]
         data = self.implementation.initialise_Data(array=array, copy=False)
 
         # ------------------------------------------------------------
@@ -1869,10 +2119,11 @@ class NetCDFWrite(IOWrite):
         else:
             ncdim_to_size = g['ncdim_to_size']
             if ncdim not in ncdim_to_size:
-                logger.info(
-                    '    Writing size {} netCDF part '
-                    'dimension{}'.format(size, ncdim)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        '    Writing size {} netCDF part '
+                        'dimension{}'.format(size, ncdim)
+                    )  # pragma: no cover
 
                 ncdim_to_size[ncdim] = size
 
@@ -1958,10 +2209,11 @@ class NetCDFWrite(IOWrite):
         else:
             ncdim_to_size = g['ncdim_to_size']
             if ncdim not in ncdim_to_size:
-                logger.info(
-                    '    Writing size {} netCDF part '
-                    'dimension{}'.format(size, ncdim)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        '    Writing size {} netCDF part '
+                        'dimension{}'.format(size, ncdim)
+                    )  # pragma: no cover
                 ncdim_to_size[ncdim] = size
 
                 # Define (and create if necessary) the group in which
@@ -2091,11 +2343,7 @@ class NetCDFWrite(IOWrite):
             if bounds_ncvar is not None:
                 bounds = self.implementation.get_bounds(coord, None)
                 if bounds is not None:
-                    g['seen'][id(bounds)] = {
-                        'ncvar': bounds_ncvar,
-                        'variable': bounds,
-                        'ncdims': None
-                    }
+                    self._record_seen(bounds, bounds_ncvar, None)
         else:
             if (not self.implementation.get_properties(coord) and
                     self.implementation.get_data(coord, default=None) is None):
@@ -2395,9 +2643,10 @@ class NetCDFWrite(IOWrite):
             default = cc_parameters.get('grid_mapping_name', 'grid_mapping')
             ncvar = self._create_netcdf_variable_name(ref, default=default)
 
-            logger.info(
-                '    Writing {!r} to netCDF variable:'.format(ref, ncvar)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    '    Writing {!r} to netCDF variable:'.format(ref, ncvar)
+                )  # pragma: no cover
 
             kwargs = {'varname': ncvar,
                       'datatype': 'S1',
@@ -2425,13 +2674,9 @@ class NetCDFWrite(IOWrite):
 
             g['nc'][ncvar].setncatts(parameters)
 
-            # Update the 'seen' dictionary
-            g['seen'][id(ref)] = {
-                'variable': ref,
-                'ncvar': ncvar,
-                # Grid mappings have no netCDF dimensions
-                'ncdims': (),
-            }
+            # Update the 'seen' dictionary (grid mappings have no
+            # netCDF dimensions)
+            self._record_seen(ref, ncvar, ())
         # --- End: if
 
         if multiple_grid_mappings:
@@ -2483,7 +2728,8 @@ class NetCDFWrite(IOWrite):
 
         g = self.write_vars
 
-        logger.info('    Writing {!r}'.format(cfvar))  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('    Writing {!r}'.format(cfvar))  # pragma: no cover
 
         # ------------------------------------------------------------
         # Set the netCDF4.createVariable datatype
@@ -2522,9 +2768,10 @@ class NetCDFWrite(IOWrite):
             chunksizes = self.implementation.nc_get_hdf5_chunksizes(data)
 
         if chunksizes is not None:
-            logger.detail(
-                '      HDF5 chunksizes: {}'.format(chunksizes)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.DETAIL):
+                logger.detail(
+                    '      HDF5 chunksizes: {}'.format(chunksizes)
+                )  # pragma: no cover
 
         # ------------------------------------------------------------
         # Check that each dimension of the netCDF variable name is in
@@ -2570,10 +2817,11 @@ class NetCDFWrite(IOWrite):
         # TODO
         kwargs = self._customize_createVariable(cfvar, kwargs)
 
-        logger.info(
-            ' to netCDF variable: {}({})'.format(
-                ncvar, ', '.join(ncdimensions))
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                ' to netCDF variable: {}({})'.format(
+                    ncvar, ', '.join(ncdimensions))
+            )  # pragma: no cover
 
         try:
             self._createVariable(**kwargs)
@@ -2637,11 +2885,7 @@ class NetCDFWrite(IOWrite):
                              attributes=attributes)
 
         # Update the 'seen' dictionary
-        g['seen'][id(cfvar)] = {
-            'variable': cfvar,
-            'ncvar': ncvar,
-            'ncdims': original_ncdimensions
-        }
+        self._record_seen(cfvar, ncvar, original_ncdimensions)
 
     def _customize_createVariable(self, cfvar, kwargs):
         '''TODO
@@ -2684,7 +2928,7 @@ class NetCDFWrite(IOWrite):
             # dimension. Note that for NETCDF4 output files, datatype
             # is str, so this conversion does not happen.
             # --------------------------------------------------------
-            array = self.implementation.get_array(data)
+            array = self.implementation.get_array(data, copy=False)
 #            if numpy.ma.is_masked(array):
 #                array = array.compressed()
 #            else:
@@ -2727,13 +2971,84 @@ class NetCDFWrite(IOWrite):
 
         g = self.write_vars
 
+        nc_variable = g['nc'][ncvar]
+
+        check_valid = g['warn_valid'] and any(
+            prop in attributes
+            for prop in ('valid_min', 'valid_max', 'valid_range'))
+
+        def prepare(indices, array):
+            return self._prepare_data_block(indices, array, ncvar,
+                                            unset_values, check_valid)
+
         if compressed:
             # if set(ncdimensions).intersection(g['sample_ncdim'].values()):
             # Get the data as a compressed numpy array
             array = self.implementation.get_compressed_array(data)
+            blocks = [prepare(Ellipsis, array)]
+            del array
         else:
-            # Get the data as an uncompressed numpy array
-            array = self.implementation.get_array(data)
+            blocks = (prepare(indices, array)
+                      for indices, array in self._data_blocks(data,
+                                                              nc_variable))
+
+        extremes = []
+
+        for indices, array, block_extremes in blocks:
+            # Copy the array into the netCDF variable. The netCDF-C
+            # library is not thread-safe, and other threads may be
+            # reading blocks from netCDF files.
+            with netcdf_lock:
+                nc_variable[indices] = array
+
+            extremes.extend(block_extremes)
+
+            self._aaa(ncvar, array)
+
+            # Release this block before the next one is read
+            del array
+        # --- End: for
+
+        if extremes:
+            # Check for out-of-range values
+            self._check_valid(cfvar, numpy.array(extremes), attributes)
+
+    def _prepare_data_block(self, indices, array, ncvar, unset_values=(),
+                            check_valid=False):
+        '''Prepare a block of data for writing to a netCDF variable.
+
+    The data type is converted, the block is checked for unmasked
+    missing values, and masked string values are filled.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_data_blocks`, `_write_data`
+
+    :Parameters:
+
+        indices: `tuple` or `Ellipsis`
+            The indices of the block in the netCDF variable.
+
+        array: `numpy.ndarray`
+            The block of data.
+
+        ncvar: `str`
+            The name of the netCDF variable.
+
+        unset_values: sequence of numbers, optional
+            Values which must not appear as unmasked data.
+
+        check_valid: `bool`, optional
+            If True then also return the extreme values of the block.
+
+    :Returns:
+
+        `tuple`
+            The indices, the prepared block, and a `list` of its
+            unmasked extreme values.
+
+        '''
+        g = self.write_vars
 
         # Convert data type
         new_dtype = g['datatype'].get(array.dtype)
@@ -2760,14 +3075,149 @@ class NetCDFWrite(IOWrite):
             # https://github.com/Unidata/netcdf4-python/pull/465
             array = array.filled('')
 
-        if g['warn_valid']:
-            # Check for out-of-range values
-            warned = self._check_valid(cfvar, array, attributes)
+        extremes = []
+        if check_valid and array.size:
+            # Record the extreme values of this block, so that
+            # out-of-range values are reported only once
+            extremes = [x for x in (array.min(), array.max())
+                        if x is not numpy.ma.masked]
+
+        return indices, array, extremes
+
+    def _data_blocks(self, data, nc_variable):
+        '''Return the data in blocks for writing to a netCDF variable.
+
+    Only one block is read into memory at a time, unless the data are
+    already in memory in which case each block is a view of them.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_data_block_indices`, `_data_block_reader`
+
+    :Parameters:
+
+        data: Data instance
 
-        # Copy the array into the netCDF variable
-        g['nc'][ncvar][...] = array
+        nc_variable: `netCDF4.Variable`
+            The netCDF variable to which the data are to be written.
 
-        self._aaa(ncvar, array)
+    :Returns:
+
+        generator
+            Each element is a tuple of the indices of a block and the
+            block itself.
+
+    **Examples:**
+
+    >>> for indices, array in n._data_blocks(data, nc_variable):
+    ...     nc_variable[indices] = array
+
+        '''
+        read = self._data_block_reader(data)
+        for indices in self._data_block_indices(data, nc_variable):
+            yield indices, read(indices)
+
+    def _data_block_indices(self, data, nc_variable):
+        '''Return the indices of the blocks in which to write data.
+
+    Each block contains at most approximately `_write_block_size`
+    bytes, in contiguous blocks of the outermost dimensions. Where the
+    netCDF variable is chunked, the block boundaries of the innermost
+    dimension along which the data are divided are aligned with the
+    chunk boundaries.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_data_blocks`
+
+    :Parameters:
+
+        data: Data instance
+
+        nc_variable: `netCDF4.Variable`
+            The netCDF variable to which the data are to be written.
+
+    :Returns:
+
+        generator
+            The indices of each block, or `Ellipsis` if the data are
+            to be written in one block.
+
+        '''
+        shape = self.implementation.get_data_shape(data, isdata=True)
+        ndim = len(shape)
+
+        # The maximum number of elements in each block
+        itemsize = max(data.dtype.itemsize, 1)
+        block_size = max(1, self._write_block_size // itemsize)
+
+        # Find the innermost dimension along which the data must be
+        # divided so that each block has at most 'block_size'
+        # elements
+        axis = ndim
+        size = 1
+        while axis and size * shape[axis - 1] <= block_size:
+            axis -= 1
+            size *= shape[axis]
+
+        if not axis or len(nc_variable.dimensions) != ndim:
+            # Write the data in one block
+            yield Ellipsis
+            return
+
+        axis -= 1
+
+        step = max(1, block_size // size)
+        try:
+            chunks = nc_variable.chunking()
+        except Exception:
+            chunks = None
+
+        if isinstance(chunks, list) and step >= chunks[axis]:
+            # Align the blocks with the chunks
+            step -= step % chunks[axis]
+
+        for outer in itertools.product(*[range(n) for n in shape[:axis]]):
+            for start in range(0, shape[axis], step):
+                yield (
+                    tuple(slice(i, i + 1) for i in outer)
+                    + (slice(start, start + step),)
+                    + (slice(None),) * (ndim - axis - 1)
+                )
+
+    def _data_block_reader(self, data):
+        '''Return a function that reads blocks of data into memory.
+
+    Data that are already in memory are subspaced as numpy views,
+    otherwise only the requested block is read.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `_data_blocks`
+
+    :Parameters:
+
+        data: Data instance
+
+    :Returns:
+
+        function
+            A function that takes the indices of a block, as returned
+            by `_data_block_indices`, and returns the block as a numpy
+            array.
+
+        '''
+        array = self.implementation.get_array_view(data)
+        if array is not None:
+            return array.__getitem__
+
+        def read(indices):
+            if indices is Ellipsis:
+                return self.implementation.get_array(data)
+
+            return self.implementation.get_array(data[indices])
+
+        return read
 
     def _check_valid(self, cfvar, array, attributes):
         '''Check array for out-of-range values, as defined by the
@@ -2891,18 +3341,21 @@ class NetCDFWrite(IOWrite):
         '''
         g = self.write_vars
 
-        logger.info('  Writing {!r}:'.format(f))  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('  Writing {!r}:'.format(f))  # pragma: no cover
 
         xxx = []
 
         seen = g['seen']
 
         org_f = f
-        if add_to_seen:
-            id_f = id(f)
 
-        # Copy the field, as we are almost certainly about to do
-        # terrible things to it (or are we? should review this)
+        # Copy the field, as we are about to modify its metadata and
+        # the layout of its data. In-memory data arrays are shared
+        # with the copy on a copy-on-write basis, so no data are
+        # duplicated unless a construct is transformed (e.g. by
+        # transposition or string conversion), and then only that
+        # construct's data.
         f = self.implementation.copy_construct(org_f)
 
         data_axes = list(self.implementation.get_field_data_axes(f))
@@ -2938,9 +3391,10 @@ class NetCDFWrite(IOWrite):
         # Type of compression applied to the field
         compression_type = self.implementation.get_compression_type(f)
         g['compression_type'] = compression_type
-        logger.info(
-            "    Compression = {!r}".format(g['compression_type'])
-        )  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info(
+                "    Compression = {!r}".format(g['compression_type'])
+            )  # pragma: no cover
 
         #
         g['sample_ncdim'] = {}
@@ -3488,10 +3942,11 @@ class NetCDFWrite(IOWrite):
                 formula_terms = ' '.join(formula_terms)
                 g['nc'][ncvar].setncattr('formula_terms', formula_terms)
 
-                logger.info(
-                    "    Writing formula_terms attribute to "
-                    "netCDF variable {}: {!r}".format(ncvar, formula_terms)
-                )  # pragma: no cover
+                if logger.isEnabledFor(logging.INFO):
+                    logger.info(
+                        "    Writing formula_terms attribute to "
+                        "netCDF variable {}: {!r}".format(ncvar, formula_terms)
+                    )  # pragma: no cover
 
                 # Add the formula_terms attribute to the parent
                 # coordinate bounds variable
@@ -3501,11 +3956,12 @@ class NetCDFWrite(IOWrite):
                     g['nc'][bounds_ncvar].setncattr(
                         'formula_terms', bounds_formula_terms)
 
-                    logger.info(
-                        "    Writing formula_terms to netCDF "
-                        "bounds variable {}: {!r}".format(
-                             bounds_ncvar, bounds_formula_terms)
-                    )  # pragma: no cover
+                    if logger.isEnabledFor(logging.INFO):
+                        logger.info(
+                            "    Writing formula_terms to netCDF "
+                            "bounds variable {}: {!r}".format(
+                                 bounds_ncvar, bounds_formula_terms)
+                        )  # pragma: no cover
             # --- End: if
 
             # Deal with a vertical datum
@@ -3547,41 +4003,45 @@ class NetCDFWrite(IOWrite):
         # Cell measures
         if cell_measures:
             cell_measures = ' '.join(cell_measures)
-            logger.info(
-                "    Writing cell_measures attribute to "
-                "netCDF variable {}: {!r}".format(ncvar, cell_measures)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    Writing cell_measures attribute to "
+                    "netCDF variable {}: {!r}".format(ncvar, cell_measures)
+                )  # pragma: no cover
 
             extra['cell_measures'] = cell_measures
 
         # Auxiliary/scalar coordinates
         if coordinates:
             coordinates = ' '.join(coordinates)
-            logger.info(
-                "    Writing coordinates attribute to "
-                "netCDF variable {}: {!r}".format(ncvar, coordinates)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    Writing coordinates attribute to "
+                    "netCDF variable {}: {!r}".format(ncvar, coordinates)
+                )  # pragma: no cover
 
             extra['coordinates'] = coordinates
 
         # Grid mapping
         if grid_mapping:
             grid_mapping = ' '.join(grid_mapping)
-            logger.info(
-                "    Writing grid_mapping attribute to "
-                "netCDF variable {}: {!r}".format(ncvar, grid_mapping)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    Writing grid_mapping attribute to "
+                    "netCDF variable {}: {!r}".format(ncvar, grid_mapping)
+                )  # pragma: no cover
 
             extra['grid_mapping'] = grid_mapping
 
         # Ancillary variables
         if ancillary_variables:
             ancillary_variables = ' '.join(ancillary_variables)
-            logger.info(
-                "    Writing ancillary_variables attribute to "
-                "netCDF variable {}: {!r}".format(
-                    ncvar, ancillary_variables)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    Writing ancillary_variables attribute to "
+                    "netCDF variable {}: {!r}".format(
+                        ncvar, ancillary_variables)
+                )  # pragma: no cover
 
             extra['ancillary_variables'] = ancillary_variables
 
@@ -3609,10 +4069,11 @@ class NetCDFWrite(IOWrite):
                     self.implementation.get_cell_method_string(cm))
 
             cell_methods = ' '.join(cell_methods_strings)
-            logger.info(
-                "    Writing cell_methods attribute to "
-                "netCDF variable {}: {}".format(ncvar, cell_methods)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    "    Writing cell_methods attribute to "
+                    "netCDF variable {}: {}".format(ncvar, cell_methods)
+                )  # pragma: no cover
 
             extra['cell_methods'] = cell_methods
 
@@ -3646,9 +4107,7 @@ class NetCDFWrite(IOWrite):
 
         # Update the 'seen' dictionary, if required
         if add_to_seen:
-            seen[id_f] = {'variable': org_f,
-                          'ncvar': ncvar,
-                          'ncdims': ncdimensions}
+            self._record_seen(org_f, ncvar, ncdimensions)
 
         if xxx:
             g['xxx'].extend(xxx)
@@ -3675,9 +4134,10 @@ class NetCDFWrite(IOWrite):
         if count[0] == 1:
             # Add the vertical coordinate to an existing
             # horizontal coordinate reference
-            logger.info(
-                '      Adding {!r} to {!r}'.format(coord_key, grid_mapping)
-            )  # pragma: no cover
+            if logger.isEnabledFor(logging.INFO):
+                logger.info(
+                    '      Adding {!r} to {!r}'.format(coord_key, grid_mapping)
+                )  # pragma: no cover
 
             grid_mapping = count[1]
             self.implementation.set_coordinate_reference_coordinate(
@@ -4039,6 +4499,10 @@ class NetCDFWrite(IOWrite):
                         "that needs to be read: {}".format(filename))
         # --- End: if
 
+        # Close any idle read-only handles for the file that are
+        # being kept open for reuse
+        file_pool.close(filename)
+
         if self.write_vars['overwrite']:
             os.remove(filename)
 
@@ -4221,7 +4685,8 @@ class NetCDFWrite(IOWrite):
     See `cfdm.write` for examples.
 
         '''
-        logger.info('Writing to {}'.format(fmt))  # pragma: no cover
+        if logger.isEnabledFor(logging.INFO):
+            logger.info('Writing to {}'.format(fmt))  # pragma: no cover
 
         # ------------------------------------------------------------
         # Initialise netCDF write parameters
@@ -4239,8 +4704,16 @@ class NetCDFWrite(IOWrite):
             # dimensions keyed by items of the field (such as a
             # coordinate or a coordinate reference)
             'seen': {},
+            # Keys of the 'seen' dictionary, keyed by the fingerprints
+            # of their variables, and the digests of their variables'
+            # data
+            'seen_fingerprints': {},
+            'seen_digests': {},
             # Set of all netCDF dimension and netCDF variable names.
             'ncvar_names': set(()),
+            # The last numeric suffix given to each base name by
+            # _netcdf_name
+            'name_counters': {},
             # Set of global or non-standard CF properties which have
             # identical values across all input fields.
             'variable_attributes': set(),
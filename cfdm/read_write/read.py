@@ -4,12 +4,14 @@ from ..cfdmimplementation import implementation
 
 from .netcdf import NetCDFRead
 
+from . import cache as read_cache
+
 
 _implementation = implementation()
 
 
 def read(filename, external=None, extra=None, verbose=None,
-         warnings=False, warn_valid=False, mask=True,
+         warnings=False, warn_valid=False, mask=True, cache=False,
          _implementation=_implementation):
     '''Read field constructs from a dataset.
 
@@ -232,6 +234,47 @@ def read(filename, external=None, extra=None, verbose=None,
 
             .. versionadded:: (cfdm) 1.8.2
 
+        cache: `bool` or `str`, optional
+            If True, or the name of a directory, then keep the field
+            constructs read from a netCDF file in a persistent cache
+            on disk, and return them from the cache when the same
+            file is read again with the same *external*, *extra*,
+            *warn_valid* and *mask* parameters. This avoids parsing
+            the file's metadata again, which may take a significant
+            time for datasets with many variables. The data of the
+            returned field constructs are read from the file as
+            usual, and refer to the file and any external files by
+            their absolute paths, so that cached field constructs may
+            be used from any working directory.
+
+            A cache entry is ignored, and then replaced, if the file
+            or any of its external files have been modified since the
+            entry was created, as judged by their sizes and
+            modification times, or if the entry was created by a
+            different version of cfdm. Entries may also be removed
+            with `cfdm.clear_read_cache`.
+
+            If True then the cache is stored in the ``cfdm``
+            subdirectory of the directory given by the
+            ``XDG_CACHE_HOME`` environment variable, or of
+            ``~/.cache`` if the variable is not set. Cache entries are
+            unpickled when they are used, so the cache directory must
+            not be writable by untrusted users.
+
+            Note that no log messages are output and no warnings are
+            given when field constructs are returned from the
+            cache. CDL files are never cached.
+
+            By default the cache is not used.
+
+            *Parameter example:*
+              ``cache=True``
+
+            *Parameter example:*
+              ``cache='/home/user/cfdm_cache'``
+
+            .. versionadded:: (cfdm) 1.8.8.0
+
         _implementation: (subclass of) `CFDMImplementation`, optional
             Define the CF data model implementation that provides the
             returned field constructs.
@@ -262,6 +305,11 @@ def read(filename, external=None, extra=None, verbose=None,
     >>> i = cfdm.read('parent.nc', external='external.nc')
     >>> j = cfdm.read('parent.nc', external=['external1.nc', 'external2.nc'])
 
+    Keep the field constructs in a persistent cache, so that
+    subsequent reads of the same unmodified file are faster:
+
+    >>> k = cfdm.read('file.nc', cache=True)
+
     '''
     # Parse the field parameter
     if extra is None:
@@ -292,10 +340,48 @@ def read(filename, external=None, extra=None, verbose=None,
         filename = netcdf.cdl_to_netcdf(filename)
 
     if netcdf.is_netcdf_file(filename):
+        if cache and not cdl:
+            # Look for the field constructs in the read cache. Cached
+            # field constructs may be used from a different working
+            # directory, so their data must refer to files by
+            # absolute paths.
+            filename = os.path.abspath(filename)
+
+            if external is None:
+                external_files = ()
+            elif isinstance(external, str):
+                external_files = (external,)
+            else:
+                external_files = tuple(external)
+
+            external_files = tuple(
+                os.path.abspath(os.path.expanduser(os.path.expandvars(f)))
+                for f in external_files)
+            if external is not None:
+                external = external_files
+
+            options = (
+                tuple(sorted(extra)),
+                bool(warn_valid),
+                bool(mask),
+                '{}.{}'.format(type(_implementation).__module__,
+                               type(_implementation).__qualname__),
+            )
+
+            fields = read_cache.load(cache, filename, external_files,
+                                     options)
+            if fields is not None:
+                return fields
+        # --- End: if
+
         fields = netcdf.read(filename, external=external, extra=extra,
                              verbose=verbose, warnings=warnings,
                              warn_valid=warn_valid, mask=mask,
                              extra_read_vars=None)
+
+        if cache and not cdl:
+            read_cache.save(cache, filename, external_files, options,
+                            fields)
     elif cdl:
         raise IOError(
             "Can't determine format of file {} "
@@ -308,3 +394,171 @@ def read(filename, external=None, extra=None, verbose=None,
     # Return the field constructs
     # ----------------------------------------------------------------
     return fields
+
+
+def read_many(filenames, external=None, extra=None, verbose=None,
+              warnings=False, warn_valid=False, mask=True,
+              _implementation=_implementation):
+    '''Read field constructs from many datasets.
+
+    Each dataset is read as if by `cfdm.read`, and the field
+    constructs are generated one at a time, in the order of the
+    datasets and, for each dataset, in the order in which they would
+    be returned by `cfdm.read`.
+
+    The structure of a netCDF dataset is only parsed once for all
+    datasets that have the same header, i.e. the same dimensions,
+    variables and attributes, differing at most in the values of
+    their variables' data. The field constructs of such a dataset are
+    copies of those already created from the first of them, whose
+    data are read lazily from the new dataset. This is not done for
+    datasets that contain compressed data, hierarchical groups or
+    external variables, since their structure may depend on their
+    data values or on other datasets.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    .. seealso:: `cfdm.read`
+
+    :Parameters:
+
+        filenames: (sequence of) `str`
+            The file names or OPenDAP URLs of the datasets. Relative
+            paths are allowed, and standard tilde and shell parameter
+            expansions are applied to each string.
+
+        external: (sequence of) `str`, optional
+            See `cfdm.read` for details.
+
+        extra: (sequence of) `str`, optional
+            See `cfdm.read` for details.
+
+        verbose: `int` or `str` or `None`, optional
+            See `cfdm.read` for details.
+
+        warnings: `bool`, optional
+            See `cfdm.read` for details.
+
+        warn_valid: `bool`, optional
+            See `cfdm.read` for details.
+
+        mask: `bool`, optional
+            See `cfdm.read` for details.
+
+        _implementation: (subclass of) `CFDMImplementation`, optional
+            Define the CF data model implementation that provides the
+            returned field constructs.
+
+    :Returns:
+
+        generator
+            The field constructs found in the datasets.
+
+    **Examples:**
+
+    >>> for f in cfdm.read_many(['file1.nc', 'file2.nc']):
+    ...     print(repr(f))
+    ...
+    <Field: air_temperature(time(12), latitude(73), longitude(96)) K>
+    <Field: air_temperature(time(12), latitude(73), longitude(96)) K>
+
+    '''
+    if isinstance(filenames, str):
+        filenames = (filenames,)
+
+    # Parse the field parameter
+    if extra is None:
+        extra = ()
+    elif isinstance(extra, str):
+        extra = (extra,)
+
+    kwargs = {
+        'external': external,
+        'extra': extra,
+        'verbose': verbose,
+        'warnings': warnings,
+        'warn_valid': warn_valid,
+        'mask': mask,
+        '_implementation': _implementation,
+    }
+
+    netcdf = NetCDFRead(_implementation)
+
+    # The file, and its fields, that have been read for each header
+    # signature. A value of False indicates that its fields can not
+    # be copied.
+    templates = {}
+
+    for filename in filenames:
+        filename = os.path.expanduser(os.path.expandvars(filename))
+
+        signature = None
+        if os.path.isfile(filename) and netcdf.is_netcdf_file(filename):
+            signature = netcdf.header_signature(filename)
+
+        fields = None
+
+        template = templates.get(signature)
+        if template:
+            # Copy the fields of an earlier file with the same header
+            original, template = template
+            try:
+                fields = netcdf.copy_fields(template, original, filename,
+                                            mask=mask)
+            except ValueError:
+                pass
+        # --- End: if
+
+        if fields is None:
+            fields, reusable = _read_file(filename, kwargs)
+
+            if signature is not None and signature not in templates:
+                if reusable:
+                    templates[signature] = (
+                        filename, [f.copy() for f in fields])
+                else:
+                    templates[signature] = False
+        # --- End: if
+
+        for f in fields:
+            yield f
+
+
+def _read_file(filename, kwargs):
+    '''Read one of the datasets given to `read_many`.
+
+    .. versionadded:: (cfdm) 1.8.8.0
+
+    :Parameters:
+
+        filename: `str`
+            The file name or OPenDAP URL of the dataset.
+
+        kwargs: `dict`
+            Keyword parameters to `cfdm.read`.
+
+    :Returns:
+
+        `tuple`
+            The field constructs, and whether or not they may be
+            copied for other datasets with the same header.
+
+    '''
+    _implementation = kwargs['_implementation']
+
+    netcdf = NetCDFRead(_implementation)
+    if not (os.path.isfile(filename) and netcdf.is_netcdf_file(filename)):
+        return read(filename, **kwargs), False
+
+    fields = netcdf.read(filename, external=kwargs['external'],
+                         extra=kwargs['extra'],
+                         verbose=kwargs['verbose'],
+                         warnings=kwargs['warnings'],
+                         warn_valid=kwargs['warn_valid'],
+                         mask=kwargs['mask'], extra_read_vars=None)
+
+    g = netcdf.read_vars
+    reusable = not (g['compression'] or g['has_groups'] or
+                    g.get('external_variables'))
+
+    return fields, reusable
@@ -4,7 +4,7 @@ import inspect
 import itertools
 import os
 import unittest
-
+import weakref
 
 import numpy
 
@@ -137,6 +137,111 @@ class DataTest(unittest.TestCase):
         self.assertEqual(a.shape, ())
         self.assertIs(a[()], numpy.ma.masked)
 
+    def test_Data_copy(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.arange(12.0).reshape(3, 4)
+
+        d = cfdm.Data(a, units='m')
+        e = d.copy()
+        self.assertTrue(numpy.shares_memory(
+            d._get_Array()._get_component('array'),
+            e._get_Array()._get_component('array')))
+
+        # Modifying either copy leaves the other unchanged
+        e[0, 0] = -1
+        d[1, 1] = cfdm.masked
+        self.assertEqual(d.array[0, 0], 0)
+        self.assertFalse(numpy.ma.is_masked(e.array))
+        self.assertEqual(e.array[0, 0], -1)
+        self.assertTrue(d.array.mask[1, 1])
+
+        # The initialising numpy array is unchanged
+        self.assertTrue((a == numpy.arange(12.0).reshape(3, 4)).all())
+
+        # In-place operations leave the other copy unchanged
+        e = d.copy()
+        e.transpose(inplace=True)
+        e.insert_dimension(inplace=True)
+        self.assertEqual(d.shape, (3, 4))
+        self.assertEqual(e.shape, (1, 4, 3))
+
+        e = d.copy()
+        e.apply_masking(valid_max=5, inplace=True)
+        self.assertEqual(d.array.count(), 11)
+        self.assertEqual(e.array.count(), 5)
+
+    def test_Data__setitem__in_place(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.arange(12.0).reshape(3, 4)
+
+        # The first assignment copies the numpy array, since it is
+        # shared with the input
+        d = cfdm.Data(a)
+        d[0, 0] = -1
+        array = d._get_Array()._get_component('array')
+        self.assertFalse(numpy.shares_memory(array, a))
+        self.assertEqual(a[0, 0], 0)
+
+        # Subsequent assignments are in-place
+        d[1, 1] = -2
+        d[:, 2] = [[7], [8], [9]]
+        self.assertIs(d._get_Array()._get_component('array'), array)
+        self.assertEqual(d.array[0, 0], -1)
+        self.assertEqual(d.array[1, 1], -2)
+        self.assertEqual(d.array[:, 2].tolist(), [7, 8, 9])
+
+        # Masking does not copy the data
+        d[2, 3] = cfdm.masked
+        self.assertTrue(numpy.shares_memory(
+            d._get_Array()._get_component('array'), array))
+        self.assertTrue(d.array.mask[2, 3])
+        self.assertEqual(d.array.count(), 11)
+
+        # A copy is unaffected by in-place assignments
+        e = d.copy()
+        d[0, 0] = -3
+        e[0, 1] = -4
+        self.assertEqual(d.array[0, 1], 1)
+        self.assertEqual(e.array[0, 0], -1)
+        self.assertTrue(e.array.mask[2, 3])
+
+        # Data initialised from other data without copying
+        e = cfdm.Data(d, copy=False)
+        e[0, 0] = -5
+        self.assertEqual(d.array[0, 0], -3)
+
+        # Data initialised from a numpy array without copying
+        a = numpy.arange(4.0)
+        d = cfdm.Data(a, copy=False)
+        d[0] = 99
+        self.assertEqual(a[0], 0)
+        self.assertEqual(d.array[0], 99)
+        self.assertFalse(numpy.shares_memory(
+            d._get_Array()._get_component('array'), a))
+
+        # Data initialised from a numpy array, and their copies, are
+        # unchanged when the numpy array is modified
+        a = numpy.arange(3.0)
+        d = cfdm.Data(a, copy=False)
+        c = cfdm.DimensionCoordinate()
+        c.set_data(d)
+        e = d.copy()
+        a[:] = -5
+        self.assertEqual(c.data.array.tolist(), [0, 1, 2])
+        self.assertEqual(e.array.tolist(), [0, 1, 2])
+        self.assertEqual(d.array.tolist(), [0, 1, 2])
+
+        # Orthogonal indexing with more than one list of indices
+        d = cfdm.Data(numpy.arange(12).reshape(3, 4))
+        d[[0, 2], [1, 3]] = -1
+        self.assertEqual(d.array[[0, 2]][:, [1, 3]].tolist(),
+                         [[-1, -1], [-1, -1]])
+        self.assertEqual(d.array.sum(), 66 - 1 - 3 - 9 - 11 - 4)
+
     def test_Data_apply_masking(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -258,6 +363,14 @@ class DataTest(unittest.TestCase):
         self.assertTrue((a2 == b).all())
         self.assertFalse((a2 == a).all())
 
+        # An array that is no longer referenced is freed immediately,
+        # even though getting it involved handling a missing fill
+        # value
+        d[0, 0, 0, 0] = cfdm.masked
+        self.assertIsNone(d.get_fill_value(None))
+        r = weakref.ref(d.array)
+        self.assertIsNone(r())
+
     def test_Data_datetime_array(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -358,6 +471,47 @@ class DataTest(unittest.TestCase):
         d = cfdm.Data(9)
         self.assertTrue(d.equals(d.transpose()))
 
+    def test_Data_shape_views(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        a = numpy.ma.arange(24.0).reshape(2, 1, 3, 4)
+        a[0, 0, 1, 2] = cfdm.masked
+
+        def numpy_array(d):
+            return d._get_Array()._get_component('array')
+
+        for method, args, shape in (('transpose', (), (4, 3, 1, 2)),
+                                    ('squeeze', (), (2, 3, 4)),
+                                    ('insert_dimension', (-1,),
+                                     (2, 1, 3, 4, 1)),
+                                    ('flatten', ([2, 3],), (2, 1, 12))):
+            d = cfdm.Data(a, units='m')
+            e = getattr(d, method)(*args)
+            self.assertEqual(e.shape, shape, method)
+            self.assertEqual(e.array.count(), 23, method)
+            self.assertEqual(e.get_units(), 'm', method)
+
+            # The new data share the numpy array
+            self.assertTrue(numpy.shares_memory(numpy_array(e),
+                                                numpy_array(d)), method)
+
+            # Modifying either leaves the other unchanged
+            e[...] = -1
+            self.assertTrue((e.array == -1).all(), method)
+            self.assertTrue((d.array == a).all(), method)
+            self.assertTrue((d.array.mask == a.mask).all(), method)
+
+            e = getattr(d, method)(*args)
+            d[...] = -2
+            self.assertTrue((d.array == -2).all(), method)
+            self.assertEqual(e.array.count(), 23, method)
+            self.assertEqual(e.array.sum(), a.sum(), method)
+        # --- End: for
+
+        # The initialising numpy array is unchanged
+        self.assertEqual(a.sum(), 276 - 6)
+
     def test_Data_unique(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -44,6 +44,9 @@ class FieldTest(unittest.TestCase):
     indexed_contiguous = os.path.join(
         os.path.dirname(os.path.abspath(__file__)),
         'DSG_timeSeriesProfile_indexed_contiguous.nc')
+    gathered = os.path.join(
+        os.path.dirname(os.path.abspath(__file__)),
+        'gathered.nc')
 
 #    f = cfdm.read(filename)[0]
 
@@ -85,6 +88,32 @@ class FieldTest(unittest.TestCase):
 
         f = cfdm.Field(source='qwerty')
 
+    def test_Field_copy(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(1)
+        g = f.copy()
+        self.assertTrue(g.equals(f))
+
+        # Data arrays are shared until one of the copies is modified
+        for key, c in f.constructs.filter_by_data().items():
+            self.assertTrue(numpy.shares_memory(
+                c.data._get_Array()._get_component('array'),
+                g.constructs[key].data._get_Array()._get_component('array')))
+
+        self.assertTrue(numpy.shares_memory(
+            f.data._get_Array()._get_component('array'),
+            g.data._get_Array()._get_component('array')))
+
+        g.data[...] = -1
+        x = g.construct('grid_longitude')
+        x.data[0] = -99
+        self.assertFalse(g.equals(f))
+        self.assertTrue((f.data.array != -1).all())
+        self.assertNotEqual(f.construct('grid_longitude').data.array[0], -99)
+        self.assertTrue(f.equals(cfdm.example_field(1)))
+
     def test_Field___getitem__(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -165,6 +194,22 @@ class FieldTest(unittest.TestCase):
         self.assertEqual(c.data.shape, (4,))
         self.assertEqual(b.data.shape, (4, 2))
 
+        # Constructs that don't span the subspaced axes share their
+        # data with the original field, and the original field is
+        # unchanged by changes to the subspace
+        f = cfdm.example_field(1)
+        g = f[0]
+        x = f.construct('grid_longitude')
+        self.assertTrue(numpy.shares_memory(
+            x.data._get_Array()._get_component('array'),
+            g.construct('grid_longitude').data._get_Array()._get_component(
+                'array')))
+        self.assertEqual(g.construct('atmosphere_hybrid_height_coordinate')
+                         .data.shape, (1,))
+
+        g.construct('grid_longitude').data[0] = -99
+        self.assertTrue(f.equals(cfdm.example_field(1)))
+
 #    def test_Field___setitem__(self):
 #        if self.test_only and inspect.stack()[0][3] not in self.test_only:
 #            return
@@ -614,6 +659,105 @@ class FieldTest(unittest.TestCase):
                     self.assertTrue(f.equals(c, verbose=3), message)
         # --- End: for
 
+    def test_Field_compress_missing_values(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.contiguous)[0]
+        self.assertEqual(f.data.get_count().data.array.tolist(),
+                         [3, 7, 5, 9])
+
+        u = f.uncompress()
+
+        # Interior missing values are retained, and trailing missing
+        # values are removed, including all of the values of a
+        # feature with no data
+        u.data[1, 0] = cfdm.masked
+        u.data[1, 6] = cfdm.masked
+        u.data[2, :] = cfdm.masked
+
+        for method in ('contiguous', 'indexed'):
+            c = u.compress(method)
+            self.assertTrue(c.data.equals(u.data, verbose=3), method)
+            self.assertEqual(c.data.compressed_array.size, 18,
+                             method)
+
+        c = u.compress('contiguous')
+        self.assertEqual(c.data.get_count().data.array.tolist(),
+                         [3, 6, 0, 9])
+
+        cfdm.write(c, tmpfile)
+        g = cfdm.read(tmpfile)[0]
+        self.assertTrue(g.data.equals(u.data, verbose=3))
+
+        c = u.compress('indexed')
+        self.assertEqual(c.data.get_index().data.array.tolist(),
+                         [0] * 3 + [1] * 6 + [3] * 9)
+
+    def test_Field_compress_gathered(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for f in cfdm.read(self.gathered):
+            axes = f.data.get_compressed_axes()
+
+            u = f.uncompress()
+            c = u.compress('gathered', axes=axes)
+            self.assertEqual(c.data.get_compression_type(), 'gathered')
+            self.assertEqual(c.data.get_compressed_axes(), axes)
+            self.assertTrue((c.data.get_list().data.array ==
+                             f.data.get_list().data.array).all())
+
+            # Compression makes the metadata constructs' axes have the
+            # same relative order as the field's data axes
+            u.transpose(range(u.data.ndim), constructs=True, inplace=True)
+            self.assertTrue(c.equals(u, verbose=3))
+
+            cfdm.write(c, tmpfile)
+            g = cfdm.read(tmpfile)[0]
+            self.assertEqual(g.data.get_compression_type(), 'gathered')
+            self.assertTrue(g.equals(u, verbose=3))
+
+        # Land points
+        f = cfdm.example_field(1)
+        mask = numpy.zeros(f.data.shape, dtype=bool)
+        mask[:, 3:7, :4] = True
+        f.data[...] = numpy.ma.array(f.data.array, mask=mask)
+
+        key = f.construct_key('air_temperature standard_error')
+        a = f.constructs[key]
+        a.data[...] = numpy.ma.array(a.data.array, mask=mask[0])
+
+        c = f.compress('gathered', axes=[1, 2],
+                       list_properties={'long_name': 'land points'})
+        self.assertEqual(c.data.compressed_array.shape, (1, 74))
+        self.assertEqual(c.data.get_list().get_property('long_name'),
+                         'land points')
+        self.assertEqual(c.data.get_list().data.size, 74)
+
+        # Only the field ancillary construct has no non-missing data
+        # at the removed points
+        for key, x in c.constructs.filter_by_data().items():
+            self.assertEqual(x.data.get_compression_type() == 'gathered',
+                             x.construct_type == 'field_ancillary', key)
+
+        f.transpose(range(f.data.ndim), constructs=True, inplace=True)
+        self.assertTrue(c.equals(f, verbose=3))
+
+        cfdm.write(c, tmpfile)
+        g = cfdm.read(tmpfile)[0]
+        self.assertEqual(g.data.get_compression_type(), 'gathered')
+        self.assertTrue(g.equals(f, verbose=3))
+
+        with self.assertRaises(ValueError):
+            f.compress('gathered')
+
+        with self.assertRaises(ValueError):
+            f.compress('gathered', axes=[0, 2])
+
+        with self.assertRaises(ValueError):
+            f.compress('indexed', axes=[0, 1])
+
     def test_Field_creation_commands(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -26,6 +26,64 @@ class NumpyArrayTest(unittest.TestCase):
         self.assertTrue((x.array == a).all())
         self.assertTrue((x.array == y.array).all())
 
+    def test_NumpyArray_copy_on_write(self):
+        a = numpy.array([1, 2, 3, 4])
+
+        x = cfdm.NumpyArray(a.copy(), _owned=True)
+        self.assertFalse(x._is_shared())
+
+        y = x.copy()
+        self.assertTrue(x._is_shared())
+        self.assertTrue(y._is_shared())
+        self.assertIs(x._get_component('array'),
+                      y._get_component('array'))
+
+        y._unshare()
+        self.assertFalse(x._is_shared())
+        self.assertFalse(y._is_shared())
+        self.assertFalse(numpy.shares_memory(x._get_component('array'),
+                                             y._get_component('array')))
+
+        y._get_component('array')[0] = -1
+        self.assertTrue((x.array == a).all())
+        self.assertEqual(y.array.tolist(), [-1, 2, 3, 4])
+
+        # Unsharing an unshared array does not copy it
+        b = x._get_component('array')
+        x._unshare()
+        self.assertIs(x._get_component('array'), b)
+
+        z = copy.deepcopy(x)
+        self.assertTrue(z._is_shared())
+        x._set_component('foo', 'bar')
+        self.assertFalse(z._has_component('foo'))
+
+        # A discarded copy no longer shares the numpy array
+        del z
+        self.assertFalse(x._is_shared())
+        x._unshare()
+        self.assertIs(x._get_component('array'), b)
+
+    def test_NumpyArray_not_owned(self):
+        # A numpy array given at initialisation may be modified
+        # elsewhere, so it is not shared with copies
+        a = numpy.array([1, 2, 3, 4])
+
+        x = cfdm.NumpyArray(a)
+        self.assertTrue(x._is_shared())
+
+        y = x.copy()
+        self.assertFalse(y._is_shared())
+        self.assertFalse(numpy.shares_memory(y._get_component('array'), a))
+
+        a[0] = -1
+        self.assertEqual(y.array.tolist(), [1, 2, 3, 4])
+
+        # Unsharing copies the numpy array
+        x._unshare()
+        self.assertFalse(x._is_shared())
+        self.assertFalse(numpy.shares_memory(x._get_component('array'), a))
+
     def test_NumpyArray__array__(self):
         a = numpy.array([1, 2, 3, 4])
 
@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+import numpy
+
 import cfdm
 
 
@@ -30,6 +32,45 @@ class RaggedContiguousArrayTest(unittest.TestCase):
         r._del_component('count_variable')
         self.assertIsNone(r.get_count(None))
 
+    def test_RaggedContiguousArray_cache(self):
+        r = self.r
+
+        expected = numpy.ma.masked_values([[280.0, -99, -99],
+                                           [281.0, 279.0, 278.0]], -99)
+
+        a = r[...]
+        self.assertTrue((a.mask == expected.mask).all())
+        self.assertTrue((a == expected).all())
+
+        # The arrays derived from the count variable are cached and
+        # read-only
+        cache = r._ancillary_cache
+        count_array, start_array = cache['count']
+        self.assertEqual(count_array.tolist(), [1, 3])
+        self.assertEqual(start_array.tolist(), [0, 1])
+        self.assertFalse(count_array.flags.writeable)
+        self.assertFalse(start_array.flags.writeable)
+
+        # Subsequent subspaces use the cached arrays
+        r._count_arrays = None
+        a = r[1:, 1:]
+        self.assertTrue((a == expected[1:, 1:]).all())
+        del r._count_arrays
+
+        # Copies share the cache
+        c = r.copy()
+        self.assertIs(c._ancillary_cache, cache)
+
+        # Setting the compressed array invalidates the cache, but
+        # not that of copies
+        r._set_compressed_Array(r._get_compressed_Array())
+        self.assertEqual(r._ancillary_cache, {})
+        self.assertIn('count', c._ancillary_cache)
+
+        a = r[...]
+        self.assertTrue((a == expected).all())
+        self.assertIn('count', r._ancillary_cache)
+
 # --- End: class
 
 
@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+import numpy
+
 import cfdm
 
 
@@ -30,6 +32,37 @@ class RaggedIndexedArrayTest(unittest.TestCase):
         r._del_component('index_variable')
         self.assertIsNone(r.get_index(None))
 
+    def test_RaggedIndexedArray__getitem__(self):
+        # Elements of the three instances are interleaved in the
+        # sample dimension, and instance 2 has no elements
+        compressed_data = cfdm.Data(
+            [280.0, 281.0, 279.0, 278.0, 279.5, 281.0, 282.0])
+
+        index = cfdm.Index(data=[1, 0, 3, 1, 1, 0, 3])
+
+        r = cfdm.RaggedIndexedArray(compressed_data, shape=(4, 3),
+                                    size=12, ndim=2,
+                                    index_variable=index)
+
+        expected = numpy.ma.masked_values(
+            [[281.0, 281.0, -99],
+             [280.0, 278.0, 279.5],
+             [-99, -99, -99],
+             [279.0, 282.0, -99]], -99)
+
+        a = r[...]
+        self.assertTrue((a.mask == expected.mask).all())
+        self.assertTrue((a == expected).all())
+
+        for indices in ((slice(1, 4), slice(1, 3)),
+                        ([3, 0], [2, 0]),
+                        ([2], slice(None))):
+            a = r[indices]
+            e = expected[numpy.ix_(numpy.arange(4)[indices[0]],
+                                   numpy.arange(3)[indices[1]])]
+            self.assertTrue((a.mask == e.mask).all())
+            self.assertTrue((a.filled(-99) == e.filled(-99)).all())
+
 # --- End: class
 
 
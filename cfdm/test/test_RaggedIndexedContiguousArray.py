@@ -1,6 +1,8 @@
 import datetime
 import unittest
 
+import numpy
+
 import cfdm
 
 
@@ -32,6 +34,36 @@ class RaggedIndexedContiguousArrayTest(unittest.TestCase):
 
         r.to_memory()
 
+    def test_RaggedIndexedContiguousArray__getitem__(self):
+        # Profiles for the two instances are interleaved in the
+        # sample dimension
+        compressed_data = cfdm.Data(
+            [280.0, 281.0, 279.0, 278.0, 279.5,
+             281.0, 282.0, 278.0, 279.0, 277.5])
+
+        index = cfdm.Index(data=[1, 0, 1, 0])
+        count = cfdm.Count(data=[1, 3, 2, 4])
+
+        r = cfdm.RaggedIndexedContiguousArray(compressed_data,
+                                              shape=(2, 2, 4),
+                                              size=16, ndim=3,
+                                              index_variable=index,
+                                              count_variable=count)
+
+        expected = numpy.ma.masked_values(
+            [[[281.0, 279.0, 278.0, -99],
+              [282.0, 278.0, 279.0, 277.5]],
+             [[280.0, -99, -99, -99],
+              [279.5, 281.0, -99, -99]]], -99)
+
+        a = r[...]
+        self.assertTrue((a.mask == expected.mask).all())
+        self.assertTrue((a == expected).all())
+
+        a = r[[1], :, 1:3]
+        self.assertTrue((a.mask == expected[[1], :, 1:3].mask).all())
+        self.assertTrue((a == expected[[1], :, 1:3]).all())
+
 # --- End: class
 
 
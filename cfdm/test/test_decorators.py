@@ -1,5 +1,6 @@
 import copy
 import datetime
+import threading
 import unittest
 
 import cfdm
@@ -200,6 +201,10 @@ class DecoratorsTest(unittest.TestCase):
                     for msg in log_message:  # nothing else should be logged
                         self.assertNotIn(msg, catch.output)
 
+                # The verbose argument does not change the global
+                # log_level, so re-enable logging for the next message
+                cfdm.log_level(level)
+
             # verbose=False should be equivalent in behaviour to verbose=0
             with self.assertLogs(level='NOTSET') as catch:
                 logger.info("Purely to keep 'assertLog' happy: see previous!")
@@ -207,6 +212,54 @@ class DecoratorsTest(unittest.TestCase):
                 for msg in log_message:  # nothing else should be logged
                     self.assertNotIn(msg, catch.output)
 
+    def test_manage_log_level_via_verbosity_threads(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        test_class = dummyClass()
+
+        # The levels of the messages that should be logged for each
+        # verbosity
+        expected = {
+            0: set(),
+            1: {'WARNING'},
+            2: {'WARNING', 'INFO'},
+            3: {'WARNING', 'INFO', 'DETAIL'},
+            -1: {'WARNING', 'INFO', 'DETAIL', 'DEBUG'},
+        }
+
+        verbosities = list(expected) * 4
+        n_calls = 50
+        barrier = threading.Barrier(len(verbosities))
+
+        def run(verbose):
+            barrier.wait()
+            for i in range(n_calls):
+                test_class.decorated_logging_func(verbose=verbose)
+
+        threads = [threading.Thread(target=run, args=(verbose,),
+                                    name='verbose_{}'.format(i))
+                   for i, verbose in enumerate(verbosities)]
+
+        cfdm.log_level('WARNING')
+        with self.assertLogs(level='WARNING') as catch:
+            for thread in threads:
+                thread.start()
+
+            for thread in threads:
+                thread.join()
+        # --- End: with
+
+        # Each thread's messages were filtered by its own verbosity
+        for thread, verbose in zip(threads, verbosities):
+            levels = [record.levelname for record in catch.records
+                      if record.threadName == thread.name]
+            self.assertEqual(set(levels), expected[verbose])
+            self.assertEqual(len(levels), n_calls * len(expected[verbose]))
+
+        # The global log level is unchanged
+        self.assertEqual(cfdm.log_level().value, 'WARNING')
+
     @patch('builtins.print')
     def test_display_or_return(self, mock_print):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
@@ -1,5 +1,6 @@
 import datetime
 import inspect
+import re
 import unittest
 
 import cfdm
@@ -252,6 +253,27 @@ class DocstringTest(unittest.TestCase):
                 self.assertIsInstance(d, dict)
                 self.assertIn('{{repr}}', d)
 
+    def test_docstring_resolve(self):
+        meta = cfdm.core.meta.DocstringRewriteMeta
+
+        config = {
+            '{{c}}': 'C',
+            '{{a}}': 'A{{b}}',
+            '{{b}}': 'B{{c}}',
+            re.compile('x+'): 'y',
+        }
+
+        # Embedded substitutions are replaced in one pass, in order
+        resolved = meta._docstring_resolve(config)
+        self.assertEqual(resolved['{{a}}'], 'AB{{c}}')
+        self.assertEqual(resolved['{{b}}'], 'BC')
+        self.assertEqual(resolved['{{c}}'], 'C')
+
+        doc = meta._docstring_update(
+            'pkg', 'Klass', None, None, resolved,
+            class_docstring='{{a}} {{b}} xxx {{package}}.{{class}}')
+        self.assertEqual(doc, 'AB{{c}} BC y pkg.Klass')
+
 # --- End: class
 
 
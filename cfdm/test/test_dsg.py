@@ -360,6 +360,26 @@ class DSGTest(unittest.TestCase):
         for i in range(len(f)):
             self.assertTrue(g[i].equals(f[i], verbose=3))
 
+    def test_DSG_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        for f in (self.c, self.i, self.ic):
+            q = [g for g in f
+                 if g.get_property('standard_name') ==
+                 'specific_humidity'][0]
+
+            a = q.data.array
+            ndim = a.ndim
+            for indices in ([slice(1, 2)] + [slice(None)] * (ndim - 1),
+                            [[2, 0]] + [slice(None, None, -1)] * (ndim - 1),
+                            [slice(0, 3, 2)] + [[3, 1]] * (ndim - 1)):
+                b = cfdm.NumpyArray.get_subspace(a, indices)
+                c = q.data._get_Array()[indices]
+                self.assertEqual(c.shape, b.shape)
+                self.assertTrue(q._equals(c, b))
+        # --- End: for
+
     def test_DSG_create_contiguous(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
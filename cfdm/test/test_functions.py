@@ -266,13 +266,15 @@ class FunctionsTest(unittest.TestCase):
         # Test getting of all config. and store original values to test on:
         org = cfdm.configuration()
         self.assertIsInstance(org, dict)
-        self.assertEqual(len(org), 3)
+        self.assertEqual(len(org), 4)
         org_atol = org['atol']
         self.assertIsInstance(org_atol, float)
         org_rtol = org['rtol']
         self.assertIsInstance(org_rtol, float)
         org_ll = org['log_level']  # will be 'DISABLE' as disable for test
         self.assertIsInstance(org_ll, str)
+        org_fps = org['file_pool_size']
+        self.assertIsInstance(org_fps, int)
 
         # Store some sensible values to reset items to for testing,
         # ensure these are kept to be different to the defaults:
@@ -302,6 +304,11 @@ class FunctionsTest(unittest.TestCase):
             post_set['rtol'], atol_rtol_reset_value)  # since changed it above
         self.assertEqual(post_set['log_level'], ll_reset_value)
 
+        cfdm.configuration(file_pool_size=org_fps + 1)
+        post_set = cfdm.configuration()
+        self.assertEqual(post_set['file_pool_size'], org_fps + 1)
+        cfdm.configuration(file_pool_size=org_fps)  # reset to org
+
         # Test the setting of more than one, but not all, items simultaneously:
         new_atol_rtol_reset_value = 5e-18
         new_ll_reset_value = 'DEBUG'
@@ -347,6 +354,8 @@ class FunctionsTest(unittest.TestCase):
             cfdm.configuration(rtol='bad')
         with self.assertRaises(ValueError):
             cfdm.configuration(log_level=7)
+        with self.assertRaises(ValueError):
+            cfdm.configuration(file_pool_size=-1)
 
         # 4. Check invalid kwarg given logic processes **kwargs:
         with self.assertRaises(TypeError):
@@ -401,18 +410,21 @@ class FunctionsTest(unittest.TestCase):
         # Full configuration
         func = cfdm.configuration
 
-        org = func(rtol=10, atol=20, log_level='DETAIL')
+        org = func(rtol=10, atol=20, log_level='DETAIL', file_pool_size=30)
         old = func()
-        new = dict(rtol=10 * 2, atol=20 * 2, log_level='DEBUG')
+        new = dict(rtol=10 * 2, atol=20 * 2, log_level='DEBUG',
+                   file_pool_size=30 * 2)
         with func(**new):
             self.assertEqual(func(), new)
 
         self.assertEqual(func(), old)
         func(**org)
 
-        org = func(rtol=cfdm.Constant(10), atol=20, log_level='DETAIL')
+        org = func(rtol=cfdm.Constant(10), atol=20, log_level='DETAIL',
+                   file_pool_size=30)
         old = func()
-        new = dict(rtol=cfdm.Constant(10 * 2), atol=20 * 2, log_level='DEBUG')
+        new = dict(rtol=cfdm.Constant(10 * 2), atol=20 * 2, log_level='DEBUG',
+                   file_pool_size=cfdm.Constant(30 * 2))
         with func(**new):
             self.assertEqual(func(), new)
 
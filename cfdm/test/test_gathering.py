@@ -3,6 +3,7 @@ import datetime
 import os
 import tempfile
 import unittest
+import warnings
 
 import netCDF4
 import numpy
@@ -161,6 +162,79 @@ class GatheredTest(unittest.TestCase):
         for i in range(len(f)):
             self.assertTrue(g[i].equals(f[i], verbose=3))
 
+    def test_GATHERING_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.gathered, verbose=False)
+
+        for g in f:
+            array = g.data._get_Array()
+            a = array[...]
+            for indices in ([slice(0, 1)] * g.data.ndim,
+                            [slice(None, None, -2)] * g.data.ndim,
+                            [[2, 0, 2]] * g.data.ndim):
+                indices = [i if isinstance(i, slice) else
+                           [x for x in i if x < n]
+                           for i, n in zip(indices, a.shape)]
+                b = cfdm.NumpyArray.get_subspace(a, indices)
+                c = array[indices]
+                self.assertEqual(c.shape, b.shape)
+                self.assertTrue(g._equals(c, b))
+        # --- End: for
+
+    def test_GATHERING_chunks(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # The gathered dimension is the first dimension of the
+        # compressed array
+        compressed_data = cfdm.Data(
+            numpy.arange(8.0).reshape(4, 2))
+        list_variable = cfdm.List(data=cfdm.Data([1, 4, 5, 3]))
+        array = cfdm.GatheredArray(compressed_array=compressed_data,
+                                   shape=(2, 3, 2), size=12, ndim=3,
+                                   compressed_dimension=0,
+                                   list_variable=list_variable)
+
+        expected = numpy.ma.masked_values(
+            [[[-99, -99],
+              [0, 1],
+              [-99, -99]],
+             [[6, 7],
+              [2, 3],
+              [4, 5]]], -99)
+
+        a = array[...]
+        self.assertTrue((a.mask == expected.mask).all())
+        self.assertTrue((a == expected).all())
+
+        # Uncompress one element of the uncompressed dimension at a
+        # time
+        array._chunk_size = 1
+        for indices in (Ellipsis,
+                        [slice(None), slice(None), slice(None, None, -1)],
+                        [[1, 0], slice(0, 2), [1, 0]]):
+            a = array[indices]
+            b = cfdm.NumpyArray.get_subspace(expected, indices)
+            self.assertTrue((a.mask == b.mask).all())
+            self.assertTrue((a == b).all())
+
+        # A subspace with a zero-size dimension
+        with warnings.catch_warnings():
+            warnings.simplefilter('error', RuntimeWarning)
+            a = array[slice(None), slice(None), slice(0, 0)]
+
+        self.assertEqual(a.shape, (2, 3, 0))
+
+        f = cfdm.read(self.gathered, verbose=False)
+        for g in f:
+            array = g.data._get_Array()
+            a = array[...]
+            array._chunk_size = 1
+            self.assertTrue(g._equals(array[...], a))
+        # --- End: for
+
     def test_GATHERING_create(self):
         if self.test_only and inspect.stack()[0][3] not in self.test_only:
             return
@@ -11,10 +11,10 @@ import netCDF4
 import cfdm
 
 
-n_tmpfiles = 1
+n_tmpfiles = 2
 tmpfiles = [tempfile.mkstemp('_test_geometry.nc', dir=os.getcwd())[1]
             for i in range(n_tmpfiles)]
-(tempfile,) = tmpfiles
+(tempfile, tempfile2) = tmpfiles
 
 
 def _remove_tmpfiles():
@@ -303,6 +303,76 @@ class DSGTest(unittest.TestCase):
             pnc.nc_set_dimension('new_dim_name')
             cfdm.write(f, tempfile)
 
+    def test_geometry_part_index(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        part_node_count = [3, 4, 3, 3, 5, 3, 4]
+        node_count = [7, 3, 11, 4]
+        interior_ring = [0, 1, 0, 0, 1, 1, 0]
+
+        nc = netCDF4.Dataset(tempfile2, 'w')
+        nc.Conventions = 'CF-' + VN
+        nc.createDimension('instance', len(node_count))
+        nc.createDimension('part', len(part_node_count))
+        nc.createDimension('node', sum(node_count))
+
+        x = nc.createVariable('x', 'f8', ('node',))
+        x.standard_name = 'longitude'
+        x.units = 'degrees_east'
+        x.axis = 'X'
+        x[...] = numpy.arange(sum(node_count))
+
+        y = nc.createVariable('y', 'f8', ('node',))
+        y.standard_name = 'latitude'
+        y.units = 'degrees_north'
+        y.axis = 'Y'
+        y[...] = -numpy.arange(sum(node_count))
+
+        geometry = nc.createVariable('geometry_container', 'i4', ())
+        geometry.geometry_type = 'polygon'
+        geometry.node_count = 'node_count'
+        geometry.node_coordinates = 'x y'
+        geometry.part_node_count = 'part_node_count'
+        geometry.interior_ring = 'interior_ring'
+
+        v = nc.createVariable('node_count', 'i4', ('instance',))
+        v[...] = node_count
+        v = nc.createVariable('part_node_count', 'i4', ('part',))
+        v[...] = part_node_count
+        v = nc.createVariable('interior_ring', 'i4', ('part',))
+        v[...] = interior_ring
+
+        v = nc.createVariable('pr', 'f8', ('instance',))
+        v.standard_name = 'precipitation_flux'
+        v.units = 'kg m-2 s-1'
+        v.geometry = 'geometry_container'
+        v[...] = numpy.arange(len(node_count))
+        nc.close()
+
+        f = cfdm.read(tempfile2)
+        self.assertEqual(len(f), 1, 'f = '+repr(f))
+        f = f[0]
+
+        c = f.construct('longitude')
+        self.assertEqual(c.bounds.data.get_index().data.array.tolist(),
+                         [0, 0, 1, 2, 2, 2, 3])
+
+        bounds = c.bounds.data.array
+        self.assertEqual(bounds.shape, (4, 3, 5))
+        self.assertEqual(bounds[0, 1, :4].tolist(), [3, 4, 5, 6])
+        self.assertEqual(bounds[1, 0, :3].tolist(), [7, 8, 9])
+        self.assertEqual(bounds[2, 2, :3].tolist(), [18, 19, 20])
+        self.assertEqual(bounds[3, 0, :4].tolist(), [21, 22, 23, 24])
+        self.assertEqual(numpy.ma.count(bounds), sum(node_count))
+
+        self.assertEqual(
+            numpy.ma.filled(c.interior_ring.data.array, -1).tolist(),
+            [[0, 1, -1], [0, -1, -1], [0, 1, 1], [0, -1, -1]])
+
+        cfdm.write(f, tempfile)
+        self.assertTrue(cfdm.read(tempfile)[0].equals(f, verbose=3))
+
 # --- End: class
 
 
@@ -3,10 +3,13 @@ import datetime
 import inspect
 import os
 import platform
+import shutil
 import subprocess
 import tempfile
+import threading
 import unittest
 
+import netCDF4
 import numpy
 
 import cfdm
@@ -465,6 +468,559 @@ class read_writeTest(unittest.TestCase):
 
         cfdm.write(f, tmpfile)
 
+    def test_write_shared_metadata(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(0)
+        time = f.construct('time')
+
+        fields = []
+        for i in range(4):
+            g = f.copy()
+            g.nc_set_variable('q{}'.format(i))
+            if i < 2:
+                # Equal time coordinates in different objects
+                g.construct('time').set_data(time.data.copy())
+            else:
+                g.construct('time').set_data(
+                    cfdm.Data(time.data.array + i))
+
+            fields.append(g)
+
+        cfdm.write(fields, tmpfile)
+
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        n_variables = len(nc.variables)
+        nc.close()
+
+        # Four data variables, one latitude and one longitude with
+        # their bounds, and three time variables
+        self.assertEqual(n_variables, 4 + 4 + 3)
+
+        g = cfdm.read(tmpfile)
+        self.assertEqual(len(g), len(fields))
+        for a in g:
+            b = fields[int(a.nc_get_variable()[1:])]
+            self.assertTrue(a.equals(b, verbose=3))
+
+    def test_write_shared_metadata_tolerance(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(0)
+        g = f.copy()
+        g.nc_set_variable('q1')
+
+        # Latitude coordinates that are equal within the numerical
+        # tolerance, but not identical
+        lat = g.construct('latitude')
+        array = lat.data.array
+        lat.set_data(cfdm.Data(numpy.nextafter(array, array + 1),
+                               units=lat.data.get_units()))
+        self.assertFalse((lat.data.array == array).any())
+
+        eps = numpy.finfo(float).eps
+        with cfdm.configuration(atol=eps, rtol=eps):
+            self.assertTrue(lat.equals(f.construct('latitude'), verbose=3))
+            cfdm.write([f, g], tmpfile)
+
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        ncvars = set(nc.variables)
+        nc.close()
+
+        self.assertIn('lat', ncvars)
+        self.assertIn('lat_bnds', ncvars)
+        self.assertNotIn('lat_1', ncvars)
+        self.assertNotIn('lat_bnds_1', ncvars)
+
+    def test_write_shared_metadata_digest(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.example_field(0)
+        time = f.construct('time')
+
+        n = 20
+        fields = []
+        for i in range(n):
+            g = f.copy()
+            g.nc_set_variable('q{}'.format(i))
+            g.construct('time').set_data(cfdm.Data(time.data.array + i))
+            fields.append(g)
+
+        # Floating point metadata that are not equal are not compared
+        # value by value
+        count = [0]
+        Implementation = type(cfdm.implementation())
+        equal_components = Implementation.equal_components
+
+        def counted_equal_components(self, *args, **kwargs):
+            count[0] += 1
+            return equal_components(self, *args, **kwargs)
+
+        Implementation.equal_components = counted_equal_components
+        try:
+            cfdm.write(fields, tmpfile)
+        finally:
+            Implementation.equal_components = equal_components
+
+        # Each field's latitude, longitude and their bounds match
+        # those of the first field, and its time coordinates match
+        # nothing
+        self.assertLessEqual(count[0], 4 * n)
+
+        nc = netCDF4.Dataset(tmpfile, 'r')
+        n_variables = len(nc.variables)
+        nc.close()
+
+        self.assertEqual(n_variables, n + 4 + n)
+
+    def test_read_vertical_datum(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # A field with a vertical coordinate reference and no grid
+        # mapping
+        a = cfdm.example_field(1)
+        a.nc_set_variable('a')
+        a.del_construct(
+            a.construct_key('grid_mapping_name:rotated_latitude_longitude'))
+        vcr = a.construct('standard_name:atmosphere_hybrid_height_coordinate')
+        vcr.datum.del_parameter('earth_radius')
+
+        # A field with a grid mapping and no vertical coordinate
+        # reference
+        b = cfdm.example_field(1)
+        b.nc_set_variable('b')
+        b.del_construct(
+            b.construct_key('standard_name:atmosphere_hybrid_height_coordinate'))
+        for key in tuple(b.domain_ancillaries):
+            b.del_construct(key)
+
+        z = b.construct('atmosphere_hybrid_height_coordinate')
+        z.data[...] = z.data.array + 1
+        z.bounds.data[...] = z.bounds.data.array + 1
+
+        cfdm.write([a, b], tmpfile)
+
+        # The datum of the grid mapping of one field is not added to
+        # the vertical coordinate reference of the other
+        f = cfdm.read(tmpfile)
+        self.assertEqual(len(f), 2)
+        for g in f:
+            if g.coordinate_references.filter_by_identity(
+                    'grid_mapping_name:rotated_latitude_longitude'):
+                self.assertTrue(g.equals(b, verbose=3))
+            else:
+                self.assertTrue(g.equals(a, verbose=3))
+        # --- End: for
+
+    def test_write_in_memory_data(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        implementation = cfdm.implementation()
+
+        f = cfdm.example_field(0)
+        f.data[1, 1] = cfdm.masked
+        g = f.copy()
+
+        in_memory = f.data._get_Array()._get_component('array')
+
+        # A read-only view of in-memory data
+        array = implementation.get_array(f.data, copy=False)
+        self.assertTrue(numpy.shares_memory(array, in_memory))
+        self.assertFalse(array.flags.writeable)
+        with self.assertRaises(ValueError):
+            array[0, 0] = 0
+
+        # An independent copy
+        array = implementation.get_array(f.data)
+        self.assertFalse(numpy.shares_memory(array, in_memory))
+        self.assertTrue(array.flags.writeable)
+
+        # Writing does not change the field
+        cfdm.write(f, tmpfile)
+        self.assertTrue(f.equals(g, verbose=3))
+
+        h = cfdm.read(tmpfile)
+        self.assertEqual(len(h), 1)
+        self.assertTrue(h[0].equals(f, verbose=3))
+
+    def test_write_data_blocks(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        NetCDFWrite = cfdm.read_write.netcdf.NetCDFWrite
+        write_block_size = NetCDFWrite._write_block_size
+        data_blocks = NetCDFWrite._data_blocks
+
+        shapes = []
+
+        def recorded_data_blocks(self, data, nc_variable):
+            for indices, array in data_blocks(self, data, nc_variable):
+                shapes.append(array.shape)
+                yield indices, array
+
+        f = cfdm.example_field(0)
+        f.data[1, 2] = cfdm.masked
+        cfdm.write(f, tmpfile0)
+        g = cfdm.read(tmpfile0)[0]
+
+        # Write the data in blocks of at most 4 numbers
+        NetCDFWrite._write_block_size = 32
+        NetCDFWrite._data_blocks = recorded_data_blocks
+        try:
+            for fmt in ('NETCDF4', 'NETCDF3_CLASSIC'):
+                for x in (f, g):
+                    shapes[:] = []
+                    cfdm.write(x, tmpfile, fmt=fmt)
+                    self.assertIn((1, 4), shapes)
+                    self.assertTrue(all(numpy.prod(shape) <= 4
+                                        for shape in shapes))
+
+                    h = cfdm.read(tmpfile)
+                    self.assertEqual(len(h), 1)
+                    self.assertTrue(h[0].equals(f, verbose=3))
+            # --- End: for
+
+            f = cfdm.example_field(1)
+            cfdm.write(f, tmpfile)
+            h = cfdm.read(tmpfile)
+            self.assertEqual(len(h), 1)
+            self.assertTrue(h[0].equals(f, verbose=3))
+
+            # Unmasked missing values are found in any block
+            f = cfdm.example_field(0)
+            f.set_property('missing_value', f.data.array[4, 7])
+            with self.assertRaises(ValueError):
+                cfdm.write(f, tmpfile)
+        finally:
+            NetCDFWrite._write_block_size = write_block_size
+            NetCDFWrite._data_blocks = data_blocks
+
+    def test_read_write_lazy_logging(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        netcdfread = cfdm.read_write.netcdf.netcdfread
+        pformat = netcdfread.pformat
+
+        calls = []
+
+        def counted_pformat(*args, **kwargs):
+            calls.append(args)
+            return pformat(*args, **kwargs)
+
+        f = cfdm.example_field(1)
+
+        netcdfread.pformat = counted_pformat
+        try:
+            # Debug messages are not formatted when they would not be
+            # shown
+            for level in ('DISABLE', 'WARNING'):
+                cfdm.log_level(level)
+                cfdm.write(f, tmpfile)
+                cfdm.read(tmpfile)
+                self.assertEqual(calls, [])
+
+            with self.assertLogs('cfdm', level='DEBUG') as logs:
+                g = cfdm.read(tmpfile)
+
+            self.assertTrue(calls)
+            self.assertTrue(any("read_vars['variable_dimensions']" in line
+                                for line in logs.output))
+            self.assertTrue(g[0].equals(f, verbose=3))
+        finally:
+            netcdfread.pformat = pformat
+            cfdm.log_level('DISABLE')
+
+    def test_read_write_threads_verbosity(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        directory = tempfile.mkdtemp(dir=os.getcwd())
+
+        verbosities = [0, 1, -1, None] * 2
+        n_calls = 3
+        barrier = threading.Barrier(len(verbosities))
+        errors = []
+
+        def run(i, verbose):
+            try:
+                f = cfdm.example_field(i % 3)
+                filename = os.path.join(directory, '{}.nc'.format(i))
+                barrier.wait()
+                for n in range(n_calls):
+                    cfdm.write(f, filename, verbose=verbose)
+                    g = cfdm.read(filename, verbose=verbose)
+                    if not (len(g) == 1 and g[0].equals(f)):
+                        errors.append((i, n))
+            except Exception as error:
+                errors.append(error)
+
+        threads = [threading.Thread(target=run, args=(i, verbose),
+                                    name='verbose_{}'.format(i))
+                   for i, verbose in enumerate(verbosities)]
+
+        cfdm.log_level('WARNING')
+        try:
+            with self.assertLogs(level='WARNING') as catch:
+                for thread in threads:
+                    thread.start()
+
+                for thread in threads:
+                    thread.join()
+            # --- End: with
+
+            self.assertEqual(errors, [])
+
+            for thread, verbose in zip(threads, verbosities):
+                levels = set(record.levelname for record in catch.records
+                             if record.threadName == thread.name)
+                if verbose == -1:
+                    self.assertIn('DEBUG', levels)
+                    self.assertIn('INFO', levels)
+                else:
+                    self.assertEqual(levels, set())
+            # --- End: for
+
+            # The global log level is unchanged
+            self.assertEqual(cfdm.log_level().value, 'WARNING')
+        finally:
+            cfdm.log_level('DISABLE')
+            shutil.rmtree(directory)
+
+    def test_write_netcdf_name(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        netcdf = cfdm.read_write.netcdf.NetCDFWrite(cfdm.implementation())
+
+        class Names(set):
+            '''A set that counts the names that it looks up or copies.'''
+            lookups = 0
+
+            def __contains__(self, name):
+                Names.lookups += 1
+                return super().__contains__(name)
+
+            def union(self, *others):
+                Names.lookups += len(self)
+                return Names(super().union(*others))
+
+        def names(n):
+            Names.lookups = 0
+            netcdf.write_vars = {
+                'ncvar_names': Names(['y_1']),
+                'ncdim_to_size': {'x_3': 5},
+                'name_counters': {},
+                'dimensions_with_role': {},
+            }
+            return [netcdf._netcdf_name(base)
+                    for base in ('x', 'y') * n]
+
+        out = names(5)
+        self.assertEqual(out[0::2],
+                         ['x', 'x_1', 'x_2', 'x_4', 'x_5'])
+        self.assertEqual(out[1::2],
+                         ['y', 'y_2', 'y_3', 'y_4', 'y_5'])
+
+        # Naming is linear in the number of names: each new name
+        # checks a bounded number of existing names, rather than
+        # every name previously created with the same base
+        n = 2000
+        names(n)
+        self.assertLess(Names.lookups, 4 * 2 * n)
+
+    def test_read_subspace(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        f = cfdm.read(self.filename)[0]
+        d = f.data
+        a = d.array
+
+        # Chained subspaces are composed without reading the file
+        e = d[0:1, 3:9, 1:8][:, ::-2, [1, 2, 6]][:, [2, 0], 1:]
+        self.assertIsInstance(e._get_Array(), cfdm.NetCDFArray)
+        self.assertEqual(e.shape, (1, 2, 2))
+        b = a[0:1, 3:9, 1:8][:, ::-2][:, :, [1, 2, 6]][:, [2, 0]][..., 1:]
+        self.assertTrue((e.array == b).all())
+
+        # Subspacing a field does not read the file
+        g = f[0, 3:9, [1, 2, 6]][:, ::-2]
+        self.assertIsInstance(g.data._get_Array(), cfdm.NetCDFArray)
+        self.assertTrue((g.data.array == a[0:1, 3:9][:, :, [1, 2, 6]]
+                         [:, ::-2]).all())
+
+        # The length of the strings of a subspace of char and string
+        # data is that of the longest string in the subspace,
+        # however the subspace was composed
+        for f in cfdm.read(self.string_filename):
+            d = f.data
+            if d.ndim != 1:
+                continue
+
+            a = d.array
+            for i in range(d.shape[0]):
+                e = d[:][i]
+                self.assertIsInstance(e._get_Array(), cfdm.NetCDFArray)
+                b = e.array
+                self.assertEqual(b.dtype, d[i].array.dtype)
+                if b.count():
+                    self.assertEqual(b.dtype.itemsize,
+                                     max(len(x) for x in b.compressed()))
+                c = a[i:i + 1]
+                self.assertTrue((b.mask == c.mask).all())
+                self.assertTrue((b.filled(b'') == c.filled(b'')).all())
+        # --- End: for
+
+    def test_read_file_pool(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        from cfdm.netcdffilepool import file_pool
+
+        f = cfdm.example_field(0)
+        cfdm.write(f, tmpfile)
+
+        with cfdm.file_pool_size(4):
+            g = cfdm.read(tmpfile)[0]
+
+            # Repeated reads reuse the same open file
+            nc = g.data.source().open()
+            g.data.source().close()
+            self.assertTrue(nc.isopen())
+            self.assertIs(g.data.source().open(), nc)
+            g.data.source().close()
+
+            a = g[0, 0].data.array
+            self.assertEqual(a.item(), f.data.array[0, 0])
+            self.assertIs(g.data.source().open(), nc)
+            g.data.source().close()
+
+            # Overwriting the file invalidates the pooled file
+            f.data[0, 0] = -999
+            cfdm.write(f, tmpfile)
+            self.assertFalse(nc.isopen())
+
+            h = cfdm.read(tmpfile)[0]
+            self.assertEqual(h.data.array[0, 0], -999)
+            self.assertTrue(h.equals(f))
+
+        # Reducing the pool size closes idle files
+        nc = h.data.source().open()
+        h.data.source().close()
+        with cfdm.file_pool_size(0):
+            self.assertFalse(nc.isopen())
+            self.assertEqual(len(file_pool), 0)
+            self.assertTrue(h.equals(f))
+            self.assertEqual(len(file_pool), 0)
+
+    def test_read_many(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        # Files with the same structure, but different data values
+        filenames = [tmpfile0, tmpfile1, tmpfile]
+        for i, filename in enumerate(filenames):
+            fields = []
+            for n in (0, 1):
+                f = cfdm.example_field(n)
+                f.data[...] = f.data.array + i
+                for c in f.coordinates.values():
+                    if c.data.dtype.kind in 'fi':
+                        c.data[...] = c.data.array + i
+                # --- End: for
+                fields.append(f)
+            # --- End: for
+
+            cfdm.write(fields, filename)
+
+        filenames.insert(2, 'DSG_timeSeries_contiguous.nc')
+
+        expected = [f for filename in filenames
+                    for f in cfdm.read(filename)]
+
+        g = list(cfdm.read_many(filenames))
+
+        self.assertEqual(len(g), len(expected))
+        for x, y in zip(expected, g):
+            self.assertTrue(y.equals(x, verbose=3))
+            self.assertEqual(y.get_filenames(), x.get_filenames())
+            self.assertEqual(y.dataset_compliance(),
+                             x.dataset_compliance())
+        # --- End: for
+
+        self.assertEqual(list(cfdm.read_many([])), [])
+
+    def test_read_cache(self):
+        if self.test_only and inspect.stack()[0][3] not in self.test_only:
+            return
+
+        cache = tempfile.mkdtemp(dir=os.getcwd())
+        try:
+            f = cfdm.example_field(0)
+            cfdm.write(f, tmpfile)
+
+            g = cfdm.read(tmpfile, cache=cache)
+            self.assertEqual(len(os.listdir(cache)), 1)
+
+            h = cfdm.read(tmpfile, cache=cache)
+            self.assertEqual(len(h), len(g))
+            self.assertTrue(h[0].equals(g[0], verbose=3))
+            self.assertEqual(h[0].get_filenames(), g[0].get_filenames())
+            self.assertEqual(h[0].dataset_compliance(),
+                             g[0].dataset_compliance())
+
+            # Different read options have different entries
+            h = cfdm.read(tmpfile, cache=cache,
+                          extra='dimension_coordinate')
+            self.assertEqual(len(h), 4)
+            self.assertEqual(len(os.listdir(cache)), 2)
+
+            # A modified file invalidates its entries
+            f = cfdm.example_field(1)
+            cfdm.write(f, tmpfile)
+            h = cfdm.read(tmpfile, cache=cache)
+            self.assertEqual(len(h), 1)
+            self.assertTrue(h[0].equals(f, verbose=3))
+            self.assertEqual(len(os.listdir(cache)), 2)
+
+            self.assertEqual(cfdm.clear_read_cache(tmpfile, cache=cache), 2)
+            self.assertEqual(cfdm.clear_read_cache(cache=cache), 0)
+            self.assertEqual(os.listdir(cache), [])
+
+            # Files read by relative paths from different working
+            # directories
+            cwd = os.getcwd()
+            directory = tempfile.mkdtemp(dir=cwd)
+            try:
+                for name, n in (('a', 0), ('b', 1)):
+                    os.mkdir(os.path.join(directory, name))
+                    cfdm.write(cfdm.example_field(n),
+                               os.path.join(directory, name, 'x.nc'))
+
+                filename = os.path.join(directory, 'a', 'x.nc')
+                expected = cfdm.read(filename)[0]
+
+                os.chdir(os.path.join(directory, 'a'))
+                g = cfdm.read('x.nc', cache=cache)[0]
+                self.assertEqual(g.get_filenames(), set([filename]))
+
+                os.chdir(os.path.join(directory, 'b'))
+                h = cfdm.read(filename, cache=cache)[0]
+                self.assertEqual(h.get_filenames(), set([filename]))
+                self.assertTrue(h.equals(expected, verbose=3))
+                self.assertTrue((h.data.array == expected.data.array).all())
+            finally:
+                os.chdir(cwd)
+                shutil.rmtree(directory)
+        finally:
+            shutil.rmtree(cache)
+
 # --- End: class
 
 